@@ -11,6 +11,7 @@ import json
 import logging
 import shutil
 import sys
+import time
 from datetime import datetime
 from logging.handlers import RotatingFileHandler
 from pathlib import Path
@@ -54,6 +55,17 @@ def setup_logging(
     )
 
 
+def _non_negative_int(value: str) -> int:
+    """Parse a non-negative integer command-line argument."""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: '{value}'") from None
+    if number < 0:
+        raise argparse.ArgumentTypeError(f"must be non-negative, got {number}")
+    return number
+
+
 def create_parser() -> argparse.ArgumentParser:
     """Create and configure the argument parser."""
     parser = argparse.ArgumentParser(
@@ -131,6 +143,11 @@ Examples:
         default=0.5,
         help="Performance monitoring sampling interval in seconds (default: 0.5)",
     )
+    run_parser.add_argument(
+        "--full-io",
+        action="store_true",
+        help="Write cumulative I/O counters on every metrics sample (debugging)",
+    )
     run_parser.add_argument(
         "--reports-dir",
         type=str,
@@ -241,6 +258,11 @@ Examples:
         default=0.5,
         help="Performance monitoring sampling interval in seconds (default: 0.5)",
     )
+    scenarios_parser.add_argument(
+        "--full-io",
+        action="store_true",
+        help="Write cumulative I/O counters on every metrics sample (debugging)",
+    )
 
     # Validate command
     validate_parser = subparsers.add_parser(
@@ -252,6 +274,12 @@ Examples:
     validate_parser.add_argument(
         "--skip-ecmd", action="store_true", help="Skip ECMD file validation"
     )
+    validate_parser.add_argument(
+        "--ecmd-sample",
+        type=_non_negative_int,
+        metavar="N",
+        help="Only sanity check the first N ECMD data rows (default: all rows)",
+    )
 
     # Status command
     status_parser = subparsers.add_parser(
@@ -282,6 +310,7 @@ def cmd_run(args: argparse.Namespace) -> int:  # noqa: PLR0912, PLR0915
     """
     logging.info("Starting EddyPro batch processing run...")
     start_time = datetime.now()
+    start_ns = time.monotonic_ns()
 
     # Load configuration
     config_path = Path(args.config)
@@ -342,6 +371,8 @@ def cmd_run(args: argparse.Namespace) -> int:  # noqa: PLR0912, PLR0915
         config["max_processes"] = args.max_proc
     if getattr(args, "metrics_interval", None):
         config["metrics_interval_seconds"] = args.metrics_interval
+    if getattr(args, "full_io", False):
+        config["metrics_full_io"] = True
     if getattr(args, "reports_dir", None):
         config["reports_dir"] = args.reports_dir
     if getattr(args, "report_charts", None):
@@ -353,7 +384,10 @@ def cmd_run(args: argparse.Namespace) -> int:  # noqa: PLR0912, PLR0915
     eddypro_exe = Path(config["eddypro_executable"])
     stream_output = config.get("stream_output", True)
     log_eddypro_output = config.get("log_eddypro_output", True)
+    link_binaries = config.get("link_eddypro_binaries", True)
     metrics_interval = config.get("metrics_interval_seconds", 0.5)
+    full_io = config.get("metrics_full_io", False)
+    use_pool = bool(config.get("multiprocessing", False))
     dry_run = args.dry_run
     config["dry_run"] = dry_run  # Store in config for manifest
 
@@ -385,6 +419,8 @@ def cmd_run(args: argparse.Namespace) -> int:  # noqa: PLR0912, PLR0915
     # Process each year
     overall_success = True
     years_processed = []
+    pending_projects: list[tuple[int, Path]] = []
+    project_timestamp = start_time.replace(microsecond=0).isoformat()
 
     def _raise_missing_ecmd(site: str, path: Path | None) -> NoReturn:
         raise ecmd.ECMDError(f"ECMD file not found for site {site}: {path}")
@@ -474,6 +510,7 @@ def cmd_run(args: argparse.Namespace) -> int:  # noqa: PLR0912, PLR0915
                 site_id=site_id,
                 year=year,
                 scenario_suffix="",
+                now=project_timestamp,
             )
 
             ini_tools.write_project_file_with_metadata(
@@ -503,7 +540,10 @@ def cmd_run(args: argparse.Namespace) -> int:  # noqa: PLR0912, PLR0915
             continue
 
         # Execute EddyPro (or skip in dry-run mode)
-        if not dry_run:
+        if not dry_run and use_pool:
+            # Deferred to the lane thread pool once all project files exist
+            pending_projects.append((year, project_file))
+        elif not dry_run:
             success = core.run_eddypro_with_monitoring(
                 project_file=project_file,
                 eddypro_executable=eddypro_exe,
@@ -511,6 +551,8 @@ def cmd_run(args: argparse.Namespace) -> int:  # noqa: PLR0912, PLR0915
                 metrics_interval=metrics_interval,
                 scenario_suffix="",
                 log_output=log_eddypro_output,
+                link_binaries=link_binaries,
+                full_io=full_io,
             )
 
             if not success:
@@ -524,8 +566,30 @@ def cmd_run(args: argparse.Namespace) -> int:  # noqa: PLR0912, PLR0915
             logging.info(f"Dry run: skipped EddyPro execution for year {year}")
             years_processed.append(year)
 
+    if pending_projects:
+        batch_results = core.run_eddypro_batch(
+            [project_file for _, project_file in pending_projects],
+            eddypro_exe,
+            max_processes=config.get("max_processes", 1),
+            stream_output=stream_output,
+            metrics_interval=metrics_interval,
+            log_output=log_eddypro_output,
+            link_binaries=link_binaries,
+            full_io=full_io,
+        )
+        for year, project_file in pending_projects:
+            if batch_results.get(project_file):
+                logging.info(
+                    f"EddyPro processing completed successfully for year {year}"
+                )
+                years_processed.append(year)
+            else:
+                logging.error(f"EddyPro processing failed for year {year}")
+                overall_success = False
+
     end_time = datetime.now()
-    duration = (end_time - start_time).total_seconds()
+    end_ns = time.monotonic_ns()
+    duration = (end_ns - start_ns) / 1e9
 
     # Generate reports
     if years_processed:
@@ -541,6 +605,8 @@ def cmd_run(args: argparse.Namespace) -> int:  # noqa: PLR0912, PLR0915
                 start_time=start_time,
                 end_time=end_time,
                 overall_success=overall_success,
+                start_monotonic_ns=start_ns,
+                end_monotonic_ns=end_ns,
             )
             logging.info("Reports generated successfully")
         except Exception as e:
@@ -629,7 +695,9 @@ def cmd_scenarios(args: argparse.Namespace) -> int:  # noqa: PLR0911
     eddypro_exe = Path(config["eddypro_executable"])
     stream_output = config.get("stream_output", True)
     log_eddypro_output = config.get("log_eddypro_output", True)
+    link_binaries = config.get("link_eddypro_binaries", True)
     metrics_interval = args.metrics_interval
+    full_io = getattr(args, "full_io", False) or config.get("metrics_full_io", False)
 
     if not site_id:
         logging.error("Site ID not provided via CLI or config")
@@ -641,6 +709,7 @@ def cmd_scenarios(args: argparse.Namespace) -> int:  # noqa: PLR0911
 
     # Process each year with all scenarios
     start_time = datetime.now()
+    start_ns = time.monotonic_ns()
     all_scenario_results = []
 
     for year in years:
@@ -703,6 +772,8 @@ def cmd_scenarios(args: argparse.Namespace) -> int:  # noqa: PLR0911
             ecmd_file=ecmd_file_path,
             dry_run=hasattr(args, "dry_run") and args.dry_run,
             log_output=log_eddypro_output,
+            link_binaries=link_binaries,
+            full_io=full_io,
         )
 
         # Collect results for reporting
@@ -714,7 +785,8 @@ def cmd_scenarios(args: argparse.Namespace) -> int:  # noqa: PLR0911
         logging.info(f"Year {year}: {successful} scenarios successful, {failed} failed")
 
     end_time = datetime.now()
-    duration = (end_time - start_time).total_seconds()
+    end_ns = time.monotonic_ns()
+    duration = (end_ns - start_ns) / 1e9
     logging.info(f"Scenario processing completed in {duration:.1f}s")
 
     # Generate reports with actual scenario information
@@ -747,7 +819,7 @@ def cmd_scenarios(args: argparse.Namespace) -> int:  # noqa: PLR0911
                         output_dirs.append(output_dir_path)
 
             # Compute config checksum
-            config_checksum = str(hash(json.dumps(config, sort_keys=True)))
+            config_checksum = report.compute_config_checksum(config)
 
             # Build scenario list for manifest
             manifest_scenarios = []
@@ -776,6 +848,8 @@ def cmd_scenarios(args: argparse.Namespace) -> int:  # noqa: PLR0911
                 end_time=end_time,
                 overall_success=all(r["success"] for r in all_scenario_results),
                 output_dirs=output_dirs,
+                start_monotonic_ns=start_ns,
+                end_monotonic_ns=end_ns,
             )
 
             # Add dry_run flag to config for manifest
@@ -783,7 +857,7 @@ def cmd_scenarios(args: argparse.Namespace) -> int:  # noqa: PLR0911
 
             # Write manifest
             manifest_path = reports_dir / "run_manifest.json"
-            report.write_run_manifest(manifest, manifest_path)
+            report.write_run_manifest(manifest, manifest_path, config)
 
             logging.info("Reports generated successfully")
         except Exception:
@@ -816,7 +890,10 @@ def cmd_validate(args: argparse.Namespace) -> int:
 
     # Run all validations
     results = validation.validate_all(
-        config=config, skip_paths=args.skip_paths, skip_ecmd=args.skip_ecmd
+        config=config,
+        skip_paths=args.skip_paths,
+        skip_ecmd=args.skip_ecmd,
+        ecmd_sample=getattr(args, "ecmd_sample", None),
     )
 
     # Format and display report
@@ -968,10 +1045,19 @@ def cmd_status(args: argparse.Namespace) -> int:
     return 0
 
 
-def main() -> int:
-    """Main CLI entry point."""
+def main(argv: list[str] | None = None) -> int:
+    """Main CLI entry point.
+
+    Args:
+        argv: Command-line arguments without the program name; defaults to
+            ``sys.argv[1:]``. Passing a list lets tests and other Python code
+            run the CLI in-process.
+
+    Returns:
+        Process exit code
+    """
     parser = create_parser()
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     # Set up logging early
     setup_logging(args.log_level)
@@ -5,22 +5,228 @@ Contains the core business logic refactored from the original eddypro_batch_proc
 while preserving existing behavior and outputs.
 """
 
+import atexit
+import functools
 import json
 import logging
-import platform
+import os
 import shutil
-import subprocess
 import sys
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from pathlib import Path
 from typing import Any, NoReturn
 
-import yaml
-
 from . import ecmd, ini_tools, report
 from .monitor import MonitoredOperation
 from .scenarios import Scenario
 
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    orjson = None
+
+_CONFIG_CACHE_SUFFIX = ".cache"
+_CACHE_FORMAT_JSON = b"json\n"
+
+_REQUIRED_CONFIG_KEYS = frozenset(
+    {
+        "eddypro_executable",
+        "site_id",
+        "years_to_process",
+        "input_dir_pattern",
+        "output_dir_pattern",
+        "ecmd_file",
+        "stream_output",
+        "log_level",
+        "multiprocessing",
+        "max_processes",
+        "metrics_interval_seconds",
+        "reports_dir",
+        "report_charts",
+    }
+)
+
+
+def _config_cache_path(config_path: Path) -> Path:
+    """Return the sidecar cache path for a configuration file."""
+    return config_path.with_suffix(config_path.suffix + _CONFIG_CACHE_SUFFIX)
+
+
+def _config_cache_key(stat_result: os.stat_result) -> bytes:
+    """Build the cache header line from a config file's stat result."""
+    return f"{stat_result.st_mtime_ns} {stat_result.st_size}\n".encode("ascii")
+
+
+def _loads_json(payload: bytes) -> Any:
+    """Decode a JSON payload with orjson when available, else the stdlib."""
+    return orjson.loads(payload) if ORJSON_AVAILABLE else json.loads(payload)
+
+
+def _read_config_cache(cache_path: Path, key: bytes) -> dict[str, Any] | None:
+    """Return the cached configuration if the sidecar matches ``key``.
+
+    Only JSON sidecars are read; anything else is treated as a miss so the
+    YAML is parsed again.
+    """
+    try:
+        data = cache_path.read_bytes()
+    except OSError:
+        return None
+    prefix = key + _CACHE_FORMAT_JSON
+    if not data.startswith(prefix):
+        return None
+    try:
+        config = _loads_json(data[len(prefix) :])
+    except ValueError:
+        logging.debug(f"Ignoring unreadable config cache: {cache_path}")
+        return None
+    return config if isinstance(config, dict) else None
+
+
+def _encode_config_cache(config: dict[str, Any]) -> bytes | None:
+    """Serialize a config for the sidecar as JSON.
+
+    Returns ``None`` when the config does not round-trip through JSON exactly
+    (e.g. YAML dates or non-string keys), in which case no sidecar is written.
+    """
+    try:
+        if ORJSON_AVAILABLE:
+            encoded = orjson.dumps(config)
+        else:
+            encoded = json.dumps(config, separators=(",", ":")).encode("utf-8")
+    except (TypeError, ValueError):
+        return None
+    if _loads_json(encoded) != config:
+        return None
+    return _CACHE_FORMAT_JSON + encoded
+
+
+def _write_config_cache(cache_path: Path, key: bytes, config: dict[str, Any]) -> None:
+    """Atomically write the sidecar cache; failures are non-fatal."""
+    payload = _encode_config_cache(config)
+    if payload is None:
+        return
+    tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+    try:
+        tmp_path.write_bytes(key + payload)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        logging.debug(f"Could not write config cache: {cache_path}")
+        tmp_path.unlink(missing_ok=True)
+
+
+@functools.cache
+def _yaml_loader() -> Any:
+    """Return the libyaml ``CSafeLoader`` when available, else ``SafeLoader``.
+
+    PyYAML is imported on first use so commands that never load a config
+    file do not pay for the import.
+    """
+    import yaml  # noqa: PLC0415
+
+    return getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+# OS-specific EddyPro executable names and system flag, resolved once
+_IS_WIN = sys.platform == "win32"
+_RP_NAME = "eddypro_rp.exe" if _IS_WIN else "eddypro_rp"
+_FCC_NAME = "eddypro_fcc.exe" if _IS_WIN else "eddypro_fcc"
+_OS_FLAG = "win" if _IS_WIN else "linux"
+
+# Content tokens of configs that already passed validate_config
+_VALIDATED_TOKENS: set[tuple[Any, ...]] = set()
+_VALIDATED_TOKENS_MAX = 32
+
+
+def _validation_token(config: dict[str, Any]) -> tuple[Any, ...] | None:
+    """Return a hashable token covering everything validate_config checks.
+
+    The token combines the key set with the type and value of each validated
+    setting, so a config that differs in any checked aspect gets a new token.
+    Returns None when a checked value is unhashable.
+    """
+    checked = tuple(
+        (type(value), value)
+        for value in (
+            config.get("max_processes"),
+            config.get("metrics_interval_seconds"),
+            config.get("report_charts", "plotly"),
+        )
+    )
+    token = (frozenset(config), checked)
+    try:
+        hash(token)
+    except TypeError:
+        return None
+    return token
+
+
+# Linux FICLONE ioctl request code (_IOW(0x94, 9, int)) for reflink copies
+_FICLONE = 0x40049409
+
+
+def _link_copy(src: str, dst: str) -> str:
+    """Stage a file by hard link, reflink, or plain copy (in that order).
+
+    Used as the ``copy_function`` for ``shutil.copytree`` when staging the
+    EddyPro binaries, so unchanged executables are linked rather than copied
+    byte-for-byte. Removing the staged tree only drops the links; the
+    original installation is untouched.
+
+    Args:
+        src: Source file path
+        dst: Destination file path
+
+    Returns:
+        The destination path, as expected by ``shutil.copytree``
+    """
+    # A link left behind by an interrupted run aliases the source; opening it
+    # for writing would truncate the original binary, so never touch it
+    if os.path.lexists(dst):
+        if os.path.samefile(src, dst):
+            return dst
+        os.unlink(dst)
+
+    try:
+        os.link(src, dst)
+    except OSError:
+        pass
+    else:
+        return dst
+
+    if sys.platform.startswith("linux"):
+        import fcntl  # noqa: PLC0415 - POSIX-only module
+
+        try:
+            with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+                fcntl.ioctl(fdst.fileno(), _FICLONE, fsrc.fileno())
+            shutil.copystat(src, dst)
+        except OSError:
+            Path(dst).unlink(missing_ok=True)
+        else:
+            return dst
+
+    return shutil.copy2(src, dst)
+
+
+# Staged bin/ folders kept for reuse, keyed by (binary source dir, bin_dir)
+_BIN_CACHE: dict[tuple[Path, Path], bool] = {}
+
+
+def _cleanup_bin_cache() -> None:
+    """Remove staged bin/ folders kept alive for reuse across runs."""
+    for _, bin_dir in list(_BIN_CACHE):
+        shutil.rmtree(bin_dir, ignore_errors=True)
+    _BIN_CACHE.clear()
+
+
+atexit.register(_cleanup_bin_cache)
+
 
 def _raise_missing_ecmd(site_id: str, path: Path | None) -> NoReturn:
     raise ecmd.ECMDError(  # noqa: TRY301 - centralized error helper
@@ -44,6 +250,12 @@ class EddyProBatchProcessor:
         or contains invalid YAML syntax by logging appropriate error messages
         and exiting the script.
 
+        Parsed results are cached in a ``<config>.cache`` sidecar keyed on the
+        file's modification time and size, so unchanged configs are reloaded
+        without re-parsing the YAML. The sidecar is JSON (via ``orjson`` when
+        installed) and is only written when the config round-trips through it
+        exactly; other configs are parsed from YAML on every load.
+
         Args:
             config_path: The file system path to the YAML configuration file.
 
@@ -58,14 +270,19 @@ class EddyProBatchProcessor:
         if config_path:
             self.config_path = config_path
 
+        import yaml  # noqa: PLC0415 - deferred until a config is loaded
+
         try:
-            with self.config_path.open("r") as file:
-                config: dict[str, Any] = yaml.safe_load(file)
-                logging.info(
-                    f"Configuration loaded successfully from {self.config_path}"
+            cache_key = _config_cache_key(self.config_path.stat())
+            cache_path = _config_cache_path(self.config_path)
+            config = _read_config_cache(cache_path, cache_key)
+            if config is None:
+                loaded: dict[str, Any] = yaml.load(  # nosec B506
+                    self.config_path.read_bytes(), Loader=_yaml_loader()
                 )
-                self.config = config
-                return config
+                if isinstance(loaded, dict):
+                    _write_config_cache(cache_path, cache_key, loaded)
+                config = loaded
         except FileNotFoundError:
             logging.exception(f"Configuration file not found: {self.config_path}")
             sys.exit(1)
@@ -73,6 +290,10 @@ class EddyProBatchProcessor:
             logging.exception("Error parsing the configuration file")
             sys.exit(1)
 
+        logging.info(f"Configuration loaded successfully from {self.config_path}")
+        self.config = config
+        return config
+
     def validate_config(self, config: dict[str, Any] | None = None) -> None:
         """
         Validate the essential configuration parameters.
@@ -86,25 +307,15 @@ class EddyProBatchProcessor:
         if config is None:
             config = self.config
 
-        required_keys = [
-            "eddypro_executable",
-            "site_id",
-            "years_to_process",
-            "input_dir_pattern",
-            "output_dir_pattern",
-            "ecmd_file",
-            "stream_output",
-            "log_level",
-            "multiprocessing",
-            "max_processes",
-            "metrics_interval_seconds",
-            "reports_dir",
-            "report_charts",
-        ]
-        missing_keys = [key for key in required_keys if key not in config]
+        token = _validation_token(config)
+        if token is not None and token in _VALIDATED_TOKENS:
+            logging.debug("Configuration already validated; skipping checks")
+            return
+
+        missing_keys = _REQUIRED_CONFIG_KEYS - config.keys()
         if missing_keys:
             logging.error(
-                f"Missing configuration parameters: {', '.join(missing_keys)}"
+                f"Missing configuration parameters: {', '.join(sorted(missing_keys))}"
             )
             sys.exit(1)
 
@@ -133,17 +344,54 @@ class EddyProBatchProcessor:
             )
             sys.exit(1)
 
+        if token is not None:
+            if len(_VALIDATED_TOKENS) >= _VALIDATED_TOKENS_MAX:
+                _VALIDATED_TOKENS.clear()
+            _VALIDATED_TOKENS.add(token)
         logging.info("Configuration validation passed.")
 
 
+_STREAM_CHUNK_SIZE = 64 * 1024
+
+
+def _stream_process_output(fd: int, output_logger: logging.Logger | None) -> None:
+    """Pass subprocess output through to stdout in large raw chunks.
+
+    Reads up to 64 KiB at a time straight from the pipe and writes the bytes
+    to ``sys.stdout.buffer`` without decoding. Complete lines are decoded
+    only when they also need to go to ``output_logger``.
+
+    Args:
+        fd: File descriptor of the subprocess stdout pipe
+        output_logger: Logger for EddyPro output lines, or None to skip logging
+    """
+    out = getattr(sys.stdout, "buffer", None)
+    sys.stdout.flush()
+    pending = b""
+    while chunk := os.read(fd, _STREAM_CHUNK_SIZE):
+        if out is not None:
+            out.write(chunk)
+            out.flush()
+        else:
+            sys.stdout.write(chunk.decode(errors="replace"))
+        if output_logger is not None:
+            *lines, pending = (pending + chunk).split(b"\n")
+            for line in lines:
+                output_logger.info(line.rstrip(b"\r").decode(errors="replace"))
+    if output_logger is not None and pending:
+        output_logger.info(pending.rstrip(b"\r").decode(errors="replace"))
+
+
 def run_subprocess_with_monitoring(
-    command: str,
+    command: list[str],
     working_dir: Path,
     stream_output: bool = True,
     metrics_interval: float = 0.5,
     output_dir: Path | None = None,
     scenario_suffix: str = "",
     log_output: bool = True,
+    *,
+    full_io: bool = False,
 ) -> int:
     """
     Execute a subprocess command with performance monitoring.
@@ -152,16 +400,19 @@ def run_subprocess_with_monitoring(
     and monitors performance metrics during execution.
 
     Args:
-        command: The command line string to execute
+        command: The program and its arguments, executed without a shell
         working_dir: Directory to execute the command in
         stream_output: Whether to stream output in real-time
         metrics_interval: Sampling interval for performance monitoring
         output_dir: Directory to write metrics files (defaults to working_dir)
         scenario_suffix: Suffix for metrics files in scenario runs
+        full_io: Write cumulative I/O counters on every metrics sample
 
     Returns:
         Subprocess return code, or -1 if an exception occurs
     """
+    import subprocess  # noqa: PLC0415 - only needed when running EddyPro
+
     metrics_output_dir = output_dir or working_dir
     output_logger = logging.getLogger("eddypro_batch_processor.eddypro")
 
@@ -170,14 +421,16 @@ def run_subprocess_with_monitoring(
             interval_seconds=metrics_interval,
             output_dir=metrics_output_dir,
             scenario_suffix=scenario_suffix,
+            full_io=full_io,
+            shared=True,
         ) as monitor:
             # Start the subprocess
-            process = subprocess.Popen(  # nosec B602
+            process = subprocess.Popen(  # nosec B603
                 command,
-                shell=True,
+                shell=False,
                 stdout=subprocess.PIPE,
                 stderr=subprocess.STDOUT,
-                text=True,
+                bufsize=0,
                 cwd=working_dir,
             )
 
@@ -189,15 +442,16 @@ def run_subprocess_with_monitoring(
 
             # Handle output streaming
             if stream_output and process.stdout:
-                for line in process.stdout:
-                    print(line, end="")
-                    if log_output:
-                        output_logger.info(line.rstrip("\n"))
+                _stream_process_output(
+                    process.stdout.fileno(),
+                    output_logger if log_output else None,
+                )
                 process.wait()
             else:
                 stdout_data, _ = process.communicate()
                 if log_output and stdout_data:
-                    for line in stdout_data.splitlines():
+                    text = stdout_data.decode(errors="replace")
+                    for line in text.splitlines():
                         output_logger.info(line)
 
             return_code = process.returncode
@@ -205,112 +459,116 @@ def run_subprocess_with_monitoring(
             return return_code
 
     except Exception:
-        logging.exception(f"Failed to execute command '{command}'")
+        logging.exception(
+            f"Failed to execute command '{subprocess.list2cmdline(command)}'"
+        )
         return -1
 
 
-def run_eddypro_with_monitoring(
+def _prepare_eddypro_run(
     project_file: Path,
     eddypro_executable: Path,
-    stream_output: bool = True,
-    metrics_interval: float = 0.5,
-    scenario_suffix: str = "",
-    log_output: bool = True,
-) -> bool:
-    """
-    Run EddyPro processing with performance monitoring.
-
-    Args:
-        project_file: Path to the EddyPro project file
-        eddypro_executable: Path to the EddyPro executable
-        stream_output: Whether to stream subprocess output
-        metrics_interval: Performance monitoring sampling interval
-        scenario_suffix: Suffix for scenario-specific metrics files
+    *,
+    link_binaries: bool,
+    reuse_bin_dir: bool,
+) -> tuple[list[str], list[str]] | None:
+    """Stage binaries and build the rp/fcc commands for one project.
 
     Returns:
-        True if both eddypro_rp and eddypro_fcc succeed, False otherwise
+        The ``(rp_command, fcc_command)`` argv lists, or None if the binaries
+        could not be staged
     """
-    output_dir = project_file.parent
-    eddypro_path = output_dir.parent
+    eddypro_path = project_file.parent.parent
     tmp_dir = eddypro_path / "tmp"
     bin_dir = eddypro_path / "bin"
 
     # Create temporary directories
     tmp_dir.mkdir(exist_ok=True)
-    bin_dir.mkdir(exist_ok=True)
-    logging.debug(f"Created temporary directories: {tmp_dir}, {bin_dir}")
-
-    # Copy EddyPro binaries
-    try:
-        shutil.copytree(eddypro_executable.parent, bin_dir, dirs_exist_ok=True)
-        logging.info(f"Copied EddyPro binaries to {bin_dir}")
-    except Exception:
-        logging.exception("Failed to copy EddyPro binaries")
-        return False
+    logging.debug(f"Created temporary directory: {tmp_dir}")
+
+    # Stage EddyPro binaries (once per bin_dir when reusing)
+    cache_key = (eddypro_executable.parent, bin_dir)
+    if not (reuse_bin_dir and cache_key in _BIN_CACHE and bin_dir.is_dir()):
+        # A bin/ not staged by this process is left over from an interrupted
+        # run (atexit cleanup is skipped on SIGTERM/SIGKILL); start afresh.
+        # Removing it only drops the links, never the original binaries.
+        if bin_dir.exists():
+            logging.debug(f"Removing stale EddyPro binaries in {bin_dir}")
+            shutil.rmtree(bin_dir, ignore_errors=True)
+        try:
+            shutil.copytree(
+                eddypro_executable.parent,
+                bin_dir,
+                dirs_exist_ok=True,
+                copy_function=_link_copy if link_binaries else shutil.copy2,
+            )
+            logging.info(f"Staged EddyPro binaries in {bin_dir}")
+        except Exception:
+            logging.exception("Failed to copy EddyPro binaries")
+            return None
+        if reuse_bin_dir:
+            _BIN_CACHE[cache_key] = True
+    else:
+        logging.debug(f"Reusing staged EddyPro binaries in {bin_dir}")
 
-    # Determine OS-specific executable names
-    rp_executable = bin_dir / (
-        "eddypro_rp.exe" if platform.system() == "Windows" else "eddypro_rp"
-    )
-    fcc_executable = bin_dir / (
-        "eddypro_fcc.exe" if platform.system() == "Windows" else "eddypro_fcc"
-    )
+    rp_executable = bin_dir / _RP_NAME
+    fcc_executable = bin_dir / _FCC_NAME
 
     # Verify executables exist
     if not rp_executable.exists():
         logging.error(f"EddyPro rp executable not found: {rp_executable}")
-        return False
+        return None
     if not fcc_executable.exists():
         logging.error(f"EddyPro fcc executable not found: {fcc_executable}")
-        return False
+        return None
 
     # Construct commands
-    os_suffix = "win" if platform.system() == "Windows" else "linux"
-    command_sys = f" -s {os_suffix} "
-    rp_command = f'"{rp_executable}"{command_sys}"{project_file}"'
-    fcc_command = f'"{fcc_executable}"{command_sys}"{project_file}"'
-
-    success = True
-
-    # Run eddypro_rp with monitoring
-    logging.info("Starting eddypro_rp with performance monitoring...")
-    rp_return_code = run_subprocess_with_monitoring(
-        command=rp_command,
-        working_dir=eddypro_path,
+    rp_command = [str(rp_executable), "-s", _OS_FLAG, str(project_file)]
+    fcc_command = [str(fcc_executable), "-s", _OS_FLAG, str(project_file)]
+    return rp_command, fcc_command
+
+
+def _run_eddypro_stage(
+    stage: str,
+    command: list[str],
+    project_file: Path,
+    *,
+    stream_output: bool,
+    metrics_interval: float,
+    scenario_suffix: str,
+    log_output: bool,
+    full_io: bool = False,
+) -> bool:
+    """Run one EddyPro stage (``rp`` or ``fcc``) for a project."""
+    logging.info(f"Starting eddypro_{stage} with performance monitoring...")
+    return_code = run_subprocess_with_monitoring(
+        command=command,
+        working_dir=project_file.parent.parent,
         stream_output=stream_output,
         metrics_interval=metrics_interval,
-        output_dir=output_dir,
-        scenario_suffix=f"{scenario_suffix}_rp" if scenario_suffix else "rp",
+        output_dir=project_file.parent,
+        scenario_suffix=f"{scenario_suffix}_{stage}" if scenario_suffix else stage,
         log_output=log_output,
+        full_io=full_io,
     )
-    if rp_return_code != 0:
-        logging.error(f"eddypro_rp failed with return code {rp_return_code}")
-        success = False
+    if return_code != 0:
+        logging.error(f"eddypro_{stage} failed with return code {return_code}")
+        return False
+    return True
 
-    if success:
-        # Run eddypro_fcc with monitoring
-        logging.info("Starting eddypro_fcc with performance monitoring...")
-        fcc_return_code = run_subprocess_with_monitoring(
-            command=fcc_command,
-            working_dir=eddypro_path,
-            stream_output=stream_output,
-            metrics_interval=metrics_interval,
-            output_dir=output_dir,
-            scenario_suffix=f"{scenario_suffix}_fcc" if scenario_suffix else "fcc",
-            log_output=log_output,
-        )
-        if fcc_return_code != 0:
-            logging.error(f"eddypro_fcc failed with return code {fcc_return_code}")
-            success = False
 
-    # Clean up temporary directories
+def _cleanup_eddypro_run(eddypro_path: Path, *, reuse_bin_dir: bool) -> None:
+    """Remove the per-run ``tmp/`` folder (and ``bin/`` unless reused)."""
     try:
-        shutil.rmtree(bin_dir)
-        shutil.rmtree(tmp_dir)
+        if not reuse_bin_dir:
+            shutil.rmtree(eddypro_path / "bin")
+        shutil.rmtree(eddypro_path / "tmp")
         logging.debug("Cleaned up temporary directories")
     except Exception as e:
         logging.warning(f"Failed to clean up temporary directories: {e}")
 
+
+def _log_eddypro_result(success: bool, output_dir: Path) -> None:
     if success:
         logging.info(
             f"EddyPro processing completed successfully. Results in {output_dir}"
@@ -318,9 +576,180 @@ def run_eddypro_with_monitoring(
     else:
         logging.error("EddyPro processing failed")
 
+
+def run_eddypro_with_monitoring(
+    project_file: Path,
+    eddypro_executable: Path,
+    stream_output: bool = True,
+    metrics_interval: float = 0.5,
+    scenario_suffix: str = "",
+    log_output: bool = True,
+    *,
+    link_binaries: bool = True,
+    reuse_bin_dir: bool = True,
+    full_io: bool = False,
+) -> bool:
+    """
+    Run EddyPro processing with performance monitoring.
+
+    Args:
+        project_file: Path to the EddyPro project file
+        eddypro_executable: Path to the EddyPro executable
+        stream_output: Whether to stream subprocess output
+        metrics_interval: Performance monitoring sampling interval
+        scenario_suffix: Suffix for scenario-specific metrics files
+        link_binaries: Stage binaries via hard links/reflinks where the
+            filesystem supports it instead of copying them
+        reuse_bin_dir: Keep the staged ``bin/`` folder for later runs that
+            share it; it is removed at interpreter exit instead of per run
+        full_io: Write cumulative I/O counters on every metrics sample
+
+    Returns:
+        True if both eddypro_rp and eddypro_fcc succeed, False otherwise
+    """
+    commands = _prepare_eddypro_run(
+        project_file,
+        eddypro_executable,
+        link_binaries=link_binaries,
+        reuse_bin_dir=reuse_bin_dir,
+    )
+    if commands is None:
+        return False
+    rp_command, fcc_command = commands
+
+    stage_options: dict[str, Any] = {
+        "stream_output": stream_output,
+        "metrics_interval": metrics_interval,
+        "scenario_suffix": scenario_suffix,
+        "log_output": log_output,
+        "full_io": full_io,
+    }
+    # eddypro_fcc only runs after eddypro_rp succeeded
+    success = _run_eddypro_stage(
+        "rp", rp_command, project_file, **stage_options
+    ) and _run_eddypro_stage("fcc", fcc_command, project_file, **stage_options)
+
+    _cleanup_eddypro_run(project_file.parent.parent, reuse_bin_dir=reuse_bin_dir)
+    _log_eddypro_result(success, project_file.parent)
     return success
 
 
+def _run_project_lane(
+    lane: list[Path],
+    *,
+    eddypro_executable: Path,
+    link_binaries: bool,
+    stage_options: dict[str, Any],
+) -> list[tuple[Path, bool]]:
+    """Drive the projects of one working directory through rp and fcc.
+
+    Projects in the same lane share the ``bin/`` and ``tmp/`` folders, so a
+    project's rp only starts after the previous project's fcc finished. A
+    lane therefore runs at most one EddyPro process at a time. The staged
+    binaries are reused within the lane and removed at the end.
+    """
+    results = []
+    eddypro_path = lane[0].parent.parent
+    try:
+        for project_file in lane:
+            commands = _prepare_eddypro_run(
+                project_file,
+                eddypro_executable,
+                link_binaries=link_binaries,
+                reuse_bin_dir=True,
+            )
+            success = False
+            if commands is not None:
+                rp_command, fcc_command = commands
+                # eddypro_fcc only runs after eddypro_rp succeeded
+                success = _run_eddypro_stage(
+                    "rp", rp_command, project_file, **stage_options
+                ) and _run_eddypro_stage(
+                    "fcc", fcc_command, project_file, **stage_options
+                )
+                _cleanup_eddypro_run(eddypro_path, reuse_bin_dir=True)
+            _log_eddypro_result(success, project_file.parent)
+            results.append((project_file, success))
+    finally:
+        _BIN_CACHE.pop((eddypro_executable.parent, eddypro_path / "bin"), None)
+        shutil.rmtree(eddypro_path / "bin", ignore_errors=True)
+    return results
+
+
+def run_eddypro_batch(
+    project_files: list[Path],
+    eddypro_executable: Path,
+    *,
+    max_processes: int = 1,
+    stream_output: bool = True,
+    metrics_interval: float = 0.5,
+    log_output: bool = True,
+    link_binaries: bool = True,
+    full_io: bool = False,
+) -> dict[Path, bool]:
+    """
+    Run EddyPro (rp -> fcc) for several project files in parallel lanes.
+
+    Projects are grouped into lanes by their EddyPro working directory
+    (the parent of the project's output directory). Lanes run on a thread
+    pool of at most ``max_processes`` workers, and each lane runs one EddyPro
+    process at a time, so no more than ``max_processes`` rp and fcc processes
+    run at once. One lane's ``eddypro_fcc`` can still overlap with another
+    lane's ``eddypro_rp``. The workers only wait on EddyPro subprocesses, so
+    threads are sufficient. Projects within a lane run strictly rp -> fcc ->
+    next project because they share the staged ``bin/`` and ``tmp/``
+    folders; this assumes runs for different working directories are
+    independent.
+
+    Args:
+        project_files: EddyPro project files to process
+        eddypro_executable: Path to the EddyPro executable
+        max_processes: Maximum concurrent EddyPro processes (rp and fcc combined)
+        stream_output: Whether to stream subprocess output
+        metrics_interval: Performance monitoring sampling interval
+        log_output: Whether to write EddyPro output to the logs
+        link_binaries: Stage EddyPro binaries via links instead of copies
+        full_io: Write cumulative I/O counters on every metrics sample
+
+    Returns:
+        Mapping of project file to success flag
+    """
+    lanes: dict[Path, list[Path]] = {}
+    for project_file in project_files:
+        lanes.setdefault(project_file.parent.parent, []).append(project_file)
+    if not lanes:
+        return {}
+
+    workers = max(1, min(max_processes, len(lanes)))
+    logging.info(
+        f"Running {len(project_files)} project(s) in {len(lanes)} lane(s) "
+        f"with up to {workers} EddyPro process(es) at a time"
+    )
+    stage_options: dict[str, Any] = {
+        "stream_output": stream_output,
+        "metrics_interval": metrics_interval,
+        "scenario_suffix": "",
+        "log_output": log_output,
+        "full_io": full_io,
+    }
+
+    results: dict[Path, bool] = {}
+    with ThreadPoolExecutor(workers, thread_name_prefix="eddypro_lane") as lanes_pool:
+        futures = [
+            lanes_pool.submit(
+                _run_project_lane,
+                lane,
+                eddypro_executable=eddypro_executable,
+                link_binaries=link_binaries,
+                stage_options=stage_options,
+            )
+            for lane in lanes.values()
+        ]
+        for future in as_completed(futures):
+            results.update(future.result())
+    return results
+
+
 # Legacy function imports - to be used by the CLI while preserving existing behavior
 def load_config(config_path: Path) -> dict:
     """Legacy function wrapper for backwards compatibility."""
@@ -342,6 +771,9 @@ def generate_run_report(
     start_time: datetime,
     end_time: datetime,
     overall_success: bool = True,
+    *,
+    start_monotonic_ns: int | None = None,
+    end_monotonic_ns: int | None = None,
 ) -> None:
     """
     Generate run manifest and HTML report after processing completes.
@@ -354,6 +786,9 @@ def generate_run_report(
         start_time: Processing start time (datetime)
         end_time: Processing end time (datetime)
         overall_success: Whether all processing succeeded
+        start_monotonic_ns: Optional ``time.monotonic_ns()`` at processing start,
+            used with ``end_monotonic_ns`` for the run duration
+        end_monotonic_ns: Optional ``time.monotonic_ns()`` at processing end
     """
     # Determine reports directory
     reports_dir_config = config.get("reports_dir")
@@ -377,8 +812,8 @@ def generate_run_report(
         if year_dir.exists():
             output_dirs.append(year_dir)
 
-    # Compute config checksum (simple hash of sorted config JSON)
-    config_checksum = str(hash(json.dumps(config, sort_keys=True)))
+    # Compute config checksum over the canonical config JSON
+    config_checksum = report.compute_config_checksum(config)
 
     # Collect scenarios (single baseline scenario for now)
     scenario_list = [
@@ -387,7 +822,9 @@ def generate_run_report(
             "scenario_params": {},
             "start_time": start_time.isoformat(),
             "end_time": end_time.isoformat(),
-            "duration_seconds": (end_time - start_time).total_seconds(),
+            "duration_seconds": report.compute_duration_seconds(
+                start_time, end_time, start_monotonic_ns, end_monotonic_ns
+            ),
             "success": overall_success,
         }
     ]
@@ -402,7 +839,7 @@ def generate_run_report(
         if metrics_files:
             # Load the most recent metrics file
             metrics_file = sorted(metrics_files)[-1]
-            metrics = report.load_metrics_from_csv(metrics_file)
+            metrics = report.load_metrics_frame(metrics_file, chart_only=True)
             scenario_metrics[f"{year}_baseline"] = metrics
 
     # Generate run manifest
@@ -417,11 +854,13 @@ def generate_run_report(
         end_time=end_time,
         overall_success=overall_success,
         output_dirs=output_dirs,
+        start_monotonic_ns=start_monotonic_ns,
+        end_monotonic_ns=end_monotonic_ns,
     )
 
     # Write run manifest
     manifest_path = reports_dir / "run_manifest.json"
-    report.write_run_manifest(run_manifest, manifest_path)
+    report.write_run_manifest(run_manifest, manifest_path, config)
 
     # Generate HTML report
     chart_engine = config.get("report_charts", "plotly")
@@ -431,12 +870,25 @@ def generate_run_report(
         scenario_metrics=scenario_metrics if scenario_metrics else None,
         chart_engine=chart_engine,
         output_path=html_path,
+        return_html=False,
     )
 
     logging.info(f"Run report generated: {html_path}")
     logging.info(f"Run manifest generated: {manifest_path}")
 
 
+def _write_scenario_metadata(metadata: dict[str, Any], manifest_path: Path) -> None:
+    """Write scenario metadata as indented JSON, using orjson when installed.
+
+    The document is serialized in memory and written in a single call instead
+    of through ``json.dump``'s incremental chunked writes.
+    """
+    if ORJSON_AVAILABLE:
+        manifest_path.write_bytes(orjson.dumps(metadata, option=orjson.OPT_INDENT_2))
+    else:
+        manifest_path.write_text(json.dumps(metadata, indent=2), encoding="utf-8")
+
+
 def run_single_scenario(
     scenario: Scenario,
     template_path: Path,
@@ -451,6 +903,9 @@ def run_single_scenario(
     input_dir: Path,
     ecmd_file: Path | None = None,
     dry_run: bool = False,
+    link_binaries: bool = True,
+    project_timestamp: str | None = None,
+    full_io: bool = False,
 ) -> dict[str, Any]:
     """
     Execute a single scenario with patched parameters.
@@ -463,11 +918,16 @@ def run_single_scenario(
         stream_output: Whether to stream subprocess output
         metrics_interval: Performance monitoring sampling interval
         dry_run: If True, only create files without running EddyPro
+        link_binaries: Stage EddyPro binaries via links instead of copies
+        project_timestamp: Project creation/change timestamp to write;
+            defaults to the current time
+        full_io: Write cumulative I/O counters on every metrics sample
 
     Returns:
         Dictionary containing scenario execution metadata
     """
     start_time = datetime.now()
+    start_ns = time.monotonic_ns()
 
     # Create scenario-specific output directory
     scenario_output_dir = output_base_dir / f"scenario{scenario.suffix}"
@@ -566,6 +1026,7 @@ def run_single_scenario(
             site_id=site_id,
             year=year,
             scenario_suffix=scenario.suffix,
+            now=project_timestamp,
         )
 
         # Conditionally patch date/time ranges based on rot_meth and tlag_meth
@@ -601,6 +1062,8 @@ def run_single_scenario(
                 metrics_interval=metrics_interval,
                 scenario_suffix=scenario.suffix,
                 log_output=log_output,
+                link_binaries=link_binaries,
+                full_io=full_io,
             )
             return_code = 0 if success else 1
         else:
@@ -609,7 +1072,7 @@ def run_single_scenario(
             )
 
         end_time = datetime.now()
-        duration = (end_time - start_time).total_seconds()
+        duration = (time.monotonic_ns() - start_ns) / 1e9
 
         # Build scenario metadata
         metadata = {
@@ -628,8 +1091,7 @@ def run_single_scenario(
 
         # Write scenario manifest
         manifest_path = scenario_output_dir / f"scenario_manifest{scenario.suffix}.json"
-        with open(manifest_path, "w", encoding="utf-8") as f:
-            json.dump(metadata, f, indent=2)
+        _write_scenario_metadata(metadata, manifest_path)
 
         logging.info(
             f"Scenario {scenario.index} {'completed' if success else 'failed'} "
@@ -638,7 +1100,7 @@ def run_single_scenario(
 
     except Exception as e:
         end_time = datetime.now()
-        duration = (end_time - start_time).total_seconds()
+        duration = (time.monotonic_ns() - start_ns) / 1e9
 
         logging.exception(f"Scenario {scenario.index} failed with exception")
 
@@ -676,6 +1138,8 @@ def run_scenario_batch(
     input_dir: Path,
     ecmd_file: Path | None = None,
     dry_run: bool = False,
+    link_binaries: bool = True,
+    full_io: bool = False,
 ) -> list[dict[str, Any]]:
     """
     Execute a batch of scenarios sequentially.
@@ -688,12 +1152,17 @@ def run_scenario_batch(
         stream_output: Whether to stream subprocess output
         metrics_interval: Performance monitoring sampling interval
         dry_run: If True, only create files without running EddyPro
+        link_binaries: Stage EddyPro binaries via links instead of copies
+        full_io: Write cumulative I/O counters on every metrics sample
 
     Returns:
         List of scenario metadata dictionaries
     """
     logging.info(f"Starting batch execution of {len(scenario_list)} scenarios")
 
+    # One project timestamp for the whole batch
+    project_timestamp = datetime.now().replace(microsecond=0).isoformat()
+
     scenario_results = []
     for scenario in scenario_list:
         result = run_single_scenario(
@@ -709,6 +1178,9 @@ def run_scenario_batch(
             input_dir=input_dir,
             ecmd_file=ecmd_file,
             dry_run=dry_run,
+            link_binaries=link_binaries,
+            project_timestamp=project_timestamp,
+            full_io=full_io,
         )
         scenario_results.append(result)
 
@@ -7,10 +7,10 @@ with time-varying instrument configurations.
 """
 
 import csv
+import io
 import logging
 from datetime import datetime
 from pathlib import Path
-from typing import NoReturn
 
 logger = logging.getLogger(__name__)
 
@@ -25,6 +25,9 @@ def parse_ecmd_date(date_str: str) -> datetime:
     """
     Parse ECMD date string in format YYYYMMDDHHMM.
 
+    The fixed-width format is sliced directly instead of going through
+    ``datetime.strptime``, which is considerably slower per call.
+
     Args:
         date_str: Date string in YYYYMMDDHHMM format
 
@@ -34,14 +37,18 @@ def parse_ecmd_date(date_str: str) -> datetime:
     Raises:
         ECMDError: If date format is invalid
     """
-
-    def _raise_parse_error(date_str: str, e: ValueError) -> NoReturn:
-        raise ECMDError(f"Invalid ECMD date format '{date_str}': {e}") from e
-
+    if len(date_str) != 12 or not (date_str.isascii() and date_str.isdigit()):
+        raise ECMDError(f"Invalid ECMD date format '{date_str}': expected YYYYMMDDHHMM")
     try:
-        return datetime.strptime(date_str, "%Y%m%d%H%M")
+        return datetime(
+            int(date_str[0:4]),
+            int(date_str[4:6]),
+            int(date_str[6:8]),
+            int(date_str[8:10]),
+            int(date_str[10:12]),
+        )
     except ValueError as e:
-        _raise_parse_error(date_str, e)
+        raise ECMDError(f"Invalid ECMD date format '{date_str}': {e}") from e
 
 
 ECMD_METADATA_COLUMNS: tuple[str, ...] = (
@@ -68,6 +75,18 @@ ECMD_METADATA_COLUMNS: tuple[str, ...] = (
 )
 
 
+# Dynamic metadata H2O IRGA columns copied from their CO2 counterparts
+_H2O_CO2_PAIRS: tuple[tuple[str, str], ...] = (
+    ("h2o_irga_manufacturer", "co2_irga_manufacturer"),
+    ("h2o_irga_model", "co2_irga_model"),
+    ("h2o_irga_northward_separation", "co2_irga_northward_separation"),
+    ("h2o_irga_eastward_separation", "co2_irga_eastward_separation"),
+    ("h2o_irga_tube_length", "co2_irga_tube_length"),
+    ("h2o_irga_tube_diameter", "co2_irga_tube_diameter"),
+    ("h2o_irga_flowrate", "co2_irga_flowrate"),
+)
+
+
 def select_ecmd_row_for_year(
     ecmd_path: Path,
     site_id: str,
@@ -93,28 +112,38 @@ def select_ecmd_row_for_year(
     required_columns = {"DATE_OF_VARIATION_EF", "SITEID", *ECMD_METADATA_COLUMNS}
     target = datetime(year, 1, 1, 0, 0)
 
-    selected_row: dict[str, str] | None = None
+    selected_row: list[str] | None = None
     selected_date: datetime | None = None
     earliest_date: datetime | None = None
 
     try:
         with ecmd_path.open("r", newline="", encoding="utf-8") as csvfile:
-            reader = csv.DictReader(csvfile)
+            reader = csv.reader(csvfile)
+            header = next(reader, None)
 
-            if not reader.fieldnames:
+            if not header:
                 raise ECMDError(f"ECMD file has no header: {ecmd_path}")
 
-            missing_cols = sorted(required_columns - set(reader.fieldnames))
+            missing_cols = sorted(required_columns - set(header))
             if missing_cols:
                 raise ECMDError(
                     "ECMD file missing required columns: " + ", ".join(missing_cols)
                 )
 
+            # Resolve column positions once instead of building a dict per row
+            col_index = {col: header.index(col) for col in required_columns}
+            site_idx = col_index["SITEID"]
+            date_idx = col_index["DATE_OF_VARIATION_EF"]
+            width = len(header)
+
             for row in reader:
-                if row.get("SITEID", "").strip() != site_id:
+                if len(row) < width:
+                    row.extend([""] * (width - len(row)))
+
+                if row[site_idx].strip() != site_id:
                     continue
 
-                date_str = row.get("DATE_OF_VARIATION_EF", "").strip()
+                date_str = row[date_idx].strip()
                 if not date_str:
                     raise ECMDError(
                         "ECMD row missing DATE_OF_VARIATION_EF for site "
@@ -146,8 +175,8 @@ def select_ecmd_row_for_year(
         )
 
     selected: dict[str, str] = {}
-    for col in required_columns:
-        selected[col] = (selected_row.get(col, "") or "").strip()
+    for col, idx in col_index.items():
+        selected[col] = selected_row[idx].strip()
 
     return selected
 
@@ -226,99 +255,98 @@ def generate_dynamic_metadata(
         "GA_FLOWRATE": "co2_irga_flowrate",
     }
 
-    def _validate_ecmd_header(reader: csv.DictReader, ecmd_path: Path) -> None:
-        """Validate ECMD CSV header has required columns."""
-        if not reader.fieldnames:
-            raise ECMDError(f"ECMD file has no header: {ecmd_path}")
-
-        # Check required columns exist
-        missing_cols = []
-        for ecmd_col in ecmd_to_dyn_md:
-            if ecmd_col not in reader.fieldnames and ecmd_col not in [
-                "GA_TUBE_LENGTH",
-                "GA_TUBE_DIAMETER",
-                "GA_FLOWRATE",
-            ]:
-                # Tube fields are optional for open-path
-                missing_cols.append(ecmd_col)
+    # Tube fields are optional for open-path analyzers
+    optional_columns = {"GA_TUBE_LENGTH", "GA_TUBE_DIAMETER", "GA_FLOWRATE"}
+    needed_columns = ["SITEID", "DATE_OF_VARIATION_EF", *ecmd_to_dyn_md]
 
-        if missing_cols:
-            msg = f"ECMD file missing required columns: {', '.join(missing_cols)}"
-            raise ECMDError(msg)
-
-    filtered_rows = []
+    # pandas is only needed here; importing lazily keeps CLI startup fast
+    import pandas as pd  # noqa: PLC0415
 
     try:
-        with ecmd_path.open("r", newline="", encoding="utf-8") as csvfile:
-            reader = csv.DictReader(csvfile)
-            _validate_ecmd_header(reader, ecmd_path)
-
-            for row in reader:
-                # Filter by site_id
-                if row.get("SITEID", "").strip() != site_id:
-                    continue
-
-                # Parse effective date
-                date_str = row.get("DATE_OF_VARIATION_EF", "")
-                if not date_str:
-                    logger.warning("Skipping ECMD row with no DATE_OF_VARIATION_EF")
-                    continue
+        df = pd.read_csv(
+            ecmd_path,
+            dtype=str,
+            keep_default_na=False,
+            encoding="utf-8",
+            # Never promote the first column to the index when rows carry a
+            # trailing extra field; csv.DictReader kept the columns aligned
+            index_col=False,
+            usecols=lambda col: col in needed_columns,
+        )
+    except pd.errors.EmptyDataError as e:
+        raise ECMDError(f"ECMD file has no header: {ecmd_path}") from e
+    except pd.errors.ParserError as e:
+        raise ECMDError(f"Error reading ECMD CSV {ecmd_path}: {e}") from e
+    except Exception as e:
+        raise ECMDError(f"Unexpected error processing ECMD {ecmd_path}: {e}") from e
 
-                try:
-                    eff_date = parse_ecmd_date(date_str)
-                except ECMDError as e:
-                    logger.warning(f"Skipping ECMD row: {e}")
-                    continue
+    missing_cols = [
+        col
+        for col in ecmd_to_dyn_md
+        if col not in df.columns and col not in optional_columns
+    ]
+    if missing_cols:
+        msg = f"ECMD file missing required columns: {', '.join(missing_cols)}"
+        raise ECMDError(msg)
 
-                # Build output row (all years included for EddyPro to match timestamps)
-                output_row = {}
-                output_row["date"] = eff_date.strftime("%Y-%m-%d")
-                output_row["time"] = eff_date.strftime("%H:%M")
-
-                # Map ECMD columns to dynamic metadata columns
-                for ecmd_col, dyn_md_col in ecmd_to_dyn_md.items():
-                    value = row.get(ecmd_col, "").strip()
-                    output_row[dyn_md_col] = value
-
-                # H2O IRGA typically same as CO2 IRGA (shared analyzer)
-                output_row["h2o_irga_manufacturer"] = output_row[
-                    "co2_irga_manufacturer"
-                ]
-                output_row["h2o_irga_model"] = output_row["co2_irga_model"]
-                output_row["h2o_irga_northward_separation"] = output_row[
-                    "co2_irga_northward_separation"
-                ]
-                output_row["h2o_irga_eastward_separation"] = output_row[
-                    "co2_irga_eastward_separation"
-                ]
-                output_row["h2o_irga_tube_length"] = output_row["co2_irga_tube_length"]
-                output_row["h2o_irga_tube_diameter"] = output_row[
-                    "co2_irga_tube_diameter"
-                ]
-                output_row["h2o_irga_flowrate"] = output_row["co2_irga_flowrate"]
-
-                filtered_rows.append(output_row)
+    try:
+        df = df.reindex(columns=needed_columns, fill_value="")
+
+        # Filter by site_id
+        df = df[df["SITEID"].str.strip() == site_id]
+
+        # Parse effective dates; rows without a valid date are skipped
+        date_str = df["DATE_OF_VARIATION_EF"]
+        eff_date = pd.to_datetime(date_str, format="%Y%m%d%H%M", errors="coerce")
+        valid = eff_date.notna()
+        skipped = date_str[~valid]
+        if not skipped.empty:
+            skipped_no_date = int((skipped == "").sum())
+            skipped_bad_date = skipped[skipped != ""].tolist()
+            logger.warning(
+                f"Skipped {skipped_no_date} ECMD row(s) with no "
+                f"DATE_OF_VARIATION_EF and {len(skipped_bad_date)} with invalid "
+                f"dates: {skipped_bad_date[:5]}"
+                + ("..." if len(skipped_bad_date) > 5 else "")
+            )
+        df = df[valid]
+        eff_date = eff_date[valid]
+
+        # Build output columns (all years included for EddyPro to match timestamps)
+        columns = {
+            "date": eff_date.dt.strftime("%Y-%m-%d").tolist(),
+            "time": eff_date.dt.strftime("%H:%M").tolist(),
+        }
+        # Map ECMD columns to dynamic metadata columns
+        for ecmd_col, dyn_md_col in ecmd_to_dyn_md.items():
+            columns[dyn_md_col] = df[ecmd_col].str.strip().tolist()
+
+        # H2O IRGA typically same as CO2 IRGA (shared analyzer)
+        for h2o_col, co2_col in _H2O_CO2_PAIRS:
+            columns[h2o_col] = columns[co2_col]
+
+        # Flat tuples in output_columns order; no per-row dict for the writer
+        rows = list(zip(*(columns[col] for col in output_columns), strict=True))
 
-    except csv.Error as e:
-        raise ECMDError(f"Error reading ECMD CSV {ecmd_path}: {e}") from e
     except Exception as e:
         raise ECMDError(f"Unexpected error processing ECMD {ecmd_path}: {e}") from e
 
-    if not filtered_rows:
+    if not rows:
         logger.warning(f"No ECMD rows found for site {site_id}")
 
     # Write dynamic metadata file
     try:
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
-        with output_path.open("w", newline="", encoding="utf-8") as csvfile:
-            writer = csv.DictWriter(csvfile, fieldnames=output_columns)
-            writer.writeheader()
-            writer.writerows(filtered_rows)
+        # Render in memory and write once instead of many small stream writes
+        buffer = io.StringIO()
+        writer = csv.writer(buffer, lineterminator="\r\n")
+        writer.writerow(output_columns)
+        writer.writerows(rows)
+        output_path.write_bytes(buffer.getvalue().encode("utf-8"))
 
         logger.info(
-            f"Generated dynamic metadata: {output_path} "
-            f"({len(filtered_rows)} configuration(s))"
+            f"Generated dynamic metadata: {output_path} ({len(rows)} configuration(s))"
         )
 
     except OSError as e:
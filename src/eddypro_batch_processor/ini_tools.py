@@ -7,39 +7,47 @@ Supports patching specific parameters while preserving the rest of the template.
 """
 
 import configparser
+import functools
 import io
 import logging
+import os
+import re
+from collections.abc import Iterable
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
 logger = logging.getLogger(__name__)
 
-# Parameter validation rules
+# Parameter validation rules; "ini_key" is the key name used in the INI file
 PARAMETER_VALIDATION: dict[str, dict[str, Any]] = {
     "rot_meth": {
         "section": "RawProcess_Settings",
+        "ini_key": "rot_meth",
         "allowed_values": {1, 3},
         "description": "Rotation method (1=DR double rotation, 3=PF planar fit)",
     },
     "tlag_meth": {
         "section": "RawProcess_Settings",
+        "ini_key": "tlag_meth",
         "allowed_values": {2, 4},
         "description": "Time lag method (2=CMD, 4=AO)",
     },
     "detrend_meth": {
         "section": "RawProcess_Settings",
+        "ini_key": "detrend_meth",
         "allowed_values": {0, 1},
         "description": "Detrend method (0=BA, 1=LD)",
     },
     "despike_meth": {
         "section": "RawProcess_ParameterSettings",
+        "ini_key": "despike_vm",  # INI file uses legacy key name
         "allowed_values": {0, 1},
         "description": "Spike removal method (0=VM97, 1=M13)",
-        "ini_key": "despike_vm",  # INI file uses legacy key name
     },
     "hf_meth": {
         "section": "Project",
+        "ini_key": "hf_meth",
         "allowed_values": {1, 4},
         "description": (
             "High-frequency spectral correction method "
@@ -49,11 +57,26 @@ PARAMETER_VALIDATION: dict[str, dict[str, Any]] = {
 }
 
 # Mapping from Python parameter names to INI key names
-# (only needed when they differ)
+# (only the entries where they differ)
 PARAMETER_INI_KEY_MAP: dict[str, str] = {
-    "despike_meth": "despike_vm",
+    name: info["ini_key"]
+    for name, info in PARAMETER_VALIDATION.items()
+    if info["ini_key"] != name
 }
 
+# Short parameter names used in scenario suffixes
+_SHORT_NAMES: dict[str, str] = {
+    "rot_meth": "rot",
+    "tlag_meth": "tlag",
+    "detrend_meth": "det",
+    "despike_meth": "spk",
+    "hf_meth": "hf",
+}
+
+# Known parameter names, and the same names in suffix order (alphabetical)
+_VALID_PARAM_NAMES = frozenset(PARAMETER_VALIDATION)
+_CANONICAL_PARAM_ORDER: tuple[str, ...] = tuple(sorted(_VALID_PARAM_NAMES))
+
 
 class INIParameterError(Exception):
     """Exception raised for invalid INI parameter values."""
@@ -61,10 +84,94 @@ class INIParameterError(Exception):
     pass
 
 
+# Flat INI grammar used by EddyPro files: [section] headers, key=value lines,
+# and full-line ';'/'#' comments (no continuations or inline comments)
+_SECTION_RE = re.compile(r"^\[([^\]\n]+)\][ \t]*$", re.MULTILINE)
+_KV_RE = re.compile(r"^([^=\s;#\[][^=\n]*)=(.*)$", re.MULTILINE)
+_INVALID_LINE_RE = re.compile(
+    r"^(?![ \t]*(?:[;#].*)?$)(?!\[[^\]\n]+\][ \t]*$)(?![^=\s;#\[][^=\n]*=).+$",
+    re.MULTILINE,
+)
+# "key: value" lines, which configparser accepts but the flat grammar rejects
+_COLON_OPTION_RE = re.compile(r"^[^=\s;#\[][^=:\n]*:.*$", re.MULTILINE)
+
+
+def _parse_flat_ini(text: str, fpname: str) -> dict[str, dict[str, str]]:
+    """Tokenize a flat EddyPro INI file into ``{section: {option: value}}``.
+
+    EddyPro project files only use section headers, ``key=value`` lines and
+    full-line comments, so the whole file is scanned with a few compiled
+    regexes instead of configparser's per-line loop. Errors mirror those of a
+    strict ``ConfigParser``; ``key: value`` options and other lines outside
+    the grammar (e.g. indented continuations) raise ``configparser.Error``
+    instead of being misread.
+    """
+    colon = _COLON_OPTION_RE.search(text)
+    if colon:
+        lineno = text.count("\n", 0, colon.start()) + 1
+        raise configparser.Error(
+            f"{fpname}, line {lineno}: 'key: value' options are not supported, "
+            f"use 'key=value': {colon.group(0)!r}"
+        )
+
+    invalid = _INVALID_LINE_RE.search(text)
+    first_section = _SECTION_RE.search(text)
+    preamble_end = first_section.start() if first_section else len(text)
+    stray = _KV_RE.search(text, 0, preamble_end)
+    if invalid and invalid.start() < preamble_end:
+        stray = stray or invalid
+    if stray:
+        raise configparser.MissingSectionHeaderError(
+            fpname,
+            text.count("\n", 0, stray.start()) + 1,
+            stray.group(0),
+        )
+    if invalid:
+        error = configparser.ParsingError(fpname)
+        error.append(text.count("\n", 0, invalid.start()) + 1, invalid.group(0))
+        raise error
+
+    sections: dict[str, dict[str, str]] = {}
+    parts = _SECTION_RE.split(text)
+    for name, body in zip(parts[1::2], parts[2::2], strict=True):
+        if name in sections:
+            raise configparser.DuplicateSectionError(name, fpname)
+
+        pairs = _KV_RE.findall(body)
+        options = {key.rstrip().lower(): value.strip() for key, value in pairs}
+        if len(options) != len(pairs):
+            keys = [key.rstrip().lower() for key, _ in pairs]
+            duplicate = next(key for key in keys if keys.count(key) > 1)
+            raise configparser.DuplicateOptionError(name, duplicate, fpname)
+        sections[name] = options
+    return sections
+
+
+def _config_from_sections(
+    sections: dict[str, dict[str, str]], source: str
+) -> configparser.ConfigParser:
+    """Build a new ConfigParser holding the parsed sections."""
+    config = configparser.ConfigParser()
+    config.read_dict(sections, source=source)
+    return config
+
+
+# Parsed templates keyed by path, tagged with the (mtime_ns, size) they came from
+_TEMPLATE_CACHE: dict[str, tuple[int, int, dict[str, dict[str, str]]]] = {}
+
+
+def clear_template_cache() -> None:
+    """Drop all templates memoized by read_ini_template."""
+    _TEMPLATE_CACHE.clear()
+
+
 def validate_parameter(param_name: str, value: Any) -> int:
     """
     Validate a parameter value against allowed values.
 
+    Results for hashable inputs are memoized, since scenario grids validate
+    the same few (parameter, value) pairs over and over.
+
     Args:
         param_name: Name of the parameter to validate
         value: Value to validate
@@ -75,7 +182,22 @@ def validate_parameter(param_name: str, value: Any) -> int:
     Raises:
         INIParameterError: If parameter name is unknown or value is invalid
     """
-    if param_name not in PARAMETER_VALIDATION:
+    try:
+        return _validate_parameter_cached(param_name, value)
+    except TypeError:
+        # Unhashable value (e.g. a list); validate without the cache
+        return _validate_parameter_uncached(param_name, value)
+
+
+@functools.lru_cache(maxsize=256, typed=True)
+def _validate_parameter_cached(param_name: str, value: Any) -> int:
+    """Memoized validate_parameter; PARAMETER_VALIDATION is module-constant."""
+    return _validate_parameter_uncached(param_name, value)
+
+
+def _validate_parameter_uncached(param_name: str, value: Any) -> int:
+    """Validate a parameter value; see validate_parameter."""
+    if param_name not in _VALID_PARAM_NAMES:
         available_params = list(PARAMETER_VALIDATION.keys())
         raise INIParameterError(
             f"Unknown parameter '{param_name}'. "
@@ -117,9 +239,10 @@ def validate_parameters(parameters: dict[str, Any]) -> dict[str, int]:
     Raises:
         INIParameterError: If any parameter is invalid
     """
-    validated = {}
-    for param_name, value in parameters.items():
-        validated[param_name] = validate_parameter(param_name, value)
+    validated = {
+        param_name: validate_parameter(param_name, value)
+        for param_name, value in parameters.items()
+    }
 
     logger.debug(f"Validated parameters: {validated}")
     return validated
@@ -129,30 +252,59 @@ def read_ini_template(template_path: Path) -> configparser.ConfigParser:
     """
     Read an INI template file.
 
+    Templates must use EddyPro's flat format: ``[section]`` headers,
+    ``key=value`` options and full-line ``;``/``#`` comments. ``key: value``
+    options, indented continuation lines and inline comments are not
+    supported and raise ``configparser.Error``.
+
+    Parsed templates are memoized by path, modification time and size; every
+    call returns a new ConfigParser that callers may patch freely.
+
     Args:
         template_path: Path to the INI template file
 
     Returns:
-        ConfigParser object with the template contents
+        ConfigParser with the template contents
 
     Raises:
         FileNotFoundError: If template file doesn't exist
         configparser.Error: If INI file is malformed
     """
-    if not template_path.exists():
-        raise FileNotFoundError(f"INI template not found: {template_path}")
+    try:
+        stat_result = template_path.stat()
+    except FileNotFoundError as e:
+        raise FileNotFoundError(f"INI template not found: {template_path}") from e
 
-    config = configparser.ConfigParser()
+    cache_key = str(template_path)
+    cached = _TEMPLATE_CACHE.get(cache_key)
+    if cached and cached[:2] == (stat_result.st_mtime_ns, stat_result.st_size):
+        logger.debug(f"Using cached INI template {template_path}")
+        return _config_from_sections(cached[2], cache_key)
+
+    text = template_path.read_text(encoding="utf-8")
     try:
-        config.read(template_path, encoding="utf-8")
+        sections = _parse_flat_ini(text, cache_key)
+        config = _config_from_sections(sections, cache_key)
     except configparser.Error as e:
         raise configparser.Error(
             f"Failed to parse INI template {template_path}: {e}"
         ) from e
-    else:
-        logger.debug(f"Read INI template from {template_path}")
+    except ValueError:
+        # read_dict rejects values such as a bare '%' that interpolation
+        # cannot parse; read those templates like ConfigParser always did
+        config = configparser.ConfigParser()
+        config.read_string(text, source=cache_key)
+        logger.debug(f"Read INI template from {template_path} (not cached)")
         return config
 
+    _TEMPLATE_CACHE[cache_key] = (
+        stat_result.st_mtime_ns,
+        stat_result.st_size,
+        sections,
+    )
+    logger.debug(f"Read INI template from {template_path}")
+    return config
+
 
 def patch_ini_parameters(
     config: configparser.ConfigParser, parameters: dict[str, int]
@@ -178,14 +330,61 @@ def patch_ini_parameters(
                 f"for parameter '{param_name}'"
             )
 
-        # Get INI key name (may differ from Python parameter name)
-        ini_key = PARAMETER_INI_KEY_MAP.get(param_name, param_name)
+        # INI key name (may differ from Python parameter name)
+        ini_key: str = validation_info["ini_key"]
 
         # Set the parameter value
         config.set(section_name, ini_key, str(value))
         logger.debug(f"Set {section_name}.{ini_key} = {value}")
 
 
+def _render_ini(config: configparser.ConfigParser, header: str) -> bytes:
+    """Serialize a config in EddyPro native format, ready for a single write.
+
+    Uses no spaces around '=' and LF endings, prefixes the header comment
+    that ConfigParser discards when reading, and trims trailing empty lines.
+    """
+    buffer = io.StringIO()
+    config.write(buffer, space_around_delimiters=False)
+
+    # Remove trailing empty lines while preserving a final newline
+    lines = buffer.getvalue().splitlines()
+    while lines and not lines[-1].strip():
+        lines.pop()
+    body = "\n".join(lines) + "\n" if lines else ""
+    return (header + body).encode("utf-8")
+
+
+def write_ini_files_batch(
+    items: Iterable[tuple[configparser.ConfigParser, Path]],
+) -> None:
+    """
+    Write several INI files in EddyPro native format.
+
+    Each distinct output directory is created once, and every file is rendered
+    in memory and written with a single call.
+
+    Args:
+        items: Pairs of (ConfigParser object, output path)
+
+    Raises:
+        OSError: If a directory or file cannot be written
+    """
+    items = list(items)
+    for parent in {output_path.parent for _, output_path in items}:
+        try:
+            parent.mkdir(parents=True, exist_ok=True)
+        except OSError as e:
+            raise OSError(f"Failed to create INI directory {parent}: {e}") from e
+
+    for config, output_path in items:
+        try:
+            output_path.write_bytes(_render_ini(config, ";EDDYPRO_PROCESSING\n"))
+        except OSError as e:
+            raise OSError(f"Failed to write INI file {output_path}: {e}") from e
+        logger.debug(f"Wrote INI file to {output_path}")
+
+
 def write_ini_file(config: configparser.ConfigParser, output_path: Path) -> None:
     """
     Write INI configuration to file.
@@ -201,30 +400,7 @@ def write_ini_file(config: configparser.ConfigParser, output_path: Path) -> None
     Raises:
         OSError: If file cannot be written
     """
-    try:
-        # Ensure output directory exists
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-
-        # Write with no spaces around '=' and LF endings (EddyPro native format)
-        with open(output_path, "w", encoding="utf-8", newline="\n") as f:
-            # Write the EddyPro header comment first
-            # (ConfigParser discards comments when reading, so we add it back)
-            f.write(";EDDYPRO_PROCESSING\n")
-
-            buffer = io.StringIO()
-            config.write(buffer, space_around_delimiters=False)
-            content = buffer.getvalue()
-
-            # Remove trailing empty lines while preserving a final newline
-            lines = content.splitlines()
-            while lines and not lines[-1].strip():
-                lines.pop()
-            if lines:
-                f.write("\n".join(lines) + "\n")
-
-        logger.debug(f"Wrote INI file to {output_path}")
-    except OSError as e:
-        raise OSError(f"Failed to write INI file {output_path}: {e}") from e
+    write_ini_files_batch([(config, output_path)])
 
 
 def write_metadata_file(config: configparser.ConfigParser, output_path: Path) -> None:
@@ -242,20 +418,7 @@ def write_metadata_file(config: configparser.ConfigParser, output_path: Path) ->
     """
     try:
         output_path.parent.mkdir(parents=True, exist_ok=True)
-
-        with open(output_path, "w", encoding="utf-8", newline="\n") as f:
-            f.write(";GHG_METADATA\n")
-
-            buffer = io.StringIO()
-            config.write(buffer, space_around_delimiters=False)
-            content = buffer.getvalue()
-
-            lines = content.splitlines()
-            while lines and not lines[-1].strip():
-                lines.pop()
-            if lines:
-                f.write("\n".join(lines) + "\n")
-
+        output_path.write_bytes(_render_ini(config, ";GHG_METADATA\n"))
         logger.debug(f"Wrote metadata file to {output_path}")
     except OSError as e:
         raise OSError(f"Failed to write metadata file {output_path}: {e}") from e
@@ -283,6 +446,7 @@ def populate_metadata_file(
     if not metadata_path.exists():
         raise INIParameterError(f"Metadata file not found: {metadata_path}")
 
+    # Metadata files are user supplied, so keep the full configparser syntax
     config = configparser.ConfigParser()
     try:
         config.read(metadata_path, encoding="utf-8")
@@ -396,6 +560,16 @@ def write_project_file_with_metadata(
     )
 
 
+@functools.lru_cache(maxsize=256)
+def _as_posix(path: str, *children: str) -> str:
+    """Memoized ``Path(path, *children).as_posix()``.
+
+    Most path strings (data, metadata) are shared by every scenario of a
+    batch; only out_path-derived ones change per scenario.
+    """
+    return Path(path, *children).as_posix()
+
+
 def patch_ini_paths(
     config: configparser.ConfigParser,
     *,
@@ -433,15 +607,15 @@ def patch_ini_paths(
             "missing from template"
         )
 
-    # Normalize all paths to forward slashes (EddyPro standard)
-    file_name_normalized = (Path(out_path) / f"{site_id}.eddypro").as_posix()
-    proj_file_path = Path(proj_file)
-    if not proj_file_path.is_absolute():
-        proj_file_path = Path(out_path) / proj_file_path
-    proj_file_normalized = proj_file_path.as_posix()
-    dyn_metadata_file_normalized = Path(dyn_metadata_file).as_posix()
-    data_path_normalized = Path(data_path).as_posix()
-    out_path_normalized = Path(out_path).as_posix()
+    # Normalize all paths to forward slashes (EddyPro standard). A relative
+    # proj_file is resolved against out_path (absolute ones replace it).
+    file_name_normalized = _as_posix(out_path, f"{site_id}.eddypro")
+    proj_file_normalized = _as_posix(out_path, proj_file)
+    dyn_metadata_file_normalized = _as_posix(dyn_metadata_file)
+    data_path_normalized = _as_posix(data_path)
+    out_path_normalized = _as_posix(out_path)
+    bin_spectra_normalized = _as_posix(out_path, "eddypro_binned_cospectra")
+    full_spectra_normalized = _as_posix(out_path, "eddypro_full_cospectra")
 
     # Project-level paths
     config.set("Project", "file_name", file_name_normalized)
@@ -464,12 +638,12 @@ def patch_ini_paths(
     config.set(
         "FluxCorrection_SpectralAnalysis_General",
         "sa_bin_spectra",
-        (Path(out_path) / "eddypro_binned_cospectra").as_posix(),
+        bin_spectra_normalized,
     )
     config.set(
         "FluxCorrection_SpectralAnalysis_General",
         "sa_full_spectra",
-        (Path(out_path) / "eddypro_full_cospectra").as_posix(),
+        full_spectra_normalized,
     )
 
     logger.debug(
@@ -483,8 +657,8 @@ def patch_ini_paths(
         dyn_metadata_file_normalized,
         out_path_normalized,
         data_path_normalized,
-        (Path(out_path) / "eddypro_binned_cospectra").as_posix(),
-        (Path(out_path) / "eddypro_full_cospectra").as_posix(),
+        bin_spectra_normalized,
+        full_spectra_normalized,
     )
 
 
@@ -511,84 +685,52 @@ def patch_conditional_date_ranges(
         INIParameterError: If required sections are missing when conditions
             are met
     """
-    # Check rot_meth for Planar Fit (value 3)
-    if config.has_section("RawProcess_Settings"):
-        rot_meth = config.getint("RawProcess_Settings", "rot_meth", fallback=None)
-        if rot_meth == 3:
-            if not config.has_section("RawProcess_TiltCorrection_Settings"):
-                raise INIParameterError(
-                    "rot_meth=3 (Planar Fit) requires section "
-                    "'RawProcess_TiltCorrection_Settings' in template"
-                )
-
-            # Populate planar fit date/time range for the full year
-            config.set(
-                "RawProcess_TiltCorrection_Settings",
-                "pf_start_date",
-                f"{year}-01-01",
-            )
-            config.set(
-                "RawProcess_TiltCorrection_Settings",
-                "pf_end_date",
-                f"{year}-12-31",
-            )
-            config.set("RawProcess_TiltCorrection_Settings", "pf_start_time", "00:00")
-            config.set("RawProcess_TiltCorrection_Settings", "pf_end_time", "23:59")
-
-            logger.debug(
-                "rot_meth=3: Populated planar fit date range for year %d "
-                "(pf_start_date=%s-%02d-%02d, pf_end_date=%s-%02d-%02d)",
-                year,
-                year,
-                1,
-                1,
-                year,
-                12,
-                31,
-            )
-
-    # Check tlag_meth for time-lag optimization (value 4)
-    if config.has_section("RawProcess_Settings"):
-        tlag_meth = config.getint("RawProcess_Settings", "tlag_meth", fallback=None)
-        if tlag_meth == 4:
-            if not config.has_section("RawProcess_TimelagOptimization_Settings"):
-                raise INIParameterError(
-                    "tlag_meth=4 (time-lag optimization) requires section "
-                    "'RawProcess_TimelagOptimization_Settings' in template"
-                )
-
-            # Populate time-lag optimization date/time range for the full year
-            config.set(
-                "RawProcess_TimelagOptimization_Settings",
-                "to_start_date",
-                f"{year}-01-01",
-            )
-            config.set(
-                "RawProcess_TimelagOptimization_Settings",
-                "to_end_date",
-                f"{year}-12-31",
-            )
-            config.set(
-                "RawProcess_TimelagOptimization_Settings",
-                "to_start_time",
-                "00:00",
-            )
-            config.set(
-                "RawProcess_TimelagOptimization_Settings", "to_end_time", "23:59"
+    if not config.has_section("RawProcess_Settings"):
+        return
+
+    rot_meth = config.getint("RawProcess_Settings", "rot_meth", fallback=None)
+    tlag_meth = config.getint("RawProcess_Settings", "tlag_meth", fallback=None)
+    start_date = f"{year}-01-01"
+    end_date = f"{year}-12-31"
+
+    def _set_range(section: str, prefix: str) -> None:
+        """Set the full-year {prefix}_start/end_date/time keys in a section."""
+        config.set(section, f"{prefix}_start_date", start_date)
+        config.set(section, f"{prefix}_end_date", end_date)
+        config.set(section, f"{prefix}_start_time", "00:00")
+        config.set(section, f"{prefix}_end_time", "23:59")
+
+    # Planar Fit (rot_meth=3)
+    if rot_meth == 3:
+        if not config.has_section("RawProcess_TiltCorrection_Settings"):
+            raise INIParameterError(
+                "rot_meth=3 (Planar Fit) requires section "
+                "'RawProcess_TiltCorrection_Settings' in template"
             )
+        _set_range("RawProcess_TiltCorrection_Settings", "pf")
+        logger.debug(
+            "rot_meth=3: Populated planar fit date range for year %d "
+            "(pf_start_date=%s, pf_end_date=%s)",
+            year,
+            start_date,
+            end_date,
+        )
 
-            logger.debug(
-                "tlag_meth=4: Populated time-lag optimization date range "
-                "for year %d (to_start_date=%s-%02d-%02d, "
-                "to_end_date=%s-%02d-%02d)",
-                year,
-                year,
-                1,
-                1,
-                year,
-                12,
-                31,
+    # Time-lag optimization (tlag_meth=4)
+    if tlag_meth == 4:
+        if not config.has_section("RawProcess_TimelagOptimization_Settings"):
+            raise INIParameterError(
+                "tlag_meth=4 (time-lag optimization) requires section "
+                "'RawProcess_TimelagOptimization_Settings' in template"
             )
+        _set_range("RawProcess_TimelagOptimization_Settings", "to")
+        logger.debug(
+            "tlag_meth=4: Populated time-lag optimization date range "
+            "for year %d (to_start_date=%s, to_end_date=%s)",
+            year,
+            start_date,
+            end_date,
+        )
 
 
 def patch_project_metadata(
@@ -597,6 +739,7 @@ def patch_project_metadata(
     site_id: str,
     year: int,
     scenario_suffix: str = "",
+    now: str | None = None,
 ) -> None:
     """Patch Project metadata fields to match EddyPro native format.
 
@@ -608,6 +751,8 @@ def patch_project_metadata(
         site_id: Site identifier (e.g., 'GL-ZaF')
         year: Processing year
         scenario_suffix: Optional scenario suffix (e.g., '_rot1_tlag2')
+        now: Timestamp (YYYY-MM-DDTHH:MM:SS) to write; batch callers pass one
+            value for all files. Defaults to the current time.
 
     Raises:
         INIParameterError: If required Project section is missing
@@ -617,8 +762,9 @@ def patch_project_metadata(
 
     _ = year, scenario_suffix
 
-    # Get current timestamp in EddyPro format: YYYY-MM-DDTHH:MM:SS
-    now = datetime.now().strftime("%Y-%m-%dT%H:%M:%S")
+    # Timestamp in EddyPro format: YYYY-MM-DDTHH:MM:SS
+    if now is None:
+        now = datetime.now().replace(microsecond=0).isoformat()
 
     # Set creation_date only if empty (preserve original creation time)
     if not config.get("Project", "creation_date", fallback="").strip():
@@ -641,6 +787,11 @@ def patch_project_metadata(
     )
 
 
+def _is_csv(entry: os.DirEntry[str]) -> bool:
+    """Return True for regular files with a .csv extension (OS case rules)."""
+    return os.path.normcase(entry.name).endswith(".csv") and entry.is_file()
+
+
 def validate_eddypro_inputs(config: configparser.ConfigParser) -> None:
     """Validate that EddyPro inputs are accessible before execution.
 
@@ -672,9 +823,11 @@ def validate_eddypro_inputs(config: configparser.ConfigParser) -> None:
             f"RawProcess_General.data_path is not a directory: {data_path}"
         )
 
-    # Check for CSV files (basic check; prototype matching is EddyPro's job)
-    csv_files = list(data_path.glob("*.csv"))
-    if not csv_files:
+    # Check for CSV files (basic check; prototype matching is EddyPro's job).
+    # Stop at the first hit so huge raw-data folders are not listed in full.
+    with os.scandir(data_path) as entries:
+        first_csv = next((entry.name for entry in entries if _is_csv(entry)), None)
+    if first_csv is None:
         raise INIParameterError(
             f"No CSV files found in data_path: {data_path}. "
             "EddyPro will fail with Fatal error(86)."
@@ -683,22 +836,34 @@ def validate_eddypro_inputs(config: configparser.ConfigParser) -> None:
     # Get file_prototype for informational logging
     file_prototype = config.get("Project", "file_prototype", fallback="(not set)")
 
-    logger.info(
-        f"Preflight check passed: {len(csv_files)} CSV file(s) found in {data_path}"
-    )
+    logger.info(f"Preflight check passed: CSV file(s) found in {data_path}")
+    if not logger.isEnabledFor(logging.DEBUG):
+        return
+
     logger.debug(f"File prototype: {file_prototype}")
+    with os.scandir(data_path) as entries:
+        csv_names = [entry.name for entry in entries if _is_csv(entry)]
+    logger.debug(f"{len(csv_names)} CSV file(s) found in {data_path}")
 
     # Optional: warn if prototype looks suspicious (e.g., still has placeholder '?')
     # but don't fail, as EddyPro will handle the actual matching
     if file_prototype and "?" in file_prototype:
         # Sample a few filenames for the log
-        sample_files = [f.name for f in csv_files[:3]]
+        sample_files = csv_names[:3]
         logger.debug(
             f"Sample files in directory: {sample_files}. "
             f"Ensure prototype '{file_prototype}' matches."
         )
 
 
+_FILE_DESCRIPTION_RE = re.compile(
+    r"^\[FileDescription\][ \t]*$(.*?)(?=^\[|\Z)", re.MULTILINE | re.DOTALL
+)
+_VARIABLE_KEY_RE = re.compile(
+    r"^[^=\s;#][^=\n]*_variable[ \t]*=(.*)$", re.MULTILINE | re.IGNORECASE
+)
+
+
 def validate_eddypro_metadata(config: configparser.ConfigParser) -> None:
     """Validate that the static metadata file referenced by the project exists
     and declares the mandatory variables.
@@ -722,25 +887,18 @@ def validate_eddypro_metadata(config: configparser.ConfigParser) -> None:
     if not meta_path.exists() or not meta_path.is_file():
         raise INIParameterError(f"Static metadata file not found: {meta_path}")
 
-    # Parse metadata and check variables in [FileDescription]
-    parser = configparser.ConfigParser()
-    try:
-        parser.read(meta_path, encoding="utf-8")
-    except configparser.Error as e:  # pragma: no cover
-        raise INIParameterError(
-            f"Failed to parse metadata file {meta_path}: {e}"
-        ) from e
-
-    if not parser.has_section("FileDescription"):
+    # Only [FileDescription] matters; scan it with regexes instead of parsing
+    # every section of the (often large) metadata file. read_text normalizes
+    # CRLF line endings, which the line-anchored patterns rely on.
+    content = meta_path.read_text(encoding="utf-8", errors="replace")
+    section = _FILE_DESCRIPTION_RE.search(content)
+    if section is None:
         raise INIParameterError(
             f"Metadata file {meta_path} missing [FileDescription] section"
         )
 
     # Collect declared variables
-    variables: set[str] = set()
-    for key, value in parser.items("FileDescription"):
-        if key.endswith("_variable"):
-            variables.add(value.strip())
+    variables = {value.strip() for value in _VARIABLE_KEY_RE.findall(section.group(1))}
 
     required = {"u", "v", "w", "ts"}
     missing = sorted(required - variables)
@@ -789,6 +947,73 @@ def create_patched_ini(
     logger.info(f"Created patched INI file: {output_path}")
 
 
+# Compiled "[section] ... key=" patterns used by create_patched_ini_fast
+_PATCH_RE_CACHE: dict[tuple[str, str], re.Pattern[str]] = {}
+
+
+def _patch_pattern(section: str, key: str) -> re.Pattern[str]:
+    """Return the compiled pattern matching ``key=`` inside ``[section]``."""
+    pattern = _PATCH_RE_CACHE.get((section, key))
+    if pattern is None:
+        pattern = re.compile(
+            rf"(^\[{re.escape(section)}\][ \t]*\n(?:(?!\[)[^\n]*\n)*?"
+            rf"{re.escape(key)}[ \t]*=)[^\n]*",
+            re.MULTILINE,
+        )
+        _PATCH_RE_CACHE[(section, key)] = pattern
+    return pattern
+
+
+def create_patched_ini_fast(
+    template_path: Path, output_path: Path, parameters: dict[str, Any] | None = None
+) -> None:
+    """
+    Create a patched INI file by substituting values in the template text.
+
+    Unlike create_patched_ini, the template is not parsed and re-serialized:
+    only the values of the patched keys change and every other byte of the
+    template is kept. If a parameter's section or key is not present in the
+    template, this falls back to create_patched_ini.
+
+    Args:
+        template_path: Path to the INI template file
+        output_path: Path where to write the patched INI file
+        parameters: Dictionary of parameter name -> value pairs to override
+
+    Raises:
+        FileNotFoundError: If template file doesn't exist
+        INIParameterError: If any parameter is invalid
+        configparser.Error: If INI file is malformed (fallback path only)
+        OSError: If output file cannot be written
+    """
+    try:
+        text = template_path.read_text(encoding="utf-8")
+    except FileNotFoundError as e:
+        raise FileNotFoundError(f"INI template not found: {template_path}") from e
+
+    validated_params = validate_parameters(parameters) if parameters else {}
+    for param_name, value in validated_params.items():
+        validation_info = PARAMETER_VALIDATION[param_name]
+        pattern = _patch_pattern(validation_info["section"], validation_info["ini_key"])
+        text, count = pattern.subn(
+            lambda match, value=value: f"{match.group(1)}{value}", text, count=1
+        )
+        if not count:
+            logger.debug(
+                f"{validation_info['section']}.{validation_info['ini_key']} not "
+                f"found in {template_path}; using full INI round-trip"
+            )
+            create_patched_ini(template_path, output_path, parameters)
+            return
+
+    try:
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        output_path.write_bytes(text.encode("utf-8"))
+    except OSError as e:
+        raise OSError(f"Failed to write INI file {output_path}: {e}") from e
+    logger.info(f"Created patched INI file: {output_path}")
+
+
 def get_parameter_info() -> dict[str, dict[str, Any]]:
     """
     Get information about all supported parameters.
@@ -803,6 +1028,9 @@ def generate_scenario_suffix(parameters: dict[str, int]) -> str:
     """
     Generate a deterministic suffix for scenario identification.
 
+    Parameters appear in alphabetical order of their names. Suffixes are
+    memoized because the same combinations recur across sites and years.
+
     Args:
         parameters: Dictionary of parameter name -> value pairs
 
@@ -812,19 +1040,29 @@ def generate_scenario_suffix(parameters: dict[str, int]) -> str:
     if not parameters:
         return ""
 
-    # Create suffix in consistent order
-    suffix_parts = []
-    for param_name in sorted(parameters.keys()):
-        value = parameters[param_name]
-        # Use short names for suffix
-        short_names = {
-            "rot_meth": "rot",
-            "tlag_meth": "tlag",
-            "detrend_meth": "det",
-            "despike_meth": "spk",
-            "hf_meth": "hf",
-        }
-        short_name = short_names.get(param_name, param_name)
-        suffix_parts.append(f"{short_name}{value}")
-
-    return "_" + "_".join(suffix_parts)
+    try:
+        # Value types are part of the key so e.g. 1 and True stay distinct
+        key = frozenset(
+            (name, type(value), value) for name, value in parameters.items()
+        )
+        return _scenario_suffix_cached(key)
+    except TypeError:
+        # Unhashable values; build the suffix without the cache
+        return _build_scenario_suffix(parameters)
+
+
+@functools.lru_cache(maxsize=64)
+def _scenario_suffix_cached(key: frozenset[tuple[str, type, Any]]) -> str:
+    """Memoized generate_scenario_suffix keyed on (name, type, value) triples."""
+    return _build_scenario_suffix({name: value for name, _, value in key})
+
+
+def _build_scenario_suffix(parameters: dict[str, Any]) -> str:
+    """Join short name/value parts in alphabetical parameter order."""
+    if parameters.keys() <= _VALID_PARAM_NAMES:
+        names: Iterable[str] = (n for n in _CANONICAL_PARAM_ORDER if n in parameters)
+    else:
+        names = sorted(parameters)
+    return "_" + "_".join(
+        f"{_SHORT_NAMES.get(name, name)}{parameters[name]}" for name in names
+    )
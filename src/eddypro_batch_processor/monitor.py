@@ -5,13 +5,14 @@ This module provides performance monitoring capabilities using psutil to track
 CPU, memory, and I/O metrics during EddyPro subprocess execution.
 """
 
+import bisect
 import csv
 import json
 import logging
 import threading
 import time
 from pathlib import Path
-from typing import Any
+from typing import Any, TextIO
 
 try:
     import psutil
@@ -21,9 +22,204 @@ except ImportError:
     PSUTIL_AVAILABLE = False
     psutil = None
 
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    orjson = None
+
 
 logger = logging.getLogger(__name__)
 
+# Sample columns describing when a sample was taken rather than what it measured
+_NON_METRIC_FIELDS = frozenset(
+    {"timestamp", "timestamp_ns", "relative_time", "burst_id", "active_regions"}
+)
+
+# Cumulative I/O counters: reported as start/end totals rather than summarized
+_COUNTER_FIELDS = frozenset(
+    {
+        "system_disk_read_bytes",
+        "system_disk_write_bytes",
+        "system_disk_read_count",
+        "system_disk_write_count",
+        "system_network_bytes_sent",
+        "system_network_bytes_recv",
+        "process_io_read_bytes",
+        "process_io_write_bytes",
+        "process_io_read_count",
+        "process_io_write_count",
+    }
+)
+
+# Byte counters turned into per-sample throughput, mapped to their rate column
+_RATE_FIELDS = {
+    "system_disk_read_bytes": "system_disk_read_rate_bytes_per_s",
+    "system_disk_write_bytes": "system_disk_write_rate_bytes_per_s",
+    "system_network_bytes_sent": "system_network_sent_rate_bytes_per_s",
+    "system_network_bytes_recv": "system_network_recv_rate_bytes_per_s",
+    "process_io_read_bytes": "process_io_read_rate_bytes_per_s",
+    "process_io_write_bytes": "process_io_write_rate_bytes_per_s",
+}
+
+# Counters reported by the same psutil call; a group whose byte counters did
+# not move since the previous sample is left out of the row
+_COUNTER_GROUPS = (
+    (
+        "system_disk_read_bytes",
+        "system_disk_write_bytes",
+        "system_disk_read_count",
+        "system_disk_write_count",
+    ),
+    ("system_network_bytes_sent", "system_network_bytes_recv"),
+    (
+        "process_io_read_bytes",
+        "process_io_write_bytes",
+        "process_io_read_count",
+        "process_io_write_count",
+    ),
+)
+
+# Values kept per metric for exact percentiles; longer runs switch to streaming
+# P² estimates seeded from these values
+EXACT_PERCENTILE_SAMPLES = 1024
+
+# Percentiles reported per metric, as (summary key, quantile) pairs
+_PERCENTILES = (("p50", 0.5), ("p90", 0.9), ("p95", 0.95))
+
+# Rows buffered between flushes of the streamed metrics CSV
+CSV_FLUSH_EVERY = 64
+
+
+class P2Quantile:
+    """
+    Streaming quantile estimate using the P² algorithm (Jain & Chlamtac, 1985).
+
+    Five markers track the minimum, the target quantile, the maximum and two
+    points in between. Each update is O(1) and the memory use is fixed,
+    whatever the number of observations.
+    """
+
+    __slots__ = ("count", "desired", "increments", "positions", "heights")
+
+    def __init__(self, p: float, initial: list[int | float]):
+        """
+        Seed the markers from the exact order statistics of initial values.
+
+        Args:
+            p: Quantile to estimate, between 0 and 1
+            initial: Sorted observations seen so far (at least 5)
+        """
+        count = len(initial)
+        self.count = count
+        self.increments = (0.0, p / 2, p, (1 + p) / 2, 1.0)
+        self.desired = [1 + (count - 1) * d for d in self.increments]
+
+        # Marker ranks must be distinct integers within 1..count
+        positions = [round(d) for d in self.desired]
+        for i in range(1, 5):
+            positions[i] = min(max(positions[i], positions[i - 1] + 1), count - 4 + i)
+        self.positions = positions
+        self.heights = [float(initial[rank - 1]) for rank in positions]
+
+    def update(self, x: int | float) -> None:
+        """Add one observation and adjust the markers."""
+        q = self.heights
+        n = self.positions
+        if x < q[0]:
+            q[0] = x
+            k = 0
+        elif x >= q[4]:
+            q[4] = x
+            k = 3
+        else:
+            k = bisect.bisect_right(q, x, 1, 4) - 1
+
+        for i in range(k + 1, 5):
+            n[i] += 1
+        self.count += 1
+        desired = self.desired
+        for i in range(5):
+            desired[i] += self.increments[i]
+
+        for i in (1, 2, 3):
+            d = desired[i] - n[i]
+            if (d >= 1 and n[i + 1] - n[i] > 1) or (d <= -1 and n[i - 1] - n[i] < -1):
+                step = 1 if d > 0 else -1
+                height = self._parabolic(i, step)
+                if not q[i - 1] < height < q[i + 1]:
+                    height = q[i] + step * (q[i + step] - q[i]) / (n[i + step] - n[i])
+                q[i] = height
+                n[i] += step
+
+    def _parabolic(self, i: int, step: int) -> float:
+        """Piecewise-parabolic prediction of marker ``i`` moved by ``step``."""
+        q = self.heights
+        n = self.positions
+        return q[i] + step / (n[i + 1] - n[i - 1]) * (
+            (n[i] - n[i - 1] + step) * (q[i + 1] - q[i]) / (n[i + 1] - n[i])
+            + (n[i + 1] - n[i] - step) * (q[i] - q[i - 1]) / (n[i] - n[i - 1])
+        )
+
+    def value(self) -> float:
+        """Current estimate of the quantile."""
+        return self.heights[2]
+
+
+class OnlineStat:
+    """
+    Running statistics for one metric in constant memory.
+
+    Min, max, mean and variance are updated with Welford's algorithm. The first
+    ``exact_limit`` values are kept so short runs report exact percentiles;
+    after that the values are handed to one :class:`P2Quantile` per reported
+    percentile and discarded.
+    """
+
+    __slots__ = ("estimators", "exact_limit", "m2", "max", "mean", "min", "n", "values")
+
+    def __init__(self, exact_limit: int = EXACT_PERCENTILE_SAMPLES):
+        """Initialize an empty statistic."""
+        self.n = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.min = float("inf")
+        self.max = float("-inf")
+        self.exact_limit = max(5, exact_limit)  # P² needs five seed values
+        self.values: list[int | float] | None = []
+        self.estimators: tuple[P2Quantile, ...] | None = None
+
+    def update(self, value: int | float) -> None:
+        """Add one value to the statistic."""
+        self.n += 1
+        delta = value - self.mean
+        self.mean += delta / self.n
+        self.m2 += delta * (value - self.mean)
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+
+        if self.estimators is not None:
+            for estimator in self.estimators:
+                estimator.update(value)
+            return
+
+        self.values.append(value)
+        if len(self.values) > self.exact_limit:
+            seed = sorted(self.values)
+            self.estimators = tuple(P2Quantile(q, seed) for _, q in _PERCENTILES)
+            self.values = None
+
+    def __len__(self) -> int:
+        """Number of values seen."""
+        return self.n
+
+    @property
+    def variance(self) -> float:
+        """Sample variance of the values seen so far."""
+        return self.m2 / (self.n - 1) if self.n > 1 else 0.0
+
 
 class PerformanceMonitor:
     """
@@ -32,6 +228,27 @@ class PerformanceMonitor:
     Tracks CPU utilization, memory usage (RSS/peak), disk I/O, and wall-clock time
     with configurable sampling intervals. Produces both time series (CSV) and
     summary (JSON) outputs.
+
+    Sampling can be split into short polling bursts: every ``interval_seconds``
+    the monitor wakes up and takes ``burst_samples`` samples spaced
+    ``burst_interval`` apart, then sleeps until the next interval. This keeps
+    the distribution of short-lived spikes while waking the thread far less
+    often than sampling continuously at the burst rate.
+
+    Cumulative I/O counters are only written when they changed: a disk,
+    network or process I/O group whose byte counters are unchanged since the
+    previous sample leaves empty cells next to its zero rates. Pass
+    ``full_io=True`` to repeat every counter on every row.
+
+    With ``shared=True`` the monitor does not start a thread of its own but
+    registers with the process-wide shared sampler (see ``_SharedSampler``),
+    which samples every registered monitor from one thread. Shared monitors
+    take one sample per interval; ``burst_samples`` is ignored.
+
+    The sampler is an ordinary daemon thread. EddyPro itself runs as a separate
+    OS process and the driver thread spends the run blocked in the subprocess
+    wait, which releases the GIL, so the sampler does not compete with the
+    monitored workload for the interpreter lock.
     """
 
     def __init__(
@@ -39,6 +256,11 @@ class PerformanceMonitor:
         interval_seconds: float = 0.5,
         output_dir: str | Path | None = None,
         scenario_suffix: str = "",
+        burst_samples: int = 1,
+        burst_interval: float | None = None,
+        *,
+        full_io: bool = False,
+        shared: bool = False,
     ):
         """
         Initialize the performance monitor.
@@ -47,9 +269,18 @@ class PerformanceMonitor:
             interval_seconds: Sampling interval in seconds (default: 0.5)
             output_dir: Directory to write metrics files (default: current directory)
             scenario_suffix: Suffix to append to output filenames for scenario runs
+            burst_samples: Number of samples taken per interval (default: 1)
+            burst_interval: Spacing between samples within a burst in seconds
+                (default: interval_seconds / burst_samples). Clamped so a burst
+                fits inside one interval.
+            full_io: Write the cumulative I/O counters on every sample, even
+                when they did not change (default: False)
+            shared: Sample from the shared sampler thread instead of a
+                dedicated one (default: False)
 
         Raises:
             ImportError: If psutil is not available
+            ValueError: If burst_samples is less than 1
         """
         if not PSUTIL_AVAILABLE:
             raise ImportError(
@@ -57,19 +288,62 @@ class PerformanceMonitor:
                 "Install with: pip install psutil"
             )
 
+        # Resolve the psutil functions once instead of on every sample
+        self._cpu_percent = psutil.cpu_percent
+        self._virtual_memory = psutil.virtual_memory
+        self._disk_io_counters = psutil.disk_io_counters
+        # Network counters are not available on all systems
+        self._net_io_counters = getattr(psutil, "net_io_counters", None)
+
         self.interval_seconds = max(0.1, interval_seconds)  # Minimum 0.1s
+        if burst_samples < 1:
+            raise ValueError(f"burst_samples must be at least 1, got {burst_samples}")
+        self.burst_samples = burst_samples
+        max_burst_interval = self.interval_seconds / burst_samples
+        if burst_interval is None:
+            burst_interval = max_burst_interval
+        elif burst_interval > max_burst_interval:
+            logger.warning(
+                f"burst_interval {burst_interval}s does not fit {burst_samples} "
+                f"samples in {self.interval_seconds}s; using {max_burst_interval}s"
+            )
+            burst_interval = max_burst_interval
+        self.burst_interval = burst_interval
+        self.full_io = full_io
+        self.shared = shared
         self.output_dir = Path(output_dir) if output_dir else Path.cwd()
         self.scenario_suffix = scenario_suffix
 
         # Monitoring state
         self._monitoring = False
+        self._stop_event = threading.Event()
         self._monitor_thread: threading.Thread | None = None
         self._start_time: float | None = None
         self._end_time: float | None = None
-
-        # Data storage
-        self._samples: list[dict[str, Any]] = []
+        self._start_ns: int | None = None
+        self._end_ns: int | None = None
+
+        # Data storage: samples are streamed to the CSV as rows in a fixed
+        # column order (``_fields``) frozen from the first sample and widened
+        # only if a new key appears; only running statistics stay in memory.
+        # The split into metric and counter columns is derived per schema.
+        self._fields: tuple[str, ...] | None = None
+        self._field_index: dict[str, int] = {}
+        self._metric_fields: tuple[str, ...] = ()
+        self._counter_fields: tuple[str, ...] = ()
+        self._sample_count = 0
+        self._first_timestamp: float | None = None
+        self._last_timestamp: float | None = None
+        self._csv_file: TextIO | None = None
+        self._csv_writer: Any = None
+        self._csv_pending = 0
+        self._csv_failed = False
+        self._stats: dict[str, OnlineStat] = {}
+        self._counter_totals: dict[str, dict[str, int]] = {}
+        self._prev_counters: dict[str, int] = {}
+        self._prev_counter_ns: int | None = None
         self._process: psutil.Process | None = None
+        self._warmup = False
 
         # Output file paths
         self._metrics_csv_path = self._get_output_path("metrics.csv")
@@ -97,9 +371,41 @@ class PerformanceMonitor:
             logger.warning("psutil not available, skipping performance monitoring")
             return
 
+        self._begin_run(process_pid)
+        if self.shared:
+            _SHARED_SAMPLER.register(self)
+        else:
+            # Start monitoring thread
+            self._monitor_thread = threading.Thread(
+                target=self._monitor_loop, daemon=True, name="PerformanceMonitor"
+            )
+            self._monitor_thread.start()
+
+        logger.info(
+            f"Started performance monitoring (interval: {self.interval_seconds}s, "
+            f"process: {process_pid or 'system'})"
+        )
+
+    def _begin_run(self, process_pid: int | None) -> None:
+        """Reset the per-run state and attach to the monitored process."""
         self._monitoring = True
+        self._stop_event.clear()
         self._start_time = time.time()
-        self._samples.clear()
+        self._start_ns = time.monotonic_ns()
+        self._end_ns = None
+        self._close_metrics_csv()
+        self._fields = None
+        self._field_index = {}
+        self._metric_fields = ()
+        self._counter_fields = ()
+        self._sample_count = 0
+        self._first_timestamp = None
+        self._last_timestamp = None
+        self._csv_failed = False
+        self._stats = {}
+        self._counter_totals = {}
+        self._prev_counters = {}
+        self._prev_counter_ns = None
 
         # Set up process monitoring if PID provided
         if process_pid:
@@ -111,16 +417,9 @@ class PerformanceMonitor:
                 )
                 self._process = None
 
-        # Start monitoring thread
-        self._monitor_thread = threading.Thread(
-            target=self._monitor_loop, daemon=True, name="PerformanceMonitor"
-        )
-        self._monitor_thread.start()
-
-        logger.info(
-            f"Started performance monitoring (interval: {self.interval_seconds}s, "
-            f"process: {process_pid or 'system'})"
-        )
+        # cpu_percent() reports 0.0 on its first call; the monitor thread primes
+        # the counters and drops its first sample, whose CPU interval is ~zero
+        self._warmup = True
 
     def stop_monitoring(self) -> dict[str, Any]:
         """
@@ -134,10 +433,14 @@ class PerformanceMonitor:
             return {}
 
         self._monitoring = False
+        self._stop_event.set()
         self._end_time = time.time()
+        self._end_ns = time.monotonic_ns()
 
-        # Wait for monitor thread to finish
-        if self._monitor_thread and self._monitor_thread.is_alive():
+        # Wait for the closing sample
+        if self.shared:
+            _SHARED_SAMPLER.unregister(self)
+        elif self._monitor_thread and self._monitor_thread.is_alive():
             self._monitor_thread.join(timeout=2.0)
 
         # Generate summary
@@ -150,39 +453,110 @@ class PerformanceMonitor:
         logger.info(
             f"Stopped performance monitoring. "
             f"Duration: {summary.get('duration_seconds', 0):.2f}s, "
-            f"Samples: {len(self._samples)}"
+            f"Samples: {self._sample_count}"
         )
 
         return summary
 
     def _monitor_loop(self) -> None:
-        """Main monitoring loop running in background thread."""
+        """
+        Main monitoring loop running in background thread.
+
+        Bursts are scheduled against a monotonic deadline so the period stays
+        at ``interval_seconds`` regardless of how long collection takes. When
+        the sampler falls behind, the deadline is re-synced instead of
+        sleeping less and less to catch up. Waits are on the stop event, so
+        ``stop_monitoring`` wakes the thread immediately instead of joining
+        on a sleep; the thread then takes one closing sample covering the time
+        since the last one, so even very short runs record data.
+        """
+        # psutil keeps the system cpu_percent() baseline per calling thread
+        self._prime_cpu_counters()
+        next_t = time.monotonic()
+        burst_id = 0
         while self._monitoring:
-            try:
-                sample = self._collect_sample()
-                if sample:
-                    self._samples.append(sample)
-            except Exception as e:
-                logger.warning(f"Error collecting performance sample: {e}")
+            for i in range(self.burst_samples):
+                if i:
+                    delay = next_t + i * self.burst_interval - time.monotonic()
+                    if delay > 0:
+                        self._stop_event.wait(delay)
+                    if not self._monitoring:
+                        break
+                self._take_sample(burst_id)
+            burst_id += 1
+            if not self._monitoring:
+                break
+
+            next_t += self.interval_seconds
+            delay = next_t - time.monotonic()
+            if delay > 0:
+                self._stop_event.wait(delay)
+            else:
+                next_t = time.monotonic()
+
+        self._warmup = False
+        self._take_sample(burst_id)
+
+    def _take_sample(
+        self,
+        burst_id: int,
+        system_metrics: dict[str, Any] | None = None,
+        active_regions: str | None = None,
+    ) -> None:
+        """Collect and store one sample, discarding the warm-up sample."""
+        try:
+            sample = self._collect_sample(system_metrics)
+            if sample and self._warmup:
+                self._warmup = False
+            elif sample:
+                sample["burst_id"] = burst_id
+                if active_regions is not None:
+                    sample["active_regions"] = active_regions
+                self._append_sample(sample)
+        except Exception as e:
+            logger.warning(f"Error collecting performance sample: {e}")
 
-            time.sleep(self.interval_seconds)
+    def _prime_cpu_counters(self) -> None:
+        """Make the first real cpu_percent() reading measure a full interval."""
+        try:
+            self._cpu_percent(interval=None)
+            if self._process:
+                self._process.cpu_percent()
+        except Exception as e:
+            logger.debug(f"Failed to prime CPU counters: {e}")
 
-    def _collect_sample(self) -> dict[str, Any] | None:
+    def _collect_sample(
+        self, system_metrics: dict[str, Any] | None = None
+    ) -> dict[str, Any] | None:
         """
         Collect a single performance sample.
 
+        ``timestamp`` is the wall-clock time of the sample; ``relative_time`` is
+        measured on the monotonic clock so NTP steps cannot distort the axis.
+
+        Args:
+            system_metrics: System-wide metrics already collected for this
+                tick by the shared sampler; collected here when None
+
         Returns:
             Dictionary with timestamp and performance metrics, or None on error
         """
         try:
+            timestamp_ns = time.monotonic_ns()
             timestamp = time.time()
+            relative_ns = (
+                timestamp_ns - self._start_ns if self._start_ns is not None else 0
+            )
             sample = {
                 "timestamp": timestamp,
-                "relative_time": timestamp - (self._start_time or timestamp),
+                "timestamp_ns": timestamp_ns,
+                "relative_time": relative_ns / 1e9,
             }
 
             # System-wide metrics
-            sample.update(self._collect_system_metrics())
+            if system_metrics is None:
+                system_metrics = self._collect_system_metrics()
+            sample.update(system_metrics)
 
             # Process-specific metrics if available
             if self._process:
@@ -190,29 +564,121 @@ class PerformanceMonitor:
                 if process_metrics:
                     sample.update(process_metrics)
 
+            self._add_io_rates(sample, timestamp_ns)
+
         except Exception as e:
             logger.debug(f"Failed to collect sample: {e}")
             return None
         else:
             return sample
 
+    def _add_io_rates(self, sample: dict[str, Any], timestamp_ns: int) -> None:
+        """
+        Add byte-per-second rates derived from the cumulative I/O counters.
+
+        Rates are the counter delta since the previous sample divided by the
+        elapsed monotonic time. They are None on the first sample and after a
+        counter reset, when there is no meaningful delta. Unless ``full_io``
+        is set, counter groups that did not move are dropped from the sample
+        and only their zero rates remain.
+        """
+        prev = self._prev_counters
+        elapsed = (
+            (timestamp_ns - self._prev_counter_ns) / 1e9
+            if self._prev_counter_ns is not None
+            else 0.0
+        )
+        unchanged = set()
+        for counter, rate_field in _RATE_FIELDS.items():
+            value = sample.get(counter)
+            if value is None:
+                continue
+            prev_value = prev.get(counter)
+            if prev_value is not None and elapsed > 0 and value >= prev_value:
+                sample[rate_field] = (value - prev_value) / elapsed
+                if value == prev_value:
+                    unchanged.add(counter)
+            else:
+                sample[rate_field] = None
+            prev[counter] = value
+        self._prev_counter_ns = timestamp_ns
+
+        if self.full_io or not unchanged:
+            return
+        for group in _COUNTER_GROUPS:
+            if all(field in unchanged for field in group if field in _RATE_FIELDS):
+                for field in group:
+                    sample.pop(field, None)
+
+    def _append_sample(self, sample: dict[str, Any]) -> None:
+        """
+        Stream a collected sample to the CSV as a row in the frozen column order.
+
+        Keys missing from the sample are written as empty cells. A key that is
+        not yet part of the schema widens it and pads the rows already written.
+        Numeric values also update the running statistic for their metric,
+        except cumulative I/O counters, which only track start and end values.
+        """
+        widened = False
+        if self._fields is None or not sample.keys() <= self._field_index.keys():
+            new_fields = [key for key in sample if key not in self._field_index]
+            widened = self._fields is not None
+            self._fields = (*(self._fields or ()), *new_fields)
+            self._field_index = {key: i for i, key in enumerate(self._fields)}
+            self._metric_fields = tuple(
+                key
+                for key in self._fields
+                if key not in _NON_METRIC_FIELDS and key not in _COUNTER_FIELDS
+            )
+            self._counter_fields = tuple(
+                key for key in self._fields if key in _COUNTER_FIELDS
+            )
+
+        self._write_csv_row(tuple(map(sample.get, self._fields)), widened)
+
+        self._sample_count += 1
+        timestamp = sample.get("timestamp")
+        if self._first_timestamp is None:
+            self._first_timestamp = timestamp
+        self._last_timestamp = timestamp
+
+        for key in self._counter_fields:
+            value = sample.get(key)
+            if not isinstance(value, int | float):
+                continue
+            totals = self._counter_totals.get(key)
+            if totals is None:
+                self._counter_totals[key] = {"start": value, "end": value}
+            else:
+                totals["end"] = value
+
+        stats = self._stats
+        for key in self._metric_fields:
+            value = sample.get(key)
+            if not isinstance(value, int | float):
+                continue
+            stat = stats.get(key)
+            if stat is None:
+                stat = stats[key] = OnlineStat()
+            stat.update(value)
+
     def _collect_system_metrics(self) -> dict[str, Any]:
         """Collect system-wide performance metrics."""
         metrics = {}
 
         try:
             # CPU utilization
-            cpu_percent = psutil.cpu_percent(interval=0)
+            cpu_percent = self._cpu_percent(interval=0)
             metrics["system_cpu_percent"] = cpu_percent
 
             # Memory usage
-            memory = psutil.virtual_memory()
+            memory = self._virtual_memory()
             metrics["system_memory_total"] = memory.total
             metrics["system_memory_available"] = memory.available
             metrics["system_memory_percent"] = memory.percent
 
             # Disk I/O
-            disk_io = psutil.disk_io_counters()
+            disk_io = self._disk_io_counters()
             if disk_io:
                 metrics["system_disk_read_bytes"] = disk_io.read_bytes
                 metrics["system_disk_write_bytes"] = disk_io.write_bytes
@@ -220,13 +686,11 @@ class PerformanceMonitor:
                 metrics["system_disk_write_count"] = disk_io.write_count
 
             # Network I/O (optional)
-            try:
-                network_io = psutil.net_io_counters()
+            if self._net_io_counters is not None:
+                network_io = self._net_io_counters()
                 if network_io:
                     metrics["system_network_bytes_sent"] = network_io.bytes_sent
                     metrics["system_network_bytes_recv"] = network_io.bytes_recv
-            except AttributeError:
-                pass  # Network counters not available on all systems
 
         except Exception as e:
             logger.debug(f"Error collecting system metrics: {e}")
@@ -247,34 +711,38 @@ class PerformanceMonitor:
 
             metrics = {}
 
-            # CPU usage
-            try:
-                cpu_percent = self._process.cpu_percent()
-                metrics["process_cpu_percent"] = cpu_percent
-            except Exception:  # nosec B110
-                pass
-
-            # Memory usage
-            try:
-                memory_info = self._process.memory_info()
-                metrics["process_memory_rss"] = memory_info.rss
-                metrics["process_memory_vms"] = memory_info.vms
-
-                # Memory percent
-                memory_percent = self._process.memory_percent()
-                metrics["process_memory_percent"] = memory_percent
-            except Exception:  # nosec B110
-                pass
-
-            # I/O counters
-            try:
-                io_counters = self._process.io_counters()
-                metrics["process_io_read_bytes"] = io_counters.read_bytes
-                metrics["process_io_write_bytes"] = io_counters.write_bytes
-                metrics["process_io_read_count"] = io_counters.read_count
-                metrics["process_io_write_count"] = io_counters.write_count
-            except Exception:  # nosec B110
-                pass  # I/O counters not available on all platforms
+            # oneshot() caches the process stat reads shared by the CPU and
+            # memory accessors; io_counters() still reads its own source
+            # (/proc/<pid>/io on Linux)
+            with self._process.oneshot():
+                # CPU usage
+                try:
+                    cpu_percent = self._process.cpu_percent()
+                    metrics["process_cpu_percent"] = cpu_percent
+                except Exception:  # nosec B110
+                    pass
+
+                # Memory usage
+                try:
+                    memory_info = self._process.memory_info()
+                    metrics["process_memory_rss"] = memory_info.rss
+                    metrics["process_memory_vms"] = memory_info.vms
+
+                    # Memory percent
+                    memory_percent = self._process.memory_percent()
+                    metrics["process_memory_percent"] = memory_percent
+                except Exception:  # nosec B110
+                    pass
+
+                # I/O counters
+                try:
+                    io_counters = self._process.io_counters()
+                    metrics["process_io_read_bytes"] = io_counters.read_bytes
+                    metrics["process_io_write_bytes"] = io_counters.write_bytes
+                    metrics["process_io_read_count"] = io_counters.read_count
+                    metrics["process_io_write_count"] = io_counters.write_count
+                except Exception:  # nosec B110
+                    pass  # I/O counters not available on all platforms
 
         except Exception:
             logger.debug("Error collecting process metrics")
@@ -285,132 +753,210 @@ class PerformanceMonitor:
 
     def _generate_summary(self) -> dict[str, Any]:
         """Generate summary statistics from collected samples."""
-        if not self._samples:
+        if not self._sample_count:
             return {"error": "No samples collected"}
 
         summary = {
             "monitoring_config": {
                 "interval_seconds": self.interval_seconds,
+                "burst_samples": self.burst_samples,
+                "burst_interval": self.burst_interval,
                 "scenario_suffix": self.scenario_suffix,
                 "output_dir": str(self.output_dir),
             },
             "timing": {
                 "start_time": self._start_time,
                 "end_time": self._end_time,
-                "duration_seconds": (self._end_time or 0) - (self._start_time or 0),
+                "duration_seconds": self._duration_seconds(),
             },
             "samples": {
-                "count": len(self._samples),
-                "first_timestamp": self._samples[0]["timestamp"],
-                "last_timestamp": self._samples[-1]["timestamp"],
+                "count": self._sample_count,
+                "first_timestamp": self._first_timestamp,
+                "last_timestamp": self._last_timestamp,
             },
             "metrics": {},
+            "totals": {
+                field: {**totals, "delta": totals["end"] - totals["start"]}
+                for field, totals in self._counter_totals.items()
+            },
         }
 
-        # Calculate statistics for each numeric metric
-        numeric_fields = self._get_numeric_fields()
-        metrics_dict: dict[str, dict[str, float]] = {}
-        for field in numeric_fields:
-            values = [
-                s[field] for s in self._samples if field in s and s[field] is not None
-            ]
-            if values:
-                metrics_dict[field] = self._calculate_stats(values)
-        summary["metrics"] = metrics_dict
+        # Read out the running statistics of each numeric metric
+        summary["metrics"] = {
+            field: self._calculate_stats(self._stats[field])
+            for field in self._get_numeric_fields()
+        }
 
         return summary
 
-    def _get_numeric_fields(self) -> list[str]:
-        """Get list of numeric field names from samples."""
-        if not self._samples:
-            return []
+    def _duration_seconds(self) -> float:
+        """Elapsed monitoring time, preferring the monotonic clock."""
+        if self._start_ns is not None and self._end_ns is not None:
+            return (self._end_ns - self._start_ns) / 1e9
+        return (self._end_time or 0) - (self._start_time or 0)
 
-        numeric_fields = []
-        for key, value in self._samples[0].items():
-            if key in ["timestamp", "relative_time"]:
-                continue
-            if isinstance(value, int | float):
-                numeric_fields.append(key)
+    def _get_numeric_fields(self) -> tuple[str, ...]:
+        """Get the numeric metric field names in column order."""
+        return tuple(field for field in self._metric_fields if field in self._stats)
 
-        return numeric_fields
+    def _calculate_stats(
+        self, values: OnlineStat | list[int | float]
+    ) -> dict[str, float]:
+        """
+        Calculate min, max, mean, and percentiles.
 
-    def _calculate_stats(self, values: list[int | float]) -> dict[str, float]:
-        """Calculate min, max, mean, and percentiles for a list of values."""
+        Args:
+            values: Running statistic of a metric, or a plain list of values
+
+        Returns:
+            Dictionary of statistics, empty if there are no values
+        """
         if not values:
             return {}
 
-        values = sorted(values)
-        n = len(values)
+        if isinstance(values, OnlineStat):
+            stat = values
+        else:
+            stat = OnlineStat(exact_limit=len(values))
+            for value in values:
+                stat.update(value)
 
         stats = {
-            "min": float(min(values)),
-            "max": float(max(values)),
-            "mean": sum(values) / n,
-            "count": n,
+            "min": float(stat.min),
+            "max": float(stat.max),
+            "mean": stat.mean,
+            "count": stat.n,
         }
 
         # Percentiles
-        if n >= 2:
-            stats["p50"] = self._percentile(values, 0.5)
-            stats["p90"] = self._percentile(values, 0.9)
-            stats["p95"] = self._percentile(values, 0.95)
+        if stat.n >= 2:
+            if stat.estimators is not None:
+                stats.update(
+                    (name, estimator.value())
+                    for (name, _), estimator in zip(
+                        _PERCENTILES, stat.estimators, strict=True
+                    )
+                )
+            else:
+                stats.update(self._exact_percentiles(stat.values))
 
         return stats
 
+    def _exact_percentiles(self, values: list[int | float]) -> dict[str, float]:
+        """
+        Calculate the reported percentiles of buffered values in one pass.
+
+        The buffer holds at most a reservoir's worth of values, so one sort
+        shared by all percentiles is cheap; NumPy is deliberately not used,
+        since importing it would slow down every CLI start.
+        """
+        ordered = sorted(values)
+        return {name: self._percentile(ordered, q) for name, q in _PERCENTILES}
+
     def _percentile(self, values: list[int | float], p: float) -> float:
         """Calculate percentile from sorted values."""
         if not values:
             return 0.0
 
-        index = p * (len(values) - 1)
-        if index.is_integer():
-            return float(values[int(index)])
-        else:
-            lower = int(index)
-            upper = lower + 1
-            weight = index - lower
-            return float(values[lower] * (1 - weight) + values[upper] * weight)
-
-    def _write_metrics_csv(self) -> None:
-        """Write time series metrics to CSV file."""
-        if not self._samples:
-            logger.warning("No samples to write to CSV")
+        # A zero weight reproduces the exact rank, so no separate case is needed
+        last = len(values) - 1
+        index = p * last
+        lower = int(index)
+        upper = min(lower + 1, last)
+        weight = index - lower
+        return float(values[lower] * (1.0 - weight) + values[upper] * weight)
+
+    def _write_csv_row(self, row: tuple[Any, ...], widened: bool) -> None:
+        """Append one row to the metrics CSV, opening it on the first row."""
+        if self._csv_failed:
             return
 
         try:
-            # Ensure output directory exists
-            self.output_dir.mkdir(parents=True, exist_ok=True)
+            if self._csv_file is None:
+                # Ensure output directory exists
+                self.output_dir.mkdir(parents=True, exist_ok=True)
+                self._open_metrics_csv()
+                self._csv_writer.writerow(self._fields)
+            elif widened:
+                self._rewrite_metrics_csv_header()
+
+            self._csv_writer.writerow(row)
+            self._csv_pending += 1
+            if self._csv_pending >= CSV_FLUSH_EVERY:
+                self._csv_file.flush()
+                self._csv_pending = 0
 
-            # Get all possible field names
-            all_fields: set[str] = set()
-            for sample in self._samples:
-                all_fields.update(sample.keys())
+        except Exception:
+            logger.exception("Failed to write metrics CSV")
+            self._csv_failed = True
+            self._close_metrics_csv()
+
+    def _open_metrics_csv(self) -> None:
+        """Open the metrics CSV with a large write buffer."""
+        self._csv_file = open(  # noqa: SIM115 - held open while streaming
+            self._metrics_csv_path,
+            "w",
+            newline="",
+            encoding="utf-8",
+            buffering=1 << 16,
+        )
+        self._csv_writer = csv.writer(self._csv_file)
+        self._csv_pending = 0
+
+    def _rewrite_metrics_csv_header(self) -> None:
+        """Rewrite the CSV with the widened header, padding earlier rows."""
+        self._csv_file.close()
+        with open(self._metrics_csv_path, newline="", encoding="utf-8") as csvfile:
+            reader = csv.reader(csvfile)
+            next(reader, None)
+            rows = list(reader)
+
+        width = len(self._fields)
+        self._open_metrics_csv()
+        self._csv_writer.writerow(self._fields)
+        self._csv_writer.writerows(row + [""] * (width - len(row)) for row in rows)
+
+    def _close_metrics_csv(self) -> None:
+        """Flush and close the streamed metrics CSV if it is open."""
+        if self._csv_file is None:
+            return
 
-            # Sort fields for consistent output
-            fieldnames = sorted(all_fields)
+        csv_file, self._csv_file, self._csv_writer = self._csv_file, None, None
+        try:
+            csv_file.close()
+        except Exception:
+            logger.exception("Failed to write metrics CSV")
+            self._csv_failed = True
 
-            with open(
-                self._metrics_csv_path, "w", newline="", encoding="utf-8"
-            ) as csvfile:
-                writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-                writer.writeheader()
-                writer.writerows(self._samples)
+    def _write_metrics_csv(self) -> None:
+        """Finish the time series metrics CSV streamed during monitoring."""
+        if not self._sample_count:
+            logger.warning("No samples to write to CSV")
+            return
 
+        self._close_metrics_csv()
+        if not self._csv_failed:
             logger.info(
-                f"Wrote {len(self._samples)} samples to {self._metrics_csv_path}"
+                f"Wrote {self._sample_count} samples to {self._metrics_csv_path}"
             )
 
-        except Exception:
-            logger.exception("Failed to write metrics CSV")
-
     def _write_summary_json(self, summary: dict[str, Any]) -> None:
-        """Write summary statistics to JSON file."""
+        """Write summary statistics to JSON file, using orjson when installed."""
         try:
             # Ensure output directory exists
             self.output_dir.mkdir(parents=True, exist_ok=True)
 
-            with open(self._summary_json_path, "w", encoding="utf-8") as jsonfile:
-                json.dump(summary, jsonfile, indent=2, default=str)
+            if ORJSON_AVAILABLE:
+                self._summary_json_path.write_bytes(
+                    orjson.dumps(
+                        summary,
+                        default=str,
+                        option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY,
+                    )
+                )
+            else:
+                with open(self._summary_json_path, "w", encoding="utf-8") as jsonfile:
+                    json.dump(summary, jsonfile, indent=2, default=str)
 
             logger.info(f"Wrote summary to {self._summary_json_path}")
 
@@ -435,13 +981,139 @@ class PerformanceMonitor:
     @property
     def sample_count(self) -> int:
         """Number of samples collected so far."""
-        return len(self._samples)
+        return self._sample_count
+
+
+class _Region:
+    """Sampling state of one monitor registered with the shared sampler."""
+
+    __slots__ = ("closed", "deadline", "monitor", "ticks")
+
+    def __init__(self, monitor: PerformanceMonitor, deadline: float):
+        self.monitor = monitor
+        self.deadline = deadline
+        self.ticks = 0
+        self.closed: threading.Event | None = None
+
+
+class _SharedSampler:
+    """
+    One background thread sampling every registered monitor.
+
+    Monitors created with ``shared=True`` register as regions instead of
+    starting a thread each. Every tick the thread collects the system-wide
+    metrics once and hands them to the regions whose deadline has passed, so
+    concurrent regions share one thread and one ``cpu_percent`` baseline.
+    Each sample records the tags (scenario suffixes) of the regions active
+    at the time in ``active_regions``. The thread exits when the last region
+    unregisters and is restarted by the next registration.
+    """
+
+    def __init__(self):
+        """Initialize an idle sampler."""
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._regions: dict[PerformanceMonitor, _Region] = {}
+        self._thread: threading.Thread | None = None
+
+    def register(self, monitor: PerformanceMonitor) -> None:
+        """Start sampling a monitor whose run state has been reset."""
+        # The shared thread keeps its own system baseline; priming here gives
+        # the process counter its first reading, so no sample is dropped
+        monitor._prime_cpu_counters()
+        monitor._warmup = False
+
+        with self._lock:
+            deadline = time.monotonic() + monitor.interval_seconds
+            self._regions[monitor] = _Region(monitor, deadline)
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._sample_loop,
+                    daemon=True,
+                    name="SharedPerformanceMonitor",
+                )
+                self._thread.start()
+        self._wake.set()
+
+    def unregister(self, monitor: PerformanceMonitor) -> None:
+        """Take a closing sample for a monitor and stop sampling it."""
+        with self._lock:
+            region = self._regions.get(monitor)
+            if region is None:
+                return
+            region.closed = closed = threading.Event()
+        self._wake.set()
+        if not closed.wait(timeout=2.0):
+            with self._lock:
+                if self._regions.get(monitor) is region:
+                    del self._regions[monitor]
+
+    def _sample_loop(self) -> None:
+        """Sample due regions until none are registered."""
+        try:
+            psutil.cpu_percent(interval=None)
+        except Exception as e:
+            logger.debug(f"Failed to prime CPU counters: {e}")
+
+        while True:
+            self._wake.clear()
+            with self._lock:
+                if not self._regions:
+                    self._thread = None
+                    return
+                now = time.monotonic()
+                tags = ";".join(
+                    monitor.scenario_suffix or "default" for monitor in self._regions
+                )
+                due = [
+                    region
+                    for region in self._regions.values()
+                    if region.closed or region.deadline <= now
+                ]
+
+            if due:
+                system_metrics = due[0].monitor._collect_system_metrics()
+                for region in due:
+                    # Skip regions dropped by a timed-out unregister meanwhile
+                    with self._lock:
+                        if self._regions.get(region.monitor) is not region:
+                            continue
+                    region.monitor._take_sample(region.ticks, system_metrics, tags)
+                    region.ticks += 1
+                    # The region may have been closed while sampling; drop it
+                    # before signalling, so a stopped monitor is never sampled
+                    # again (which would reopen and truncate its CSV)
+                    with self._lock:
+                        closed = region.closed
+                        if closed is not None:
+                            del self._regions[region.monitor]
+                    if closed is not None:
+                        closed.set()
+                        continue
+                    region.deadline += region.monitor.interval_seconds
+                    if region.deadline <= now:
+                        region.deadline = now + region.monitor.interval_seconds
+
+            with self._lock:
+                next_deadline = min(
+                    (region.deadline for region in self._regions.values()),
+                    default=None,
+                )
+            if next_deadline is not None:
+                self._wake.wait(max(0.0, next_deadline - time.monotonic()))
+
+
+# Process-wide sampler used by monitors created with ``shared=True``
+_SHARED_SAMPLER = _SharedSampler()
 
 
 def create_monitor(
     interval_seconds: float = 0.5,
     output_dir: str | Path | None = None,
     scenario_suffix: str = "",
+    *,
+    full_io: bool = False,
+    shared: bool = False,
 ) -> PerformanceMonitor | None:
     """
     Create a performance monitor instance with error handling.
@@ -450,6 +1122,8 @@ def create_monitor(
         interval_seconds: Sampling interval in seconds (default: 0.5)
         output_dir: Directory to write metrics files
         scenario_suffix: Suffix for scenario-specific output files
+        full_io: Write the cumulative I/O counters on every sample
+        shared: Sample from the shared sampler thread
 
     Returns:
         PerformanceMonitor instance, or None if psutil is not available
@@ -466,6 +1140,8 @@ def create_monitor(
             interval_seconds=interval_seconds,
             output_dir=output_dir,
             scenario_suffix=scenario_suffix,
+            full_io=full_io,
+            shared=shared,
         )
     except ImportError as e:
         logger.warning(f"Failed to create performance monitor: {e}")
@@ -490,9 +1166,18 @@ class MonitoredOperation:
         output_dir: str | Path | None = None,
         scenario_suffix: str = "",
         process_pid: int | None = None,
+        *,
+        full_io: bool = False,
+        shared: bool = False,
     ):
         """Initialize monitored operation context."""
-        self.monitor = create_monitor(interval_seconds, output_dir, scenario_suffix)
+        self.monitor = create_monitor(
+            interval_seconds,
+            output_dir,
+            scenario_suffix,
+            full_io=full_io,
+            shared=shared,
+        )
         self.process_pid = process_pid
         self.summary: dict[str, Any] = {}
 
@@ -5,34 +5,214 @@ Generates run manifests (JSON) and HTML reports with performance metrics,
 scenario summaries, and provenance information.
 """
 
-import csv
+import contextlib
+import copy
+import functools
+import gzip
 import hashlib
+import html
+import importlib.metadata
+import importlib.util
+import io
 import json
 import logging
+import mmap
+import os
 import platform
 import sys
+from collections.abc import Callable
 from datetime import datetime
 from pathlib import Path
-from typing import Any
+from types import MappingProxyType
+from typing import Any, Final
 
 import psutil
 import yaml
 
 logger = logging.getLogger(__name__)
 
-# Optional dependencies with fallbacks
-PLOTLY_AVAILABLE = False
-go: Any = None
-make_subplots: Any = None
+# Write buffer for streaming the HTML report, which can run to megabytes
+_HTML_WRITE_BUFFER = 1 << 20
+
+# Without hashlib.file_digest, files up to this size are hashed from a memory
+# map in a single update; larger files are read in chunks of the given size
+_CHECKSUM_MMAP_LIMIT = 512 << 20
+_CHECKSUM_CHUNK_SIZE = 1 << 20
+
+# Static HTML report fragments; only the templates are formatted per report
+_REPORT_CSS: Final = """
+        body {
+            font-family: Arial, sans-serif;
+            margin: 20px;
+            background-color: #f5f5f5;
+        }
+        .container {
+            max-width: 1200px;
+            margin: auto;
+            background: white;
+            padding: 20px;
+            box-shadow: 0 0 10px rgba(0,0,0,0.1);
+        }
+        h1, h2, h3 {
+            color: #333;
+        }
+        table {
+            width: 100%;
+            border-collapse: collapse;
+            margin: 20px 0;
+        }
+        table, th, td {
+            border: 1px solid #ddd;
+        }
+        th, td {
+            padding: 12px;
+            text-align: left;
+        }
+        th {
+            background-color: #4CAF50;
+            color: white;
+        }
+        tr:nth-child(even) {
+            background-color: #f2f2f2;
+        }
+        .success {
+            color: green;
+            font-weight: bold;
+        }
+        .failure {
+            color: red;
+            font-weight: bold;
+        }
+        .summary-box {
+            background-color: #e7f3ff;
+            padding: 15px;
+            border-left: 4px solid #2196F3;
+            margin: 20px 0;
+        }
+        .chart-container {
+            margin: 30px 0;
+        }
+"""
+_HTML_HEAD: Final = (
+    """
+<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>EddyPro Batch Processing Report</title>
+    <style>"""
+    + _REPORT_CSS
+    + """    </style>
+</head>
+<body>
+    <div class="container">
+"""
+)
+_HTML_FOOT: Final = """
+    </div>
+</body>
+</html>
+"""
+_RUN_SUMMARY_TEMPLATE: Final = """
+        <h1>EddyPro Batch Processing Report</h1>
+        <div class="summary-box">
+            <h2>Run Summary</h2>
+            <p><strong>Run ID:</strong> {run_id}</p>
+            <p><strong>Timestamp:</strong> {timestamp}</p>
+            <p><strong>Duration:</strong> {duration:.2f} seconds ({duration_minutes:.2f} minutes)</p>
+            <p><strong>Site ID:</strong> {site_id}</p>
+            <p><strong>Years Processed:</strong> {years}</p>
+            <p><strong>Overall Status:</strong> <span class="{status_class}">{status_text}</span></p>
+        </div>
+"""
+_SCENARIO_TABLE_HEAD: Final = """
+        <h2>Scenario Results</h2>
+        <table>
+            <tr>
+                <th>Scenario</th>
+                <th>Parameters</th>
+                <th>Duration (s)</th>
+                <th>Status</th>
+            </tr>
+"""
+_ENVIRONMENT_TEMPLATE: Final = """
+        <h2>Environment</h2>
+        <div class="summary-box">
+            <p><strong>Python Version:</strong> {python_version}</p>
+            <p><strong>Platform:</strong> {platform}</p>
+            <p><strong>Processor:</strong> {processor}</p>
+        </div>
+"""
+_PACKAGE_TABLE_HEAD: Final = """
+        <h3>Package Versions</h3>
+        <table>
+            <tr>
+                <th>Package</th>
+                <th>Version</th>
+            </tr>
+"""
+
+# HTML report table rows, filled with escaped values
+_SCENARIO_ROW_TEMPLATE: Final = """
+            <tr>
+                <td>{name}</td>
+                <td>{params}</td>
+                <td>{duration:.2f}</td>
+                {status}
+            </tr>
+"""
+_PACKAGE_ROW_TEMPLATE: Final = """
+            <tr>
+                <td>{package}</td>
+                <td>{version}</td>
+            </tr>
+"""
+_STATUS_CELLS: Final = {
+    True: '<td class="success">SUCCESS</td>',
+    False: '<td class="failure">FAILURE</td>',
+}
+
+# Metrics CSV columns plotted in the report charts
+_CHART_COLUMNS = ("cpu_percent", "memory_mb", "read_mb", "write_mb")
+
+# Rendered chart HTML keyed by (series digest, scenario name, plotly.js mode)
+_PLOTLY_HTML_CACHE: dict[tuple[bytes, str, bool | str], str] = {}
+_PLOTLY_HTML_CACHE_SIZE = 32
+
+# Optional dependencies with fallbacks. Plotly takes seconds to import, so it
+# is only located here and imported on first use by _get_plotly().
+PLOTLY_AVAILABLE = importlib.util.find_spec("plotly") is not None
+
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    orjson = None
 
 try:
-    import plotly  # noqa: F401
-    import plotly.graph_objects as go  # type: ignore[no-redef]
-    from plotly.subplots import make_subplots  # type: ignore[no-redef]
+    import blake3
 
-    PLOTLY_AVAILABLE = True
+    BLAKE3_AVAILABLE = True
 except ImportError:
-    logger.debug("Plotly not available; charts will fall back to SVG or none")
+    BLAKE3_AVAILABLE = False
+    blake3 = None
+
+# Versions of the imported packages recorded in the environment info; they
+# cannot change while the process runs. Plotly is added on first use of
+# _environment_info() so that importing this module never touches it.
+_PACKAGE_VERSIONS = MappingProxyType(
+    {
+        "PyYAML": getattr(yaml, "__version__", "unknown"),
+        "psutil": getattr(psutil, "__version__", "unknown"),
+    }
+)
+
+
+# Canonical encoder for config checksums; it holds no per-call state
+_CONFIG_ENCODER = json.JSONEncoder(sort_keys=True, separators=(",", ":"), default=str)
 
 
 def compute_file_checksum(file_path: Path, algorithm: str = "sha256") -> str:
@@ -52,20 +232,89 @@ def compute_file_checksum(file_path: Path, algorithm: str = "sha256") -> str:
     if not file_path.exists():
         raise FileNotFoundError(f"File not found: {file_path}")
 
+    # file_digest (Python 3.11+) hashes in C with its own buffer
+    if hasattr(hashlib, "file_digest"):
+        with file_path.open("rb", buffering=0) as f:
+            return hashlib.file_digest(f, algorithm).hexdigest()
+
     hash_obj = hashlib.new(algorithm)
     with file_path.open("rb") as f:
-        for chunk in iter(lambda: f.read(8192), b""):
-            hash_obj.update(chunk)
+        size = os.fstat(f.fileno()).st_size
+        # Empty files cannot be memory-mapped
+        if 0 < size <= _CHECKSUM_MMAP_LIMIT:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                hash_obj.update(mm)
+        else:
+            for chunk in iter(lambda: f.read(_CHECKSUM_CHUNK_SIZE), b""):
+                hash_obj.update(chunk)
     return hash_obj.hexdigest()
 
 
+def compute_bytes_checksum(data: bytes | memoryview, algorithm: str = "sha256") -> str:
+    """
+    Compute checksum of in-memory data.
+
+    Use this instead of ``compute_file_checksum`` when the content is already
+    loaded, to avoid reading it from disk again.
+
+    Args:
+        data: Bytes to hash
+        algorithm: Hash algorithm (default: sha256)
+
+    Returns:
+        Hexadecimal checksum string
+    """
+    return hashlib.new(algorithm, data).hexdigest()
+
+
+def compute_config_checksum(config: dict[str, Any], algorithm: str = "blake3") -> str:
+    """
+    Compute a deterministic checksum of a configuration dictionary.
+
+    The config is serialized canonically (sorted keys, compact separators)
+    and each encoder chunk is fed to the hasher as it is produced, so the
+    full JSON document is never held in memory. BLAKE3 is used when the
+    ``blake3`` package is installed; otherwise it falls back to 256-bit
+    BLAKE2b. The algorithm is prefixed to the digest so checksums from
+    different environments are not mistaken for each other.
+
+    Args:
+        config: Configuration dictionary
+        algorithm: "blake3" or any ``hashlib`` algorithm name
+
+    Returns:
+        Checksum string of the form ``"<algorithm>:<hexdigest>"``
+    """
+    if algorithm == "blake3" and BLAKE3_AVAILABLE:
+        hasher = blake3.blake3()
+    elif algorithm == "blake3":
+        algorithm = "blake2b"
+        hasher = hashlib.blake2b(digest_size=32)
+    else:
+        hasher = hashlib.new(algorithm)
+
+    for chunk in _CONFIG_ENCODER.iterencode(config):
+        hasher.update(chunk.encode("utf-8"))
+    return f"{algorithm}:{hasher.hexdigest()}"
+
+
 def get_python_environment_info() -> dict[str, Any]:
     """
     Capture Python environment information.
 
+    The information cannot change within a process, so it is gathered once
+    (``platform.processor()`` may spawn a subprocess) and a copy is returned
+    on every call.
+
     Returns:
         Dictionary with Python version, platform, and key package versions
     """
+    return copy.deepcopy(_environment_info())
+
+
+@functools.cache
+def _environment_info() -> dict[str, Any]:
+    """Gather the environment information returned by get_python_environment_info."""
     env_info: dict[str, Any] = {
         "python_version": sys.version,
         "platform": platform.platform(),
@@ -75,25 +324,12 @@ def get_python_environment_info() -> dict[str, Any]:
     }
 
     # Capture versions of key packages
-    package_versions: dict[str, str] = {}
-    try:
-        package_versions["PyYAML"] = getattr(yaml, "__version__", "unknown")
-    except AttributeError:
-        package_versions["PyYAML"] = "unknown"
+    package_versions = dict(_PACKAGE_VERSIONS)
 
+    # Read from the distribution metadata so Plotly itself is not imported
     try:
-        package_versions["psutil"] = getattr(psutil, "__version__", "unknown")
-    except AttributeError:
-        package_versions["psutil"] = "not installed"
-
-    if PLOTLY_AVAILABLE:
-        try:
-            import plotly as plotly_mod  # noqa: PLC0415
-
-            package_versions["plotly"] = plotly_mod.__version__
-        except (ImportError, AttributeError):
-            package_versions["plotly"] = "unknown"
-    else:
+        package_versions["plotly"] = importlib.metadata.version("plotly")
+    except importlib.metadata.PackageNotFoundError:
         package_versions["plotly"] = "not installed"
 
     env_info["package_versions"] = package_versions
@@ -111,6 +347,9 @@ def generate_scenario_manifest(
     success: bool,
     metrics_summary: dict[str, Any] | None = None,
     error_message: str | None = None,
+    *,
+    start_monotonic_ns: int | None = None,
+    end_monotonic_ns: int | None = None,
 ) -> dict[str, Any]:
     """
     Generate a manifest for a single scenario run.
@@ -125,11 +364,15 @@ def generate_scenario_manifest(
         success: Whether the scenario completed successfully
         metrics_summary: Optional performance metrics summary
         error_message: Optional error message if failed
+        start_monotonic_ns: Optional ``time.monotonic_ns()`` at scenario start
+        end_monotonic_ns: Optional ``time.monotonic_ns()`` at scenario end
 
     Returns:
         Dictionary containing scenario manifest data
     """
-    duration_seconds = (end_time - start_time).total_seconds()
+    duration_seconds = compute_duration_seconds(
+        start_time, end_time, start_monotonic_ns, end_monotonic_ns
+    )
 
     manifest = {
         "scenario_name": scenario_name,
@@ -151,6 +394,60 @@ def generate_scenario_manifest(
     return manifest
 
 
+def compute_duration_seconds(
+    start_time: datetime,
+    end_time: datetime,
+    start_monotonic_ns: int | None,
+    end_monotonic_ns: int | None,
+) -> float:
+    """
+    Compute elapsed seconds, preferring the monotonic clock when available.
+
+    Wall-clock differences are subject to clock steps and coarse ticks on
+    Windows, so the monotonic readings are used when both are given.
+
+    Args:
+        start_time: Start timestamp
+        end_time: End timestamp
+        start_monotonic_ns: Optional ``time.monotonic_ns()`` at start
+        end_monotonic_ns: Optional ``time.monotonic_ns()`` at end
+
+    Returns:
+        Elapsed time in seconds
+    """
+    if start_monotonic_ns is not None and end_monotonic_ns is not None:
+        return (end_monotonic_ns - start_monotonic_ns) / 1e9
+    return (end_time - start_time).total_seconds()
+
+
+def _dump_json(obj: Any, output_path: Path) -> None:
+    """
+    Write an object as indented JSON, using orjson when it is installed.
+
+    Values JSON cannot represent natively (paths, dates with the stdlib
+    encoder) are written as strings. The document is serialized in memory,
+    written to a temporary sibling in one call and then moved into place, so
+    an interrupted write never leaves a truncated file behind.
+    """
+    if ORJSON_AVAILABLE:
+        data = orjson.dumps(
+            obj,
+            default=str,
+            option=orjson.OPT_INDENT_2
+            | orjson.OPT_NON_STR_KEYS
+            | orjson.OPT_SERIALIZE_NUMPY,
+        )
+    else:
+        data = json.dumps(obj, indent=2, default=str).encode("utf-8")
+
+    tmp_path = output_path.with_name(output_path.name + ".tmp")
+    try:
+        tmp_path.write_bytes(data)
+        tmp_path.replace(output_path)
+    finally:
+        tmp_path.unlink(missing_ok=True)
+
+
 def write_scenario_manifest(manifest: dict[str, Any], output_path: Path) -> None:
     """
     Write scenario manifest to JSON file.
@@ -160,8 +457,7 @@ def write_scenario_manifest(manifest: dict[str, Any], output_path: Path) -> None
         output_path: Path to write manifest JSON
     """
     try:
-        with output_path.open("w") as f:
-            json.dump(manifest, f, indent=2)
+        _dump_json(manifest, output_path)
         logger.info(f"Scenario manifest written to {output_path}")
     except Exception:
         logger.exception(f"Failed to write scenario manifest to {output_path}")
@@ -222,10 +518,18 @@ def generate_run_manifest(
     overall_success: bool,
     output_dirs: list[Path],
     provenance: dict[str, Any] | None = None,
+    *,
+    include_config_snapshot: bool = False,
+    start_monotonic_ns: int | None = None,
+    end_monotonic_ns: int | None = None,
 ) -> dict[str, Any]:
     """
     Generate a run-level manifest capturing all scenarios and metadata.
 
+    By default the configuration is not embedded; the manifest instead stores
+    a ``config_ref`` to a ``{run_id}_config.yaml`` sidecar, which
+    ``write_run_manifest`` writes next to the manifest when given the config.
+
     Args:
         run_id: Unique identifier for this run
         config: Configuration dictionary used for the run
@@ -238,11 +542,17 @@ def generate_run_manifest(
         overall_success: Whether all scenarios succeeded
         output_dirs: List of output directories created
         provenance: Optional provenance information (git SHA, etc.)
+        include_config_snapshot: Embed the full config as ``config_snapshot``
+            instead of referencing a sidecar file
+        start_monotonic_ns: Optional ``time.monotonic_ns()`` at run start
+        end_monotonic_ns: Optional ``time.monotonic_ns()`` at run end
 
     Returns:
         Dictionary containing run manifest data
     """
-    duration_seconds = (end_time - start_time).total_seconds()
+    duration_seconds = compute_duration_seconds(
+        start_time, end_time, start_monotonic_ns, end_monotonic_ns
+    )
 
     # Collect EddyPro output files from all output directories
     output_files: dict[str, dict[str, list[str]]] = {}
@@ -260,7 +570,6 @@ def generate_run_manifest(
         "site_id": site_id,
         "years_processed": years_processed,
         "config_checksum": config_checksum,
-        "config_snapshot": config,  # Include full config for reproducibility
         "overall_success": overall_success,
         "scenarios": scenarios,
         "output_dirs": [str(d) for d in output_dirs],
@@ -269,251 +578,402 @@ def generate_run_manifest(
         "dry_run": config.get("dry_run", False),  # Track if this was a dry run
     }
 
+    if include_config_snapshot:
+        manifest["config_snapshot"] = config  # Full config for reproducibility
+    else:
+        manifest["config_ref"] = f"{run_id}_config.yaml"
+
     if provenance:
         manifest["provenance"] = provenance
 
     return manifest
 
 
-def write_run_manifest(manifest: dict[str, Any], output_path: Path) -> None:
+def write_run_manifest(
+    manifest: dict[str, Any],
+    output_path: Path,
+    config: dict[str, Any] | None = None,
+) -> None:
     """
     Write run manifest to JSON file.
 
+    When the manifest carries a ``config_ref`` and ``config`` is given, the
+    config is written once as YAML to that path, relative to the manifest.
+
     Args:
         manifest: Run manifest dictionary
         output_path: Path to write manifest JSON
+        config: Configuration dictionary for the ``config_ref`` sidecar
     """
     try:
         output_path.parent.mkdir(parents=True, exist_ok=True)
-        with output_path.open("w") as f:
-            json.dump(manifest, f, indent=2)
+        config_ref = manifest.get("config_ref")
+        if config is not None and config_ref:
+            config_path = output_path.parent / config_ref
+            with config_path.open("w", encoding="utf-8") as f:
+                yaml.safe_dump(config, f, sort_keys=False)
+            logger.info(f"Run config written to {config_path}")
+        _dump_json(manifest, output_path)
         logger.info(f"Run manifest written to {output_path}")
     except Exception:
         logger.exception(f"Failed to write run manifest to {output_path}")
 
 
-def load_metrics_from_csv(metrics_csv_path: Path) -> list[dict[str, Any]]:
+def load_metrics_frame(metrics_csv_path: Path, chart_only: bool = False) -> Any | None:
     """
-    Load performance metrics from CSV file.
+    Load performance metrics from CSV file into a pandas DataFrame.
+
+    The chart columns are parsed as floats in one vectorized pass; cells that
+    are not numbers become NaN and missing chart columns are filled with 0.
 
     Args:
         metrics_csv_path: Path to metrics CSV file
+        chart_only: Only parse the timestamp and chart columns, skipping the
+            remaining metrics columns entirely
 
     Returns:
-        List of metric records as dictionaries
+        DataFrame of metric records, or None if the file cannot be read
     """
-    metrics = []
+    # pandas is only needed here; importing lazily keeps CLI startup fast
+    import pandas as pd  # noqa: PLC0415
+
+    usecols = (
+        (lambda name: name == "timestamp" or name in _CHART_COLUMNS)
+        if chart_only
+        else None
+    )
     try:
-        with metrics_csv_path.open("r") as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                # Convert numeric fields
-                try:
-                    row["cpu_percent"] = float(row.get("cpu_percent", 0))
-                    row["memory_mb"] = float(row.get("memory_mb", 0))
-                    row["read_mb"] = float(row.get("read_mb", 0))
-                    row["write_mb"] = float(row.get("write_mb", 0))
-                except (ValueError, KeyError):
-                    pass
-                metrics.append(row)
+        frame = pd.read_csv(metrics_csv_path, encoding="utf-8", usecols=usecols)
     except Exception:
         logger.warning(f"Failed to load metrics from {metrics_csv_path}")
-    return metrics
+        return None
+
+    for column in _CHART_COLUMNS:
+        if column in frame:
+            frame[column] = pd.to_numeric(frame[column], errors="coerce")
+        else:
+            frame[column] = 0.0
+    return frame
+
+
+def load_metrics_from_csv(metrics_csv_path: Path) -> list[dict[str, Any]]:
+    """
+    Load performance metrics from CSV file.
+
+    Args:
+        metrics_csv_path: Path to metrics CSV file
+
+    Returns:
+        List of metric records as dictionaries
+    """
+    frame = load_metrics_frame(metrics_csv_path)
+    if frame is None:
+        return []
+    records: list[dict[str, Any]] = frame.to_dict("records")
+    return records
+
+
+def _chart_series(metrics: Any) -> tuple[Any, ...]:
+    """Extract the timestamp and chart columns from a DataFrame or records."""
+    if hasattr(metrics, "to_numpy"):
+        timestamps = (
+            metrics["timestamp"].to_numpy()
+            if "timestamp" in metrics
+            else list(range(len(metrics)))
+        )
+        return (
+            timestamps,
+            *(metrics[column].to_numpy() for column in _CHART_COLUMNS),
+        )
+
+    return (
+        [m.get("timestamp", i) for i, m in enumerate(metrics)],
+        *([m.get(column, 0) for m in metrics] for column in _CHART_COLUMNS),
+    )
 
 
 def generate_plotly_charts(
-    metrics: list[dict[str, Any]], scenario_name: str = "Run"
+    metrics: list[dict[str, Any]] | Any,
+    scenario_name: str = "Run",
+    include_plotlyjs: bool | str = "cdn",
 ) -> str | None:
     """
     Generate interactive Plotly charts from metrics data.
 
+    Traces use the WebGL renderer (``Scattergl``) so long runs stay responsive
+    in the browser. The rendered HTML is cached by a BLAKE2b digest of the
+    series together with the scenario name, so rendering unchanged metrics
+    again skips Plotly's serialization.
+
     Args:
-        metrics: List of metric records
+        metrics: List of metric records, or a DataFrame from
+            ``load_metrics_frame`` whose columns are passed to Plotly as arrays
         scenario_name: Name of the scenario for chart title
+        include_plotlyjs: Passed to ``Figure.to_html``; use False when the page
+            already loads plotly.js (see ``plotly_script_tag``)
 
     Returns:
         HTML string containing the Plotly chart, or None if unavailable
     """
-    if not PLOTLY_AVAILABLE or not metrics or go is None or make_subplots is None:
+    if not PLOTLY_AVAILABLE or metrics is None or len(metrics) == 0:
+        return None
+    if _get_plotly()[0] is None:
         return None
 
     try:
-        # Extract time series
-        timestamps = [m.get("timestamp", i) for i, m in enumerate(metrics)]
-        cpu_percent = [m.get("cpu_percent", 0) for m in metrics]
-        memory_mb = [m.get("memory_mb", 0) for m in metrics]
-        read_mb = [m.get("read_mb", 0) for m in metrics]
-        write_mb = [m.get("write_mb", 0) for m in metrics]
-
-        # Create subplots
-        fig = make_subplots(
-            rows=3,
-            cols=1,
-            subplot_titles=(
-                f"{scenario_name} - CPU Usage",
-                f"{scenario_name} - Memory Usage",
-                f"{scenario_name} - Disk I/O",
-            ),
-            vertical_spacing=0.1,
-        )
+        series = _chart_series(metrics)
+        cache_key = (_series_digest(series), scenario_name, include_plotlyjs)
+        html_str = _PLOTLY_HTML_CACHE.get(cache_key)
+        if html_str is None:
+            html_str = _render_plotly_html(series, scenario_name, include_plotlyjs)
+            if len(_PLOTLY_HTML_CACHE) >= _PLOTLY_HTML_CACHE_SIZE:
+                # Evict the oldest entry; dicts keep insertion order
+                _PLOTLY_HTML_CACHE.pop(next(iter(_PLOTLY_HTML_CACHE)), None)
+            _PLOTLY_HTML_CACHE[cache_key] = html_str
+    except Exception:
+        logger.exception("Failed to generate Plotly charts")
+        return None
+    else:
+        return html_str
+
+
+@functools.cache
+def _get_plotly() -> tuple[Any, Any, Any]:
+    """
+    Import Plotly on first use.
+
+    Returns:
+        Tuple of ``plotly.graph_objects``, ``make_subplots`` and
+        ``get_plotlyjs_version``, or Nones if Plotly cannot be imported
+    """
+    try:
+        import plotly.graph_objects as go  # noqa: PLC0415
+        from plotly.offline import get_plotlyjs_version  # noqa: PLC0415
+        from plotly.subplots import make_subplots  # noqa: PLC0415
+    except ImportError:
+        logger.debug("Plotly not available; charts will fall back to SVG or none")
+        return None, None, None
+    return go, make_subplots, get_plotlyjs_version
+
+
+def _series_digest(series: tuple[Any, ...]) -> bytes:
+    """Return a BLAKE2b digest of the chart series' contents."""
+    # numpy ships with pandas; importing lazily keeps CLI startup fast
+    import numpy as np  # noqa: PLC0415
+
+    digest = hashlib.blake2b(digest_size=16)
+    for values in series:
+        array = np.asarray(values)
+        if array.dtype == object:
+            array = array.astype(str)
+        digest.update(f"{array.dtype}:{array.size};".encode())
+        digest.update(array.tobytes())
+    return digest.digest()
+
+
+def _render_plotly_html(
+    series: tuple[Any, ...], scenario_name: str, include_plotlyjs: bool | str
+) -> str:
+    """Build the metrics figure for one scenario and render it to HTML."""
+    timestamps, cpu_percent, memory_mb, read_mb, write_mb = series
+    go, make_subplots, _ = _get_plotly()
+
+    # Create subplots
+    fig = make_subplots(
+        rows=3,
+        cols=1,
+        subplot_titles=(
+            f"{scenario_name} - CPU Usage",
+            f"{scenario_name} - Memory Usage",
+            f"{scenario_name} - Disk I/O",
+        ),
+        vertical_spacing=0.1,
+    )
 
-        # CPU chart
-        fig.add_trace(
-            go.Scatter(
+    # CPU, memory and disk I/O traces, added in one batch
+    fig.add_traces(
+        [
+            go.Scattergl(
                 x=timestamps,
                 y=cpu_percent,
                 mode="lines",
                 name="CPU %",
                 line=dict(color="blue"),
             ),
-            row=1,
-            col=1,
-        )
-
-        # Memory chart
-        fig.add_trace(
-            go.Scatter(
+            go.Scattergl(
                 x=timestamps,
                 y=memory_mb,
                 mode="lines",
                 name="Memory (MB)",
                 line=dict(color="green"),
             ),
-            row=2,
-            col=1,
-        )
-
-        # Disk I/O chart
-        fig.add_trace(
-            go.Scatter(
+            go.Scattergl(
                 x=timestamps,
                 y=read_mb,
                 mode="lines",
                 name="Read (MB)",
                 line=dict(color="orange"),
             ),
-            row=3,
-            col=1,
-        )
-        fig.add_trace(
-            go.Scatter(
+            go.Scattergl(
                 x=timestamps,
                 y=write_mb,
                 mode="lines",
                 name="Write (MB)",
                 line=dict(color="red"),
             ),
-            row=3,
-            col=1,
-        )
+        ],
+        rows=[1, 2, 3, 3],
+        cols=[1, 1, 1, 1],
+    )
 
-        # Update layout
-        fig.update_xaxes(title_text="Sample", row=3, col=1)
-        fig.update_yaxes(title_text="CPU %", row=1, col=1)
-        fig.update_yaxes(title_text="Memory (MB)", row=2, col=1)
-        fig.update_yaxes(title_text="Disk I/O (MB)", row=3, col=1)
+    # Update layout
+    fig.update_xaxes(title_text="Sample", row=3, col=1)
+    fig.update_yaxes(title_text="CPU %", row=1, col=1)
+    fig.update_yaxes(title_text="Memory (MB)", row=2, col=1)
+    fig.update_yaxes(title_text="Disk I/O (MB)", row=3, col=1)
+
+    fig.update_layout(
+        height=900,
+        showlegend=True,
+        template="none",
+        title_text=f"Performance Metrics: {scenario_name}",
+    )
 
-        fig.update_layout(
-            height=900,
-            showlegend=True,
-            title_text=f"Performance Metrics: {scenario_name}",
-        )
+    html_str: str = fig.to_html(full_html=False, include_plotlyjs=include_plotlyjs)
+    return html_str
 
-    except Exception:
-        logger.exception("Failed to generate Plotly charts")
-        return None
-    else:
-        html_str: str = fig.to_html(full_html=False, include_plotlyjs="cdn")
-        return html_str
+
+def plotly_script_tag() -> str:
+    """
+    Return the ``<script>`` tag loading plotly.js from the CDN.
+
+    The version matches the installed plotly package, as with
+    ``include_plotlyjs="cdn"``.
+
+    Returns:
+        HTML script tag, or an empty string if Plotly is unavailable
+    """
+    get_plotlyjs_version = _get_plotly()[2] if PLOTLY_AVAILABLE else None
+    if get_plotlyjs_version is None:
+        return ""
+    return (
+        f'<script src="https://cdn.plot.ly/plotly-{get_plotlyjs_version()}.min.js"'
+        ' charset="utf-8"></script>\n'
+    )
+
+
+def _render_scenario_charts(
+    scenario_metrics: dict[str, list[dict[str, Any]] | Any],
+) -> dict[str, str | None]:
+    """
+    Render the Plotly charts of each scenario, keeping the scenario order.
+
+    Charts are rendered in this process so that unchanged scenarios are
+    served from the chart HTML cache, and no worker processes are forked
+    while the metrics sampler thread may still be running.
+
+    Args:
+        scenario_metrics: Dictionary mapping scenario names to metric records
+            or DataFrames
+
+    Returns:
+        Dictionary mapping scenario names to chart HTML (None if unavailable)
+    """
+    return {
+        name: generate_plotly_charts(metrics, name, include_plotlyjs=False)
+        for name, metrics in scenario_metrics.items()
+    }
 
 
 def generate_html_report(
     run_manifest: dict[str, Any],
-    scenario_metrics: dict[str, list[dict[str, Any]]] | None = None,
+    scenario_metrics: dict[str, list[dict[str, Any]] | Any] | None = None,
     chart_engine: str = "plotly",
     output_path: Path | None = None,
-) -> str:
+    *,
+    return_html: bool = True,
+    gzip_copy: bool = True,
+) -> str | None:
     """
     Generate an HTML report from run manifest and metrics.
 
+    With ``output_path`` the report is streamed to the file fragment by
+    fragment through a large write buffer, so the whole document only exists
+    in memory when it is also returned. For ``.html`` paths the same fragments
+    are also compressed into a ``.html.gz`` copy next to the report.
+
     Args:
         run_manifest: Run manifest dictionary
-        scenario_metrics: Optional dictionary mapping scenario names to metrics
+        scenario_metrics: Optional dictionary mapping scenario names to metric
+            records or DataFrames
         chart_engine: Chart engine to use ("plotly", "svg", or "none")
         output_path: Optional path to write the HTML report
+        return_html: Whether to build and return the HTML string; only
+            applies when ``output_path`` is given
+        gzip_copy: Whether to also write a gzip-compressed copy of the report
 
     Returns:
-        HTML string of the report
+        HTML string of the report, or None if ``return_html`` is False and
+        the report was written to ``output_path``
     """
-    html_parts = []
+    buffer = io.StringIO() if return_html or output_path is None else None
 
-    # HTML header
-    html_parts.append(
-        """
-<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>EddyPro Batch Processing Report</title>
-    <style>
-        body {
-            font-family: Arial, sans-serif;
-            margin: 20px;
-            background-color: #f5f5f5;
-        }
-        .container {
-            max-width: 1200px;
-            margin: auto;
-            background: white;
-            padding: 20px;
-            box-shadow: 0 0 10px rgba(0,0,0,0.1);
-        }
-        h1, h2, h3 {
-            color: #333;
-        }
-        table {
-            width: 100%;
-            border-collapse: collapse;
-            margin: 20px 0;
-        }
-        table, th, td {
-            border: 1px solid #ddd;
-        }
-        th, td {
-            padding: 12px;
-            text-align: left;
-        }
-        th {
-            background-color: #4CAF50;
-            color: white;
-        }
-        tr:nth-child(even) {
-            background-color: #f2f2f2;
-        }
-        .success {
-            color: green;
-            font-weight: bold;
-        }
-        .failure {
-            color: red;
-            font-weight: bold;
-        }
-        .summary-box {
-            background-color: #e7f3ff;
-            padding: 15px;
-            border-left: 4px solid #2196F3;
-            margin: 20px 0;
-        }
-        .chart-container {
-            margin: 30px 0;
-        }
-    </style>
-</head>
-<body>
-    <div class="container">
-"""
-    )
+    if output_path is None:
+        _emit_report(buffer.write, run_manifest, scenario_metrics, chart_engine)
+        return buffer.getvalue()
+
+    try:
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        with contextlib.ExitStack() as stack:
+            f = stack.enter_context(
+                output_path.open("w", encoding="utf-8", buffering=_HTML_WRITE_BUFFER)
+            )
+            sinks = [f.write]
+            if gzip_copy and output_path.suffix == ".html":
+                # mtime=0 keeps the compressed bytes identical across runs
+                gz = stack.enter_context(
+                    io.TextIOWrapper(
+                        gzip.GzipFile(
+                            output_path.with_suffix(".html.gz"),
+                            "wb",
+                            compresslevel=6,
+                            mtime=0,
+                        ),
+                        encoding="utf-8",
+                    )
+                )
+                sinks.append(gz.write)
+            if buffer is not None:
+                sinks.append(buffer.write)
+
+            if len(sinks) == 1:
+                write = sinks[0]
+            else:
+
+                def write(fragment: str) -> None:
+                    for sink in sinks:
+                        sink(fragment)
+
+            _emit_report(write, run_manifest, scenario_metrics, chart_engine)
+        logger.info(f"HTML report written to {output_path}")
+    except Exception:
+        logger.exception(f"Failed to write HTML report to {output_path}")
+        if buffer is not None:
+            buffer = io.StringIO()
+            _emit_report(buffer.write, run_manifest, scenario_metrics, chart_engine)
+
+    return buffer.getvalue() if buffer is not None else None
+
+
+def _emit_report(
+    write: Callable[[str], Any],
+    run_manifest: dict[str, Any],
+    scenario_metrics: dict[str, list[dict[str, Any]] | Any] | None,
+    chart_engine: str,
+) -> None:
+    """Write the HTML report fragments in document order through ``write``."""
+
+    write(_HTML_HEAD)
 
     # Report title and summary
     run_id = run_manifest.get("run_id", "unknown")
@@ -525,133 +985,83 @@ def generate_html_report(
     status_class = "success" if overall_success else "failure"
     status_text = "SUCCESS" if overall_success else "FAILURE"
 
-    html_parts.append(
-        f"""
-        <h1>EddyPro Batch Processing Report</h1>
-        <div class="summary-box">
-            <h2>Run Summary</h2>
-            <p><strong>Run ID:</strong> {run_id}</p>
-            <p><strong>Timestamp:</strong> {timestamp}</p>
-            <p><strong>Duration:</strong> {duration:.2f} seconds ({duration / 60:.2f} minutes)</p>
-            <p><strong>Site ID:</strong> {site_id}</p>
-            <p><strong>Years Processed:</strong> {", ".join(map(str, years))}</p>
-            <p><strong>Overall Status:</strong> <span class="{status_class}">{status_text}</span></p>
-        </div>
-"""
+    write(
+        _RUN_SUMMARY_TEMPLATE.format(
+            run_id=run_id,
+            timestamp=timestamp,
+            duration=duration,
+            duration_minutes=duration / 60,
+            site_id=site_id,
+            years=", ".join(map(str, years)),
+            status_class=status_class,
+            status_text=status_text,
+        )
     )
 
     # Scenario summary table
     scenarios = run_manifest.get("scenarios", [])
     if scenarios:
-        html_parts.append(
-            """
-        <h2>Scenario Results</h2>
-        <table>
-            <tr>
-                <th>Scenario</th>
-                <th>Parameters</th>
-                <th>Duration (s)</th>
-                <th>Status</th>
-            </tr>
-"""
-        )
-        for scenario in scenarios:
-            name = scenario.get("scenario_name", "unknown")
-            params = scenario.get("scenario_params", {})
-            params_str = ", ".join([f"{k}={v}" for k, v in params.items()])
-            duration_s = scenario.get("duration_seconds", 0)
-            success = scenario.get("success", False)
-            status_class = "success" if success else "failure"
-            status_text = "SUCCESS" if success else "FAILURE"
-
-            html_parts.append(
-                f"""
-            <tr>
-                <td>{name}</td>
-                <td>{params_str or "baseline"}</td>
-                <td>{duration_s:.2f}</td>
-                <td class="{status_class}">{status_text}</td>
-            </tr>
-"""
+        write(_SCENARIO_TABLE_HEAD)
+        write(
+            "".join(
+                _SCENARIO_ROW_TEMPLATE.format(
+                    name=html.escape(str(scenario.get("scenario_name", "unknown"))),
+                    params=html.escape(
+                        ", ".join(
+                            f"{k}={v}"
+                            for k, v in scenario.get("scenario_params", {}).items()
+                        )
+                        or "baseline"
+                    ),
+                    duration=scenario.get("duration_seconds", 0),
+                    status=_STATUS_CELLS[bool(scenario.get("success", False))],
+                )
+                for scenario in scenarios
             )
-        html_parts.append("        </table>\n")
+        )
+        write("        </table>\n")
 
     # Performance charts (if available and requested)
     if chart_engine == "plotly" and scenario_metrics:
-        html_parts.append("<h2>Performance Metrics</h2>\n")
-        for scenario_name, metrics in scenario_metrics.items():
-            chart_html = generate_plotly_charts(metrics, scenario_name)
+        write("<h2>Performance Metrics</h2>\n")
+        # Load plotly.js once for all scenario charts
+        write(plotly_script_tag())
+        for scenario_name, chart_html in _render_scenario_charts(
+            scenario_metrics
+        ).items():
             if chart_html:
-                html_parts.append(
-                    f'<div class="chart-container">\n{chart_html}\n</div>\n'
-                )
+                write(f'<div class="chart-container">\n{chart_html}\n</div>\n')
             else:
-                html_parts.append(
-                    f"<p>Charts not available for scenario: {scenario_name}</p>\n"
+                write(
+                    f"<p>Charts not available for scenario: {html.escape(scenario_name)}</p>\n"
                 )
     elif chart_engine == "plotly" and not PLOTLY_AVAILABLE:
-        html_parts.append(
-            "<p><em>Note: Plotly not installed. Charts unavailable.</em></p>\n"
-        )
+        write("<p><em>Note: Plotly not installed. Charts unavailable.</em></p>\n")
 
     # Environment information
     env_info = run_manifest.get("environment", {})
-    html_parts.append(
-        f"""
-        <h2>Environment</h2>
-        <div class="summary-box">
-            <p><strong>Python Version:</strong> {env_info.get("python_version", "unknown")}</p>
-            <p><strong>Platform:</strong> {env_info.get("platform", "unknown")}</p>
-            <p><strong>Processor:</strong> {env_info.get("processor", "unknown")}</p>
-        </div>
-"""
+    write(
+        _ENVIRONMENT_TEMPLATE.format(
+            python_version=env_info.get("python_version", "unknown"),
+            platform=env_info.get("platform", "unknown"),
+            processor=env_info.get("processor", "unknown"),
+        )
     )
 
     package_versions = env_info.get("package_versions", {})
     if package_versions:
-        html_parts.append(
-            """
-        <h3>Package Versions</h3>
-        <table>
-            <tr>
-                <th>Package</th>
-                <th>Version</th>
-            </tr>
-"""
-        )
-        for pkg, version in package_versions.items():
-            html_parts.append(
-                f"""
-            <tr>
-                <td>{pkg}</td>
-                <td>{version}</td>
-            </tr>
-"""
+        write(_PACKAGE_TABLE_HEAD)
+        write(
+            "".join(
+                _PACKAGE_ROW_TEMPLATE.format(
+                    package=html.escape(str(pkg)), version=html.escape(str(version))
+                )
+                for pkg, version in package_versions.items()
             )
-        html_parts.append("        </table>\n")
-
-    # HTML footer
-    html_parts.append(
-        """
-    </div>
-</body>
-</html>
-"""
-    )
-
-    html_content = "".join(html_parts)
-
-    # Write to file if path provided
-    if output_path:
-        try:
-            output_path.parent.mkdir(parents=True, exist_ok=True)
-            with output_path.open("w", encoding="utf-8") as f:
-                f.write(html_content)
-            logger.info(f"HTML report written to {output_path}")
-        except Exception:
-            logger.exception(f"Failed to write HTML report to {output_path}")
+        )
+        write("        </table>\n")
 
-    return html_content
+    write(_HTML_FOOT)
 
 
 def create_reports_directory(
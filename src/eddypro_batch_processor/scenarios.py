@@ -8,6 +8,7 @@ and creating deterministic scenario identifiers.
 
 import itertools
 import logging
+import math
 from dataclasses import dataclass
 
 from . import ini_tools
@@ -17,6 +18,15 @@ logger = logging.getLogger(__name__)
 # Hard cap on scenario combinations
 MAX_SCENARIOS = 32
 
+# Canonical suffix order of the scenario parameters and their abbreviations
+_PARAM_ORDER_ABBREV = (
+    ("rot_meth", "rot"),
+    ("tlag_meth", "tlag"),
+    ("detrend_meth", "det"),
+    ("despike_meth", "spk"),
+    ("hf_meth", "hf"),
+)
+
 
 class ScenarioLimitExceededError(Exception):
     """Exception raised when scenario count exceeds maximum allowed."""
@@ -24,7 +34,7 @@ class ScenarioLimitExceededError(Exception):
     pass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Scenario:
     """
     Represents a single scenario with parameter values.
@@ -71,29 +81,11 @@ def generate_scenario_suffix(parameters: dict[str, int]) -> str:
     if not parameters:
         return ""
 
-    # Define canonical ordering and abbreviations
-    param_order = [
-        "rot_meth",
-        "tlag_meth",
-        "detrend_meth",
-        "despike_meth",
-        "hf_meth",
+    suffix_parts = [
+        f"{abbrev}{parameters[name]}"
+        for name, abbrev in _PARAM_ORDER_ABBREV
+        if name in parameters
     ]
-    param_abbrev = {
-        "rot_meth": "rot",
-        "tlag_meth": "tlag",
-        "detrend_meth": "det",
-        "despike_meth": "spk",
-        "hf_meth": "hf",
-    }
-
-    suffix_parts = []
-    for param_name in param_order:
-        if param_name in parameters:
-            abbrev = param_abbrev[param_name]
-            value = parameters[param_name]
-            suffix_parts.append(f"{abbrev}{value}")
-
     suffix = "_" + "_".join(suffix_parts) if suffix_parts else ""
     logger.debug(f"Generated suffix '{suffix}' for parameters {parameters}")
     return suffix
@@ -142,9 +134,7 @@ def generate_scenarios(
     # Calculate total combinations
     param_names = sorted(parameter_options.keys())  # Consistent ordering
     param_value_lists = [parameter_options[name] for name in param_names]
-    total_combinations = 1
-    for values in param_value_lists:
-        total_combinations *= len(values)
+    total_combinations = math.prod(len(values) for values in param_value_lists)
 
     logger.info(
         f"Generating scenarios: {total_combinations} combinations from "
@@ -162,12 +152,19 @@ def generate_scenarios(
             f"Please reduce the number of values for some parameters."
         )
 
-    # Generate Cartesian product
-    scenarios = []
-    for index, combination in enumerate(itertools.product(*param_value_lists), start=1):
-        # Build parameter dictionary for this combination
-        parameters = dict(zip(param_names, combination, strict=False))
+    # Generate Cartesian product; a single-parameter sweep needs no product
+    if len(param_names) == 1:
+        name = param_names[0]
+        combinations = ({name: value} for value in param_value_lists[0])
+    else:
+        # Build parameter dictionaries per combination (keys stay sorted)
+        combinations = (
+            dict(zip(param_names, combination, strict=True))
+            for combination in itertools.product(*param_value_lists)
+        )
 
+    scenarios = []
+    for index, parameters in enumerate(combinations, start=1):
         # Generate deterministic suffix
         suffix = generate_scenario_suffix(parameters)
 
@@ -189,6 +186,9 @@ def format_scenario_summary(scenarios: list[Scenario]) -> str:
     """
     Format a human-readable summary of scenarios.
 
+    Parameters are listed in the order stored on each scenario, which for
+    ``generate_scenarios`` output is already sorted by name.
+
     Args:
         scenarios: List of Scenario objects
 
@@ -208,9 +208,7 @@ def format_scenario_summary(scenarios: list[Scenario]) -> str:
     lines.append("")
 
     for scenario in scenarios:
-        param_str = ", ".join(
-            f"{k}={v}" for k, v in sorted(scenario.parameters.items())
-        )
+        param_str = ", ".join(f"{k}={v}" for k, v in scenario.parameters.items())
         lines.append(f"  Scenario {scenario.index}: {param_str}")
         lines.append(f"    Suffix: {scenario.suffix}")
 
@@ -6,6 +6,13 @@ ECMD file schema, and sanity checks with actionable error messages.
 """
 
 import csv
+import functools
+import hashlib
+import itertools
+import json
+import re
+from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any
 
@@ -16,6 +23,47 @@ class ValidationError(Exception):
     pass
 
 
+# Required configuration keys, in the order they are reported when missing
+_REQUIRED_KEY_ORDER = (
+    "eddypro_executable",
+    "site_id",
+    "years_to_process",
+    "input_dir_pattern",
+    "output_dir_pattern",
+    "ecmd_file",
+    "stream_output",
+    "log_level",
+    "multiprocessing",
+    "max_processes",
+    "metrics_interval_seconds",
+    "reports_dir",
+    "report_charts",
+)
+_REQUIRED_KEYS = frozenset(_REQUIRED_KEY_ORDER)
+
+# Expected types of configuration values: (key, type, description)
+_TYPE_SPECS: tuple[tuple[str, type | tuple[type, ...], str], ...] = (
+    ("site_id", str, "a string"),
+    ("years_to_process", list, "a list"),
+    ("multiprocessing", bool, "a boolean"),
+    ("stream_output", bool, "a boolean"),
+    ("max_processes", int, "an integer"),
+    ("metrics_interval_seconds", (int, float), "a number"),
+)
+
+# Allowed values of enumerated configuration keys, in display order
+_CHART_KIND_ORDER = ("plotly", "svg", "none")
+_LOG_LEVEL_ORDER = ("DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL")
+_CHART_KINDS = frozenset(_CHART_KIND_ORDER)
+_LOG_LEVELS = frozenset(_LOG_LEVEL_ORDER)
+_CHOICE_SPECS = (
+    ("report_charts", _CHART_KINDS, _CHART_KIND_ORDER),
+    ("log_level", _LOG_LEVELS, _LOG_LEVEL_ORDER),
+)
+
+_MISSING = object()
+
+
 def validate_config_structure(config: dict[str, Any]) -> list[str]:
     """
     Validate that all required configuration keys are present.
@@ -32,95 +80,55 @@ def validate_config_structure(config: dict[str, Any]) -> list[str]:
         >>> len(errors) > 0  # Missing required keys
         True
     """
-    required_keys = [
-        "eddypro_executable",
-        "site_id",
-        "years_to_process",
-        "input_dir_pattern",
-        "output_dir_pattern",
-        "ecmd_file",
-        "stream_output",
-        "log_level",
-        "multiprocessing",
-        "max_processes",
-        "metrics_interval_seconds",
-        "reports_dir",
-        "report_charts",
-    ]
-
     errors = []
-    missing_keys = [key for key in required_keys if key not in config]
 
-    if missing_keys:
+    missing = _REQUIRED_KEYS.difference(config)
+    if missing:
+        missing_keys = [key for key in _REQUIRED_KEY_ORDER if key in missing]
         errors.append(f"Missing required configuration keys: {', '.join(missing_keys)}")
 
     # Validate types for present keys
-    if "site_id" in config and not isinstance(config["site_id"], str):
-        errors.append(f"'site_id' must be a string, got {type(config['site_id'])}")
+    for key, expected_type, description in _TYPE_SPECS:
+        value = config.get(key, _MISSING)
+        if value is not _MISSING and not isinstance(value, expected_type):
+            errors.append(f"'{key}' must be {description}, got {type(value)}")
+
+    # Validate enumerated values; non-strings can never match
+    for key, allowed, display_order in _CHOICE_SPECS:
+        value = config.get(key, _MISSING)
+        if value is not _MISSING and not (isinstance(value, str) and value in allowed):
+            errors.append(
+                f"'{key}' must be one of [{', '.join(display_order)}], got '{value}'"
+            )
 
-    if "years_to_process" in config and not isinstance(
-        config["years_to_process"], list
-    ):
-        errors.append(
-            f"'years_to_process' must be a list, got {type(config['years_to_process'])}"
-        )
+    return errors
 
-    if "multiprocessing" in config and not isinstance(config["multiprocessing"], bool):
-        errors.append(
-            f"'multiprocessing' must be a boolean, got "
-            f"{type(config['multiprocessing'])}"
-        )
 
-    if "stream_output" in config and not isinstance(config["stream_output"], bool):
-        errors.append(
-            f"'stream_output' must be a boolean, got {type(config['stream_output'])}"
-        )
+# Placeholders every input/output directory pattern must contain
+_PLACEHOLDER_RE = re.compile(r"\{(site_id|year)\}")
+_REQUIRED_PLACEHOLDERS = ("site_id", "year")
 
-    if "max_processes" in config and not isinstance(config["max_processes"], int):
-        errors.append(
-            f"'max_processes' must be an integer, got {type(config['max_processes'])}"
-        )
 
-    if "metrics_interval_seconds" in config and not isinstance(
-        config["metrics_interval_seconds"], int | float
-    ):
-        errors.append(
-            f"'metrics_interval_seconds' must be a number, got "
-            f"{type(config['metrics_interval_seconds'])}"
-        )
+def _missing_placeholders(pattern: str) -> list[str]:
+    """Return the required placeholders missing from a directory pattern."""
+    found = set(_PLACEHOLDER_RE.findall(pattern))
+    return [name for name in _REQUIRED_PLACEHOLDERS if name not in found]
 
-    if "report_charts" in config and config["report_charts"] not in [
-        "plotly",
-        "svg",
-        "none",
-    ]:
-        errors.append(
-            f"'report_charts' must be one of [plotly, svg, none], got "
-            f"'{config['report_charts']}'"
-        )
 
-    if "log_level" in config and config["log_level"] not in [
-        "DEBUG",
-        "INFO",
-        "WARNING",
-        "ERROR",
-        "CRITICAL",
-    ]:
-        errors.append(
-            f"'log_level' must be one of [DEBUG, INFO, WARNING, ERROR, CRITICAL], "
-            f"got '{config['log_level']}'"
-        )
-
-    return errors
-
-
-def validate_paths(config: dict[str, Any], skip_ecmd: bool = False) -> list[str]:
+def validate_paths(
+    config: dict[str, Any],
+    skip_ecmd: bool = False,
+    *,
+    exists: Callable[[Path], bool] = Path.exists,
+) -> list[str]:
     """
     Validate that required paths exist in the filesystem.
 
     Args:
         config: Configuration dictionary
         skip_ecmd: If True, skip ECMD file validation
+        exists: Existence check applied to each path; ``validate_all`` passes
+            a memoized check so a path is only stat'd once per run
 
     Returns:
         List of error messages (empty if valid)
@@ -132,10 +140,15 @@ def validate_paths(config: dict[str, Any], skip_ecmd: bool = False) -> list[str]
         True
     """
     errors = []
+    eddypro_exe = Path(config.get("eddypro_executable", ""))
+    input_pattern = config.get("input_dir_pattern", "")
+    output_pattern = config.get("output_dir_pattern", "")
+    site_id = config.get("site_id", "")
+    years = config.get("years_to_process", [])
+    ecmd_file = config.get("ecmd_file", "")
 
     # Validate EddyPro executable
-    eddypro_exe = Path(config.get("eddypro_executable", ""))
-    if not eddypro_exe.exists():
+    if not exists(eddypro_exe):
         errors.append(
             f"EddyPro executable not found: {eddypro_exe}\n"
             f"  → Check 'eddypro_executable' path in config"
@@ -144,32 +157,20 @@ def validate_paths(config: dict[str, Any], skip_ecmd: bool = False) -> list[str]
     # Validate input/output directory patterns
     # Note: We can't validate the pattern itself, but we can check if it's
     # a reasonable string
-    input_pattern = config.get("input_dir_pattern", "")
-    if not input_pattern or "{site_id}" not in input_pattern:
-        errors.append(
-            "Invalid 'input_dir_pattern': must contain '{site_id}' placeholder"
-        )
-    if "{year}" not in input_pattern:
-        errors.append("Invalid 'input_dir_pattern': must contain '{year}' placeholder")
-
-    output_pattern = config.get("output_dir_pattern", "")
-    if not output_pattern or "{site_id}" not in output_pattern:
-        errors.append(
-            "Invalid 'output_dir_pattern': must contain '{site_id}' placeholder"
-        )
-    if "{year}" not in output_pattern:
-        errors.append("Invalid 'output_dir_pattern': must contain '{year}' placeholder")
+    for key, pattern in (
+        ("input_dir_pattern", input_pattern),
+        ("output_dir_pattern", output_pattern),
+    ):
+        for name in _missing_placeholders(pattern):
+            errors.append(f"Invalid '{key}': must contain '{{{name}}}' placeholder")
 
     # Try to format patterns with actual values to check if directories exist
     # for first year
-    site_id = config.get("site_id", "")
-    years = config.get("years_to_process", [])
-
     if site_id and years:
         first_year = years[0]
         try:
             input_dir = Path(input_pattern.format(year=first_year, site_id=site_id))
-            if not input_dir.exists():
+            if not exists(input_dir):
                 errors.append(
                     f"Input directory for year {first_year} not found: {input_dir}\n"
                     f"  → Check 'input_dir_pattern' and ensure raw data exists"
@@ -178,117 +179,247 @@ def validate_paths(config: dict[str, Any], skip_ecmd: bool = False) -> list[str]
             errors.append(f"Error formatting input_dir_pattern: {e}")
 
     # Validate ECMD file if not skipped
-    if not skip_ecmd:
-        ecmd_file = config.get("ecmd_file", "")
-        if ecmd_file:
-            # ECMD file path may contain placeholders
-            if "{site_id}" in ecmd_file:
-                ecmd_path = Path(ecmd_file.format(site_id=site_id))
-            else:
-                ecmd_path = Path(ecmd_file)
+    if not skip_ecmd and ecmd_file:
+        # ECMD file path may contain placeholders
+        if "{site_id}" in ecmd_file:
+            ecmd_path = Path(ecmd_file.format(site_id=site_id))
+        else:
+            ecmd_path = Path(ecmd_file)
 
-            if not ecmd_path.exists():
-                errors.append(
-                    f"ECMD file not found: {ecmd_path}\n"
-                    f"  → Check 'ecmd_file' path in config"
-                )
+        if not exists(ecmd_path):
+            errors.append(
+                f"ECMD file not found: {ecmd_path}\n"
+                f"  → Check 'ecmd_file' path in config"
+            )
 
     return errors
 
 
-def validate_ecmd_schema(ecmd_path: Path) -> list[str]:
+# Read buffer for ECMD files, which can hold many years of configuration rows
+_ECMD_READ_BUFFER = 1 << 20
+
+# ECMD columns checked row by row: (column, whether zero is allowed, requirement)
+_ECMD_NUMERIC_CHECKS = (
+    ("ACQUISITION_FREQUENCY", False, "positive"),
+    ("FILE_DURATION", False, "positive"),
+    ("CANOPY_HEIGHT", True, "non-negative"),
+    ("SA_HEIGHT", False, "positive"),
+)
+
+
+def validate_ecmd(
+    ecmd_path: Path,
+    check_values: bool = True,
+    *,
+    assume_exists: bool = False,
+    max_rows: int | None = None,
+) -> tuple[list[str], list[str]]:
     """
-    Validate that ECMD CSV file contains required columns.
+    Validate ECMD file schema and data values in a single pass.
+
+    The file is opened once and parsed with ``csv.reader``; the header is
+    checked first and the data rows are then checked positionally, using
+    column indices resolved once from the header.
 
     Args:
         ecmd_path: Path to ECMD CSV file
+        check_values: If False, stop after the header and first data row
+            (schema checks only)
+        assume_exists: If True, skip the existence check because the caller
+            has already stat'd the file; a file removed in between is then
+            reported as a read error
+        max_rows: If given, only the first ``max_rows`` data rows are value
+            checked, which bounds the work on very large files. This makes the
+            sanity check a sample rather than an exhaustive check.
 
     Returns:
-        List of error messages (empty if valid)
+        Tuple of (schema errors, sanity errors); both empty if valid
 
     Examples:
         >>> from pathlib import Path
-        >>> # Assuming valid ECMD file exists
-        >>> errors = validate_ecmd_schema(Path("data/GL-ZaF_ecmd.csv"))
-        >>> errors  # Should be empty for valid file
-        []
+        >>> validate_ecmd(Path("data/GL-ZaF_ecmd.csv"))
+        ([], [])
     """
-    required_columns = [
-        "DATE_OF_VARIATION_EF",
-        "FILE_DURATION",
-        "ACQUISITION_FREQUENCY",
-        "CANOPY_HEIGHT",
-        "SA_MANUFACTURER",
-        "SA_MODEL",
-        "SA_HEIGHT",
-        "SA_WIND_DATA_FORMAT",
-        "SA_NORTH_ALIGNEMENT",
-        "SA_NORTH_OFFSET",
-        "GA_MANUFACTURER",
-        "GA_MODEL",
-        "GA_NORTHWARD_SEPARATION",
-        "GA_EASTWARD_SEPARATION",
-        "GA_VERTICAL_SEPARATION",
-    ]
+    if not assume_exists and not ecmd_path.exists():
+        message = f"ECMD file not found: {ecmd_path}"
+        return [message], [message]
 
-    # Closed-path specific columns (conditional)
-    closed_path_columns = ["GA_TUBE_LENGTH", "GA_TUBE_DIAMETER", "GA_FLOWRATE"]
+    schema_errors: list[str] = []
+    sanity_errors: list[str] = []
+    header_checked = False
+
+    try:
+        with ecmd_path.open(
+            "r", buffering=_ECMD_READ_BUFFER, newline="", encoding="utf-8"
+        ) as csvfile:
+            reader = csv.reader(csvfile)
+            header = next(reader, [])
+            # Like DictReader, skip blank lines between data rows
+            rows = (row for row in reader if row)
+            first_row = next(rows, None)
+
+            schema_errors = _check_ecmd_header(ecmd_path, header, first_row)
+            header_checked = True
+
+            if check_values and first_row is not None:
+                _check_ecmd_rows(
+                    header,
+                    itertools.chain([first_row], rows),
+                    sanity_errors,
+                    max_rows,
+                )
 
+    except Exception as e:
+        message = f"Error reading ECMD file {ecmd_path}: {e}"
+        if not header_checked:
+            schema_errors.append(message)
+        sanity_errors.append(message)
+
+    return schema_errors, sanity_errors
+
+
+# Required ECMD columns, in the order they are reported when missing
+_REQUIRED_ECMD_COLUMN_ORDER = (
+    "DATE_OF_VARIATION_EF",
+    "FILE_DURATION",
+    "ACQUISITION_FREQUENCY",
+    "CANOPY_HEIGHT",
+    "SA_MANUFACTURER",
+    "SA_MODEL",
+    "SA_HEIGHT",
+    "SA_WIND_DATA_FORMAT",
+    "SA_NORTH_ALIGNEMENT",
+    "SA_NORTH_OFFSET",
+    "GA_MANUFACTURER",
+    "GA_MODEL",
+    "GA_NORTHWARD_SEPARATION",
+    "GA_EASTWARD_SEPARATION",
+    "GA_VERTICAL_SEPARATION",
+)
+_REQUIRED_ECMD_COLUMNS = frozenset(_REQUIRED_ECMD_COLUMN_ORDER)
+
+# Columns additionally required when GA_PATH is 'closed'
+_CLOSED_PATH_COLUMN_ORDER = ("GA_TUBE_LENGTH", "GA_TUBE_DIAMETER", "GA_FLOWRATE")
+_CLOSED_PATH_COLUMNS = frozenset(_CLOSED_PATH_COLUMN_ORDER)
+
+
+def _check_ecmd_header(
+    ecmd_path: Path, header: list[str], first_row: list[str] | None
+) -> list[str]:
+    """Check the ECMD header for required columns."""
     errors = []
 
-    if not ecmd_path.exists():
-        errors.append(f"ECMD file not found: {ecmd_path}")
+    if not header:
+        errors.append(f"ECMD file is empty or has no header: {ecmd_path}")
         return errors
 
-    try:
-        with ecmd_path.open("r", newline="", encoding="utf-8") as csvfile:
-            reader = csv.DictReader(csvfile)
-
-            # Get actual columns from file
-            fieldnames = reader.fieldnames
-            if not fieldnames:
-                errors.append(f"ECMD file is empty or has no header: {ecmd_path}")
-                return errors
-
-            # Check required columns
-            missing_cols = [col for col in required_columns if col not in fieldnames]
-            if missing_cols:
+    # Check required columns
+    columns = frozenset(header)
+    missing = _REQUIRED_ECMD_COLUMNS - columns
+    if missing:
+        missing_cols = [col for col in _REQUIRED_ECMD_COLUMN_ORDER if col in missing]
+        errors.append(
+            f"ECMD file missing required columns: {', '.join(missing_cols)}\n"
+            f"  → File: {ecmd_path}"
+        )
+
+    # Check for closed-path configuration
+    if "GA_PATH" in columns:
+        if first_row is None:
+            # Empty file (no data rows)
+            errors.append(f"ECMD file has header but no data rows: {ecmd_path}")
+        elif _cell(first_row, header.index("GA_PATH"), "").lower() == "closed":
+            missing = _CLOSED_PATH_COLUMNS - columns
+            if missing:
+                missing_closed = [
+                    col for col in _CLOSED_PATH_COLUMN_ORDER if col in missing
+                ]
                 errors.append(
-                    f"ECMD file missing required columns: {', '.join(missing_cols)}\n"
-                    f"  → File: {ecmd_path}"
+                    f"ECMD file has GA_PATH='closed' but missing columns: "
+                    f"{', '.join(missing_closed)}\n"
+                    f"  → Required for closed-path analyzers"
                 )
 
-            # Check for closed-path configuration
-            if "GA_PATH" in fieldnames:
-                # Read first data row to check GA_PATH value
-                try:
-                    first_row = next(reader)
-                    if first_row.get("GA_PATH", "").lower() == "closed":
-                        missing_closed = [
-                            col for col in closed_path_columns if col not in fieldnames
-                        ]
-                        if missing_closed:
-                            errors.append(
-                                f"ECMD file has GA_PATH='closed' but missing columns: "
-                                f"{', '.join(missing_closed)}\n"
-                                f"  → Required for closed-path analyzers"
-                            )
-                except StopIteration:
-                    # Empty file (no data rows)
-                    errors.append(f"ECMD file has header but no data rows: {ecmd_path}")
+    return errors
 
-    except Exception as e:
-        errors.append(f"Error reading ECMD file {ecmd_path}: {e}")
 
-    return errors
+def _check_ecmd_rows(
+    header: list[str],
+    rows: Iterable[list[str]],
+    errors: list[str],
+    max_rows: int | None = None,
+) -> None:
+    """Check numeric ECMD values row by row, appending messages to ``errors``.
+
+    Only the first ``max_rows`` data rows are checked when it is given.
+    """
+    # Last occurrence wins for duplicate names, as with DictReader
+    positions = {name: index for index, name in enumerate(header)}
+    # Resolve each column once; messages are only formatted for failing cells
+    checks = [
+        (column, positions.get(column), allow_zero, requirement)
+        for column, allow_zero, requirement in _ECMD_NUMERIC_CHECKS
+    ]
+
+    if max_rows is not None:
+        rows = itertools.islice(rows, max_rows)
+
+    for i, row in enumerate(rows, start=2):  # Start at 2 (1=header)
+        width = len(row)
+        for column, index, allow_zero, requirement in checks:
+            # Index the row directly; missing columns read as "0" and cells
+            # missing from short rows as None, as with DictReader
+            if index is None:
+                raw = "0"
+            elif index < width:
+                raw = row[index]
+            else:
+                raw = None
+            try:
+                value = float(raw)  # type: ignore[arg-type]
+            except ValueError:
+                errors.append(f"Row {i}: {column} is not a valid number: '{raw}'")
+                continue
+            if value < 0 or (value == 0 and not allow_zero):
+                errors.append(f"Row {i}: {column} must be {requirement}, got {value}")
+
+
+def _cell(row: list[str], index: int, default: str | None) -> str | None:
+    """Return ``row[index]``, or ``default`` when the row is too short."""
+    return row[index] if index < len(row) else default
 
 
-def validate_ecmd_sanity(ecmd_path: Path) -> list[str]:
+def validate_ecmd_schema(ecmd_path: Path, *, assume_exists: bool = False) -> list[str]:
+    """
+    Validate that ECMD CSV file contains required columns.
+
+    Args:
+        ecmd_path: Path to ECMD CSV file
+        assume_exists: If True, skip the existence check (see ``validate_ecmd``)
+
+    Returns:
+        List of error messages (empty if valid)
+
+    Examples:
+        >>> from pathlib import Path
+        >>> # Assuming valid ECMD file exists
+        >>> errors = validate_ecmd_schema(Path("data/GL-ZaF_ecmd.csv"))
+        >>> errors  # Should be empty for valid file
+        []
+    """
+    return validate_ecmd(ecmd_path, check_values=False, assume_exists=assume_exists)[0]
+
+
+def validate_ecmd_sanity(
+    ecmd_path: Path, *, assume_exists: bool = False, max_rows: int | None = None
+) -> list[str]:
     """
     Perform sanity checks on ECMD file data values.
 
     Args:
         ecmd_path: Path to ECMD CSV file
+        assume_exists: If True, skip the existence check (see ``validate_ecmd``)
+        max_rows: If given, only check the first ``max_rows`` data rows
 
     Returns:
         List of error messages (empty if valid)
@@ -300,75 +431,7 @@ def validate_ecmd_sanity(ecmd_path: Path) -> list[str]:
         >>> len(errors) == 0
         True
     """
-    errors = []
-
-    if not ecmd_path.exists():
-        errors.append(f"ECMD file not found: {ecmd_path}")
-        return errors
-
-    try:
-        with ecmd_path.open("r", newline="", encoding="utf-8") as csvfile:
-            reader = csv.DictReader(csvfile)
-
-            for i, row in enumerate(reader, start=2):  # Start at 2 (1=header)
-                # Check ACQUISITION_FREQUENCY is positive
-                try:
-                    acq_freq = float(row.get("ACQUISITION_FREQUENCY", "0"))
-                    if acq_freq <= 0:
-                        errors.append(
-                            f"Row {i}: ACQUISITION_FREQUENCY must be positive, "
-                            f"got {acq_freq}"
-                        )
-                except ValueError:
-                    errors.append(
-                        f"Row {i}: ACQUISITION_FREQUENCY is not a valid number: "
-                        f"'{row.get('ACQUISITION_FREQUENCY')}'"
-                    )
-
-                # Check FILE_DURATION is positive
-                try:
-                    file_dur = float(row.get("FILE_DURATION", "0"))
-                    if file_dur <= 0:
-                        errors.append(
-                            f"Row {i}: FILE_DURATION must be positive, got {file_dur}"
-                        )
-                except ValueError:
-                    errors.append(
-                        f"Row {i}: FILE_DURATION is not a valid number: "
-                        f"'{row.get('FILE_DURATION')}'"
-                    )
-
-                # Check CANOPY_HEIGHT is non-negative (can be 0)
-                try:
-                    canopy_height = float(row.get("CANOPY_HEIGHT", "0"))
-                    if canopy_height < 0:
-                        errors.append(
-                            f"Row {i}: CANOPY_HEIGHT must be non-negative, "
-                            f"got {canopy_height}"
-                        )
-                except ValueError:
-                    errors.append(
-                        f"Row {i}: CANOPY_HEIGHT is not a valid number: "
-                        f"'{row.get('CANOPY_HEIGHT')}'"
-                    )
-
-                # Check SA_HEIGHT is positive
-                try:
-                    sa_height = float(row.get("SA_HEIGHT", "0"))
-                    if sa_height <= 0:
-                        errors.append(
-                            f"Row {i}: SA_HEIGHT must be positive, got {sa_height}"
-                        )
-                except ValueError:
-                    errors.append(
-                        f"Row {i}: SA_HEIGHT is not a valid number: "
-                        f"'{row.get('SA_HEIGHT')}'"
-                    )
-
-    except Exception as e:
-        errors.append(f"Error reading ECMD file {ecmd_path}: {e}")
-
-    return errors
+    return validate_ecmd(ecmd_path, assume_exists=assume_exists, max_rows=max_rows)[1]
 
 
 def validate_config_sanity(config: dict[str, Any]) -> list[str]:
@@ -388,28 +451,28 @@ def validate_config_sanity(config: dict[str, Any]) -> list[str]:
         True
     """
     errors = []
+    years = config.get("years_to_process", [])
+    site_id = config.get("site_id", "")
+    multiprocessing = config.get("multiprocessing", False)
+    max_proc = config.get("max_processes", 0)
+    metrics_interval = config.get("metrics_interval_seconds", 0)
 
     # Check years_to_process is not empty
-    years = config.get("years_to_process", [])
     if not years:
         errors.append("'years_to_process' cannot be empty")
 
     # Check site_id is not empty
-    site_id = config.get("site_id", "")
     if not site_id or not site_id.strip():
         errors.append("'site_id' cannot be empty")
 
     # Check max_processes is positive when multiprocessing enabled
-    if config.get("multiprocessing", False):
-        max_proc = config.get("max_processes", 0)
-        if max_proc <= 0:
-            errors.append(
-                f"'max_processes' must be positive when multiprocessing is "
-                f"enabled, got {max_proc}"
-            )
+    if multiprocessing and max_proc <= 0:
+        errors.append(
+            f"'max_processes' must be positive when multiprocessing is "
+            f"enabled, got {max_proc}"
+        )
 
     # Check metrics_interval_seconds is positive
-    metrics_interval = config.get("metrics_interval_seconds", 0)
     if metrics_interval <= 0:
         errors.append(
             f"'metrics_interval_seconds' must be positive, got {metrics_interval}"
@@ -418,18 +481,93 @@ def validate_config_sanity(config: dict[str, Any]) -> list[str]:
     return errors
 
 
+# validate_all results: cache key -> (path signature, results)
+_VALIDATION_CACHE: dict[
+    str, tuple[tuple[tuple[int, int] | None, ...], dict[str, list[str]]]
+] = {}
+_VALIDATION_CACHE_SIZE = 8
+
+
+def clear_validation_cache() -> None:
+    """Drop all results memoized by validate_all."""
+    _VALIDATION_CACHE.clear()
+
+
+def _validation_cache_key(config: dict[str, Any], options: tuple) -> str | None:
+    """Hash the config and options, or return None if they cannot be hashed."""
+    try:
+        data = json.dumps(
+            [config, options], sort_keys=True, separators=(",", ":"), default=str
+        )
+    except (TypeError, ValueError):
+        return None
+    return hashlib.blake2b(data.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _path_signature(
+    config: dict[str, Any],
+    skip_paths: bool,
+    skip_ecmd: bool,
+) -> tuple[tuple[int, int] | None, ...] | None:
+    """Return (mtime_ns, size) of each path the requested checks touch.
+
+    The executable and first input directory are only included when path
+    checks run, and the ECMD file only when ECMD checks run. Missing paths
+    are recorded as None. Returns None when a path pattern cannot be
+    formatted, in which case the results are not cached.
+    """
+    if skip_paths and skip_ecmd:
+        return ()
+    site_id = config.get("site_id", "")
+    years = config.get("years_to_process", [])
+    ecmd_file = config.get("ecmd_file", "") if not skip_ecmd else ""
+    paths = []
+    try:
+        if not skip_paths:
+            paths.append(Path(config.get("eddypro_executable", "")))
+            if site_id and years:
+                input_pattern = config.get("input_dir_pattern", "")
+                paths.append(Path(input_pattern.format(year=years[0], site_id=site_id)))
+        if ecmd_file:
+            if "{site_id}" in ecmd_file:
+                ecmd_file = ecmd_file.format(site_id=site_id)
+            paths.append(Path(ecmd_file))
+    except Exception:  # noqa: BLE001 - unformattable patterns are reported later
+        return None
+
+    signature: list[tuple[int, int] | None] = []
+    for path in paths:
+        try:
+            stat_result = path.stat()
+        except OSError:
+            signature.append(None)
+        else:
+            signature.append((stat_result.st_mtime_ns, stat_result.st_size))
+    return tuple(signature)
+
+
 def validate_all(
     config: dict[str, Any],
     skip_paths: bool = False,
     skip_ecmd: bool = False,
+    *,
+    ecmd_sample: int | None = None,
 ) -> dict[str, list[str]]:
     """
     Run all validations and return categorized errors.
 
+    Results are memoized per process, keyed by a hash of the config and the
+    options, and reused while the checked paths (the EddyPro executable, the
+    first input directory and the ECMD file) keep their modification time and
+    size (``clear_validation_cache()`` drops them). Skipped checks add no
+    filesystem access.
+
     Args:
         config: Configuration dictionary
         skip_paths: If True, skip path existence checks
         skip_ecmd: If True, skip ECMD file validation
+        ecmd_sample: If given, only sanity check the first ``ecmd_sample``
+            ECMD data rows (the header is always checked)
 
     Returns:
         Dictionary mapping validation category to list of errors
@@ -440,21 +578,52 @@ def validate_all(
         >>> "config_structure" in result
         True
     """
+    cache_key = _validation_cache_key(config, (skip_paths, skip_ecmd, ecmd_sample))
+    signature = (
+        _path_signature(config, skip_paths, skip_ecmd)
+        if cache_key is not None
+        else None
+    )
+    if cache_key is not None and signature is not None:
+        cached = _VALIDATION_CACHE.get(cache_key)
+        if cached is not None and cached[0] == signature:
+            return {category: list(errors) for category, errors in cached[1].items()}
+
+    results = _validate_all_uncached(config, skip_paths, skip_ecmd, ecmd_sample)
+
+    if cache_key is not None and signature is not None:
+        if len(_VALIDATION_CACHE) >= _VALIDATION_CACHE_SIZE:
+            # Evict the oldest entry; dicts keep insertion order
+            _VALIDATION_CACHE.pop(next(iter(_VALIDATION_CACHE)), None)
+        _VALIDATION_CACHE[cache_key] = (
+            signature,
+            {category: list(errors) for category, errors in results.items()},
+        )
+    return results
+
+
+def _validate_all_uncached(
+    config: dict[str, Any],
+    skip_paths: bool,
+    skip_ecmd: bool,
+    ecmd_sample: int | None,
+) -> dict[str, list[str]]:
+    """Run the validations behind validate_all without consulting the cache."""
     results = {}
 
+    # Stat each path at most once; the cache lives only for this call so a
+    # later validation never sees stale results
+    exists_cached = functools.lru_cache(maxsize=128)(Path.exists)
+
     # Config structure validation
     results["config_structure"] = validate_config_structure(config)
 
     # Config sanity validation
     results["config_sanity"] = validate_config_sanity(config)
 
-    # Path validation (unless skipped)
-    if not skip_paths:
-        results["paths"] = validate_paths(config, skip_ecmd=skip_ecmd)
-    else:
-        results["paths"] = []
-
     # ECMD validation (unless skipped)
+    ecmd_path: Path | None = None
+    ecmd_results: tuple[list[str], list[str]] = ([], [])
     if not skip_ecmd:
         ecmd_file = config.get("ecmd_file", "")
         site_id = config.get("site_id", "")
@@ -466,18 +635,39 @@ def validate_all(
             else:
                 ecmd_path = Path(ecmd_file)
 
-            if ecmd_path.exists():
-                results["ecmd_schema"] = validate_ecmd_schema(ecmd_path)
-                results["ecmd_sanity"] = validate_ecmd_sanity(ecmd_path)
-            else:
-                results["ecmd_schema"] = [f"ECMD file not found: {ecmd_path}"]
-                results["ecmd_sanity"] = []
+            # The cached check is the only stat of the ECMD path in this call
+            if not exists_cached(ecmd_path):
+                ecmd_results = ([f"ECMD file not found: {ecmd_path}"], [])
+                ecmd_path = None
         else:
-            results["ecmd_schema"] = ["ECMD file path not specified in config"]
-            results["ecmd_sanity"] = []
+            ecmd_results = (["ECMD file path not specified in config"], [])
+
+    if ecmd_path is not None and not skip_paths:
+        # Reading the ECMD file is I/O bound, so it runs on a worker thread
+        # while the path checks stat the filesystem
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            ecmd_future = executor.submit(
+                validate_ecmd, ecmd_path, assume_exists=True, max_rows=ecmd_sample
+            )
+            results["paths"] = validate_paths(
+                config, skip_ecmd=skip_ecmd, exists=exists_cached
+            )
+            ecmd_results = ecmd_future.result()
     else:
-        results["ecmd_schema"] = []
-        results["ecmd_sanity"] = []
+        if ecmd_path is not None:
+            ecmd_results = validate_ecmd(
+                ecmd_path, assume_exists=True, max_rows=ecmd_sample
+            )
+
+        # Path validation (unless skipped)
+        if not skip_paths:
+            results["paths"] = validate_paths(
+                config, skip_ecmd=skip_ecmd, exists=exists_cached
+            )
+        else:
+            results["paths"] = []
+
+    results["ecmd_schema"], results["ecmd_sanity"] = ecmd_results
 
     return results
 
@@ -236,6 +236,68 @@ report_charts: none
         assert result == 0
         mock_run.assert_called_once()
 
+    def test_cmd_run_multiprocessing_uses_batch_runner(self, tmp_path: Path):
+        """Test cmd_run hands project files to the pool when multiprocessing."""
+        site_id = "test-site"
+        years = [2021, 2022]
+        for year in years:
+            input_dir = tmp_path / "input" / site_id / str(year)
+            input_dir.mkdir(parents=True)
+            (input_dir / "sample.csv").write_text("data", encoding="utf-8")
+
+        ecmd_file = _write_ecmd_file(tmp_path, site_id)
+        config_file = tmp_path / "test_config.yaml"
+        config_file.write_text(
+            f"""
+site_id: {site_id}
+years_to_process: {years}
+eddypro_executable: /fake/eddypro.exe
+input_dir_pattern: {tmp_path}/input/{{site_id}}/{{year}}
+output_dir_pattern: {tmp_path}/output/{{site_id}}/{{year}}/ec_rflux
+ecmd_file: {ecmd_file}
+max_processes: 2
+multiprocessing: true
+stream_output: false
+log_level: INFO
+metrics_interval_seconds: 0.5
+reports_dir: null
+report_charts: none
+"""
+        )
+
+        args = argparse.Namespace(
+            config=str(config_file),
+            site=None,
+            years=None,
+            dry_run=False,
+            rot_meth=None,
+            tlag_meth=None,
+            detrend_meth=None,
+            despike_meth=None,
+            hf_meth=None,
+        )
+
+        def _fake_batch(project_files, *args, **kwargs):
+            return dict.fromkeys(project_files, True)
+
+        with (
+            patch(
+                "eddypro_batch_processor.cli.core.run_eddypro_batch",
+                side_effect=_fake_batch,
+            ) as mock_batch,
+            patch(
+                "eddypro_batch_processor.cli.core.run_eddypro_with_monitoring"
+            ) as mock_run,
+        ):
+            result = cmd_run(args)
+
+        assert result == 0
+        mock_run.assert_not_called()
+        mock_batch.assert_called_once()
+        project_files = mock_batch.call_args.args[0]
+        assert len(project_files) == 2
+        assert mock_batch.call_args.kwargs["max_processes"] == 2
+
     def test_cmd_scenarios_basic(self):
         """Test the cmd_scenarios function with basic arguments."""
         args = argparse.Namespace(
@@ -343,7 +405,10 @@ report_charts: none
             mock_proc.assert_called_once()
             mock_instance.load_config.assert_called_once()
             mock_validate.assert_called_once_with(
-                config={"test": "config"}, skip_paths=False, skip_ecmd=False
+                config={"test": "config"},
+                skip_paths=False,
+                skip_ecmd=False,
+                ecmd_sample=None,
             )
 
     def test_cmd_validate_with_skip_options(self):
@@ -381,7 +446,10 @@ report_charts: none
 
             assert result == 0
             mock_validate.assert_called_once_with(
-                config={"test": "config"}, skip_paths=True, skip_ecmd=True
+                config={"test": "config"},
+                skip_paths=True,
+                skip_ecmd=True,
+                ecmd_sample=None,
             )
 
     def test_cmd_status_basic(self, tmp_path):
@@ -498,6 +566,17 @@ class TestCLIUtilityFunctions:
         args = parser.parse_args(["status"])
         assert args.command == "status"
 
+    def test_validate_ecmd_sample_option(self):
+        """Test that --ecmd-sample takes a non-negative row count."""
+        parser = create_parser()
+
+        assert parser.parse_args(["validate"]).ecmd_sample is None
+        args = parser.parse_args(["validate", "--ecmd-sample", "100"])
+        assert args.ecmd_sample == 100
+
+        with pytest.raises(SystemExit):
+            parser.parse_args(["validate", "--ecmd-sample", "-1"])
+
 
 class TestMainFunction:
     """Test the main CLI entry point function."""
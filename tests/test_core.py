@@ -1,19 +1,36 @@
 """Tests for core module functionality."""
 
+import json
+import pickle
+import shutil
+import sys
 import tempfile
+import threading
+import time
 from pathlib import Path
 from unittest.mock import patch
 
 import pytest
 import yaml
 
+from eddypro_batch_processor import core
 from eddypro_batch_processor.core import (
     EddyProBatchProcessor,
+    _link_copy,
     load_config,
+    run_eddypro_batch,
     run_eddypro_with_monitoring,
+    run_subprocess_with_monitoring,
     validate_config,
 )
 
+# Patch values for the OS-specific executable constants in core
+_WINDOWS_NAMES = {
+    "_RP_NAME": "eddypro_rp.exe",
+    "_FCC_NAME": "eddypro_fcc.exe",
+    "_OS_FLAG": "win",
+}
+
 
 class TestEddyProBatchProcessor:
     """Test the main EddyProBatchProcessor class."""
@@ -115,6 +132,47 @@ class TestEddyProBatchProcessor:
         with pytest.raises(SystemExit):
             processor.validate_config(incomplete_config)
 
+    def test_validate_config_missing_keys_reported_sorted(self, caplog):
+        """Missing keys should be reported in a stable, sorted order."""
+        processor = EddyProBatchProcessor()
+        with pytest.raises(SystemExit):
+            processor.validate_config({"site_id": "TEST-SITE"})
+
+        message = next(
+            r.message for r in caplog.records if "Missing configuration" in r.message
+        )
+        listed = message.split(": ", 1)[1].split(", ")
+        assert listed == sorted(listed)
+        assert "site_id" not in listed
+
+    def test_validate_config_skips_already_validated(self, caplog):
+        """A config with an already-validated token skips the checks."""
+        config = {
+            "eddypro_executable": "/path/to/eddypro",
+            "site_id": "TEST-SITE",
+            "years_to_process": [2021],
+            "input_dir_pattern": "data/raw/{site_id}/{year}",
+            "output_dir_pattern": "data/processed/{site_id}/{year}",
+            "ecmd_file": "data/test_ecmd.csv",
+            "stream_output": True,
+            "log_level": "INFO",
+            "multiprocessing": False,
+            "max_processes": 3,
+            "metrics_interval_seconds": 0.25,
+            "reports_dir": None,
+            "report_charts": "svg",
+        }
+        processor = EddyProBatchProcessor()
+        processor.validate_config(config)
+
+        with caplog.at_level("DEBUG"):
+            processor.validate_config(dict(config))
+        assert "Configuration already validated" in caplog.text
+
+        # Changing a validated value invalidates the token
+        with pytest.raises(SystemExit):
+            processor.validate_config({**config, "max_processes": 3.0})
+
     def test_validate_config_invalid_max_processes(self):
         """Test config validation with invalid max_processes."""
         invalid_config = {
@@ -158,6 +216,126 @@ class TestEddyProBatchProcessor:
         processor.validate_config()
 
 
+class TestConfigCache:
+    """Tests for the mtime-keyed config sidecar cache."""
+
+    def _write_config(self, path: Path, site_id: str) -> None:
+        path.write_text(yaml.dump({"site_id": site_id}), encoding="utf-8")
+
+    def test_cache_written_and_reused(self, tmp_path: Path):
+        """A warm load should come from the sidecar without parsing YAML."""
+        config_path = tmp_path / "config.yaml"
+        self._write_config(config_path, "CACHED")
+
+        first = EddyProBatchProcessor().load_config(config_path)
+        assert (tmp_path / "config.yaml.cache").exists()
+
+        with patch("yaml.load", wraps=yaml.load) as mock_load:
+            second = EddyProBatchProcessor().load_config(config_path)
+
+        mock_load.assert_not_called()
+        assert second == first == {"site_id": "CACHED"}
+
+    def test_cache_invalidated_on_change(self, tmp_path: Path):
+        """Editing the config should bypass a stale sidecar."""
+        config_path = tmp_path / "config.yaml"
+        self._write_config(config_path, "OLD")
+        EddyProBatchProcessor().load_config(config_path)
+
+        self._write_config(config_path, "NEW-SITE")
+        loaded = EddyProBatchProcessor().load_config(config_path)
+
+        assert loaded == {"site_id": "NEW-SITE"}
+
+    def test_corrupt_cache_is_ignored(self, tmp_path: Path):
+        """A corrupt sidecar should fall back to parsing the YAML."""
+        config_path = tmp_path / "config.yaml"
+        self._write_config(config_path, "SITE")
+        EddyProBatchProcessor().load_config(config_path)
+
+        cache_path = tmp_path / "config.yaml.cache"
+        header = cache_path.read_bytes().split(b"\n", 1)[0]
+        cache_path.write_bytes(header + b"\nnot a pickle")
+
+        loaded = EddyProBatchProcessor().load_config(config_path)
+        assert loaded == {"site_id": "SITE"}
+
+    @pytest.mark.skipif(not core.ORJSON_AVAILABLE, reason="orjson not installed")
+    def test_cache_uses_json_with_orjson(self, tmp_path: Path):
+        """JSON-representable configs should be cached as JSON."""
+        config_path = tmp_path / "config.yaml"
+        self._write_config(config_path, "JSON")
+        EddyProBatchProcessor().load_config(config_path)
+
+        payload = (tmp_path / "config.yaml.cache").read_bytes().split(b"\n", 1)[1]
+        assert payload == b'json\n{"site_id":"JSON"}'
+
+    def test_cache_skipped_for_dates(self, tmp_path: Path):
+        """Values JSON cannot round-trip (YAML dates) should not be cached."""
+        config_path = tmp_path / "config.yaml"
+        config_path.write_text("site_id: SITE\nstart: 2024-01-01\n", encoding="utf-8")
+        first = EddyProBatchProcessor().load_config(config_path)
+
+        assert not (tmp_path / "config.yaml.cache").exists()
+        assert EddyProBatchProcessor().load_config(config_path) == first
+
+    def test_cache_without_orjson_uses_json(self, tmp_path: Path):
+        """Without orjson the sidecar should be written with the stdlib encoder."""
+        config_path = tmp_path / "config.yaml"
+        self._write_config(config_path, "STDLIB")
+
+        with patch.object(core, "ORJSON_AVAILABLE", False):
+            EddyProBatchProcessor().load_config(config_path)
+            with patch("yaml.load", wraps=yaml.load) as mock_load:
+                loaded = EddyProBatchProcessor().load_config(config_path)
+
+        mock_load.assert_not_called()
+        payload = (tmp_path / "config.yaml.cache").read_bytes().split(b"\n", 1)[1]
+        assert payload == b'json\n{"site_id":"STDLIB"}'
+        assert loaded == {"site_id": "STDLIB"}
+
+    def test_pickle_cache_is_never_loaded(self, tmp_path: Path):
+        """A pickle sidecar with a matching key must not be unpickled."""
+        config_path = tmp_path / "config.yaml"
+        self._write_config(config_path, "SITE")
+        EddyProBatchProcessor().load_config(config_path)
+
+        cache_path = tmp_path / "config.yaml.cache"
+        header = cache_path.read_bytes().split(b"\n", 1)[0]
+        cache_path.write_bytes(
+            header + b"\npickle\n" + pickle.dumps({"site_id": "PICKLED"})
+        )
+
+        loaded = EddyProBatchProcessor().load_config(config_path)
+
+        assert loaded == {"site_id": "SITE"}
+
+
+class TestWriteScenarioMetadata:
+    """Test the scenario manifest writer."""
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_writes_indented_json(self, tmp_path: Path, use_orjson: bool):
+        """Both serializers should write the same readable document."""
+        if use_orjson and not core.ORJSON_AVAILABLE:
+            pytest.skip("orjson not installed")
+        metadata = {
+            "scenario_index": 1,
+            "scenario_params": {"rot_meth": 1, "tlag_meth": 2},
+            "duration_seconds": 1.5,
+            "success": True,
+            "project_file": "café.eddypro",
+        }
+        manifest_path = tmp_path / "scenario_manifest_rot1.json"
+
+        with patch.object(core, "ORJSON_AVAILABLE", use_orjson):
+            core._write_scenario_metadata(metadata, manifest_path)
+
+        text = manifest_path.read_text(encoding="utf-8")
+        assert json.loads(text) == metadata
+        assert '\n  "scenario_index": 1,' in text
+
+
 class TestLegacyFunctions:
     """Test the legacy function wrappers."""
 
@@ -223,7 +401,7 @@ class TestRunEddyProWithMonitoring:
         eddypro_exe = eddypro_bin / "eddypro_rp.exe"
         eddypro_exe.write_text("", encoding="utf-8")
 
-        def _mock_copytree(src: Path, dst: Path, dirs_exist_ok: bool = True) -> Path:
+        def _mock_copytree(src: Path, dst: Path, **kwargs) -> Path:
             dst_path = Path(dst)
             dst_path.mkdir(parents=True, exist_ok=True)
             (dst_path / "eddypro_rp.exe").write_text("", encoding="utf-8")
@@ -231,10 +409,7 @@ class TestRunEddyProWithMonitoring:
             return dst_path
 
         with (
-            patch(
-                "eddypro_batch_processor.core.platform.system",
-                return_value="Windows",
-            ),
+            patch.multiple("eddypro_batch_processor.core", **_WINDOWS_NAMES),
             patch(
                 "eddypro_batch_processor.core.shutil.copytree",
                 side_effect=_mock_copytree,
@@ -258,8 +433,9 @@ class TestRunEddyProWithMonitoring:
         rp_call = mock_run.call_args_list[0].kwargs
         fcc_call = mock_run.call_args_list[1].kwargs
 
-        assert "eddypro_rp.exe" in rp_call["command"]
-        assert "eddypro_fcc.exe" in fcc_call["command"]
+        assert Path(rp_call["command"][0]).name == "eddypro_rp.exe"
+        assert Path(fcc_call["command"][0]).name == "eddypro_fcc.exe"
+        assert rp_call["command"][1:] == ["-s", "win", str(project_file)]
         assert rp_call["working_dir"] == project_dir.parent
         assert fcc_call["working_dir"] == project_dir.parent
         assert rp_call["scenario_suffix"] == "rp"
@@ -277,7 +453,7 @@ class TestRunEddyProWithMonitoring:
         eddypro_exe = eddypro_bin / "eddypro_rp.exe"
         eddypro_exe.write_text("", encoding="utf-8")
 
-        def _mock_copytree(src: Path, dst: Path, dirs_exist_ok: bool = True) -> Path:
+        def _mock_copytree(src: Path, dst: Path, **kwargs) -> Path:
             dst_path = Path(dst)
             dst_path.mkdir(parents=True, exist_ok=True)
             (dst_path / "eddypro_rp.exe").write_text("", encoding="utf-8")
@@ -285,10 +461,7 @@ class TestRunEddyProWithMonitoring:
             return dst_path
 
         with (
-            patch(
-                "eddypro_batch_processor.core.platform.system",
-                return_value="Windows",
-            ),
+            patch.multiple("eddypro_batch_processor.core", **_WINDOWS_NAMES),
             patch(
                 "eddypro_batch_processor.core.shutil.copytree",
                 side_effect=_mock_copytree,
@@ -309,6 +482,303 @@ class TestRunEddyProWithMonitoring:
         assert success is False
         assert mock_run.call_count == 1
 
+    def test_reuses_staged_bin_dir(self, tmp_path: Path):
+        """Binaries should be staged once per bin/ folder when reusing."""
+        project_dir = tmp_path / "site" / "2021"
+        project_dir.mkdir(parents=True)
+        project_file = project_dir / "TEST.eddypro"
+        project_file.write_text("project", encoding="utf-8")
+
+        eddypro_bin = tmp_path / "eddypro_bin"
+        eddypro_bin.mkdir()
+        eddypro_exe = eddypro_bin / "eddypro_rp.exe"
+        eddypro_exe.write_text("", encoding="utf-8")
+
+        def _mock_copytree(src: Path, dst: Path, **kwargs) -> Path:
+            dst_path = Path(dst)
+            dst_path.mkdir(parents=True, exist_ok=True)
+            (dst_path / "eddypro_rp.exe").write_text("", encoding="utf-8")
+            (dst_path / "eddypro_fcc.exe").write_text("", encoding="utf-8")
+            return dst_path
+
+        with (
+            patch.multiple("eddypro_batch_processor.core", **_WINDOWS_NAMES),
+            patch(
+                "eddypro_batch_processor.core.shutil.copytree",
+                side_effect=_mock_copytree,
+            ) as mock_copytree,
+            patch(
+                "eddypro_batch_processor.core.run_subprocess_with_monitoring",
+                return_value=0,
+            ),
+        ):
+            for _ in range(2):
+                assert run_eddypro_with_monitoring(
+                    project_file=project_file,
+                    eddypro_executable=eddypro_exe,
+                    stream_output=False,
+                )
+            assert mock_copytree.call_count == 1
+            assert (tmp_path / "site" / "bin").is_dir()
+
+            assert run_eddypro_with_monitoring(
+                project_file=project_file,
+                eddypro_executable=eddypro_exe,
+                stream_output=False,
+                reuse_bin_dir=False,
+            )
+            assert mock_copytree.call_count == 2
+            assert not (tmp_path / "site" / "bin").exists()
+
+    def test_stale_bin_dir_is_restaged(self, tmp_path: Path):
+        """A bin/ left by an interrupted run is replaced, not reused."""
+        project_dir = tmp_path / "site" / "2021"
+        project_dir.mkdir(parents=True)
+        project_file = project_dir / "TEST.eddypro"
+        project_file.write_text("project", encoding="utf-8")
+
+        eddypro_bin = tmp_path / "eddypro_bin"
+        eddypro_bin.mkdir()
+        for name in ("eddypro_rp.exe", "eddypro_fcc.exe"):
+            (eddypro_bin / name).write_bytes(b"binary")
+
+        # Leftover links and a file that no longer exists in the installation
+        stale_bin = tmp_path / "site" / "bin"
+        shutil.copytree(eddypro_bin, stale_bin, copy_function=_link_copy)
+        (stale_bin / "removed.dll").write_bytes(b"old")
+
+        with (
+            patch.multiple("eddypro_batch_processor.core", **_WINDOWS_NAMES),
+            patch(
+                "eddypro_batch_processor.core.run_subprocess_with_monitoring",
+                return_value=0,
+            ),
+        ):
+            assert run_eddypro_with_monitoring(
+                project_file=project_file,
+                eddypro_executable=eddypro_bin / "eddypro_rp.exe",
+                stream_output=False,
+            )
+
+        assert not (stale_bin / "removed.dll").exists()
+        assert (eddypro_bin / "eddypro_rp.exe").read_bytes() == b"binary"
+        assert (stale_bin / "eddypro_rp.exe").read_bytes() == b"binary"
+
+
+class TestRunSubprocessWithMonitoring:
+    """Tests for subprocess execution and output streaming."""
+
+    def test_streams_and_logs_output(self, tmp_path: Path, capfd, caplog):
+        """Streamed output is passed through and logged line by line."""
+        script = "import sys; sys.stdout.write('first\\nsecond\\npartial')"
+        command = [sys.executable, "-c", script]
+
+        with caplog.at_level("INFO", logger="eddypro_batch_processor.eddypro"):
+            return_code = run_subprocess_with_monitoring(
+                command=command,
+                working_dir=tmp_path,
+                stream_output=True,
+                metrics_interval=0.5,
+            )
+
+        assert return_code == 0
+        assert "first\nsecond\npartial" in capfd.readouterr().out
+        logged = [
+            r.message
+            for r in caplog.records
+            if r.name == "eddypro_batch_processor.eddypro"
+        ]
+        assert logged == ["first", "second", "partial"]
+
+
+class TestRunEddyProBatch:
+    """Tests for the parallel rp -> fcc lane batch runner."""
+
+    def _project(self, root: Path, *parts: str) -> Path:
+        project_file = root.joinpath(*parts, "SITE.eddypro")
+        project_file.parent.mkdir(parents=True)
+        project_file.write_text("project", encoding="utf-8")
+        return project_file
+
+    def _exe(self, tmp_path: Path) -> Path:
+        eddypro_bin = tmp_path / "eddypro_bin"
+        eddypro_bin.mkdir()
+        eddypro_exe = eddypro_bin / "eddypro_rp.exe"
+        eddypro_exe.write_text("", encoding="utf-8")
+        return eddypro_exe
+
+    @staticmethod
+    def _mock_copytree(src: Path, dst: Path, **kwargs) -> Path:
+        dst_path = Path(dst)
+        dst_path.mkdir(parents=True, exist_ok=True)
+        (dst_path / "eddypro_rp.exe").write_text("", encoding="utf-8")
+        (dst_path / "eddypro_fcc.exe").write_text("", encoding="utf-8")
+        return dst_path
+
+    def test_lane_runs_rp_then_fcc_per_project(self, tmp_path: Path):
+        """Projects sharing a working dir run rp -> fcc strictly in order."""
+        first = self._project(tmp_path, "site", "a")
+        second = self._project(tmp_path, "site", "b")
+        calls: list[tuple[str, str]] = []
+
+        def _fake_run(**kwargs):
+            calls.append((Path(kwargs["command"][0]).name, kwargs["command"][-1]))
+            return 0
+
+        with (
+            patch.multiple("eddypro_batch_processor.core", **_WINDOWS_NAMES),
+            patch(
+                "eddypro_batch_processor.core.shutil.copytree",
+                side_effect=self._mock_copytree,
+            ) as mock_copytree,
+            patch(
+                "eddypro_batch_processor.core.run_subprocess_with_monitoring",
+                side_effect=_fake_run,
+            ),
+        ):
+            results = run_eddypro_batch(
+                [first, second], self._exe(tmp_path), max_processes=4
+            )
+
+        assert results == {first: True, second: True}
+        assert calls == [
+            ("eddypro_rp.exe", str(first)),
+            ("eddypro_fcc.exe", str(first)),
+            ("eddypro_rp.exe", str(second)),
+            ("eddypro_fcc.exe", str(second)),
+        ]
+        assert mock_copytree.call_count == 1
+        assert not (tmp_path / "site" / "bin").exists()
+
+    def test_failed_lane_does_not_affect_other_lanes(self, tmp_path: Path):
+        """A failing lane does not affect projects in other working dirs."""
+        bad = self._project(tmp_path, "2021", "ec_rflux")
+        good = self._project(tmp_path, "2022", "ec_rflux")
+
+        def _fake_run(**kwargs):
+            return 1 if kwargs["command"][-1] == str(bad) else 0
+
+        with (
+            patch.multiple("eddypro_batch_processor.core", **_WINDOWS_NAMES),
+            patch(
+                "eddypro_batch_processor.core.shutil.copytree",
+                side_effect=self._mock_copytree,
+            ),
+            patch(
+                "eddypro_batch_processor.core.run_subprocess_with_monitoring",
+                side_effect=_fake_run,
+            ) as mock_run,
+        ):
+            results = run_eddypro_batch(
+                [bad, good], self._exe(tmp_path), max_processes=2
+            )
+
+        assert results == {bad: False, good: True}
+        assert mock_run.call_count == 3
+
+    def test_total_processes_capped_by_max_processes(self, tmp_path: Path):
+        """rp and fcc processes together never exceed max_processes."""
+        projects = [
+            self._project(tmp_path, str(year), "ec_rflux") for year in range(2020, 2024)
+        ]
+        lock = threading.Lock()
+        running = 0
+        peak = 0
+
+        def _fake_run(**kwargs):
+            nonlocal running, peak
+            with lock:
+                running += 1
+                peak = max(peak, running)
+            time.sleep(0.02)
+            with lock:
+                running -= 1
+            return 0
+
+        with (
+            patch.multiple("eddypro_batch_processor.core", **_WINDOWS_NAMES),
+            patch(
+                "eddypro_batch_processor.core.shutil.copytree",
+                side_effect=self._mock_copytree,
+            ),
+            patch(
+                "eddypro_batch_processor.core.run_subprocess_with_monitoring",
+                side_effect=_fake_run,
+            ) as mock_run,
+        ):
+            results = run_eddypro_batch(projects, self._exe(tmp_path), max_processes=2)
+
+        assert all(results.values())
+        assert mock_run.call_count == 8
+        assert peak <= 2
+
+
+class TestLinkCopy:
+    """Tests for staging EddyPro binaries via links."""
+
+    def test_hard_links_when_possible(self, tmp_path: Path):
+        """Files on the same filesystem should be hard linked."""
+        src = tmp_path / "eddypro_rp"
+        src.write_bytes(b"binary")
+        dst = tmp_path / "bin" / "eddypro_rp"
+        dst.parent.mkdir()
+
+        _link_copy(str(src), str(dst))
+
+        assert dst.read_bytes() == b"binary"
+        assert dst.stat().st_ino == src.stat().st_ino
+
+    def test_falls_back_to_copy(self, tmp_path: Path):
+        """When linking fails the file should still be copied."""
+        src = tmp_path / "eddypro_rp"
+        src.write_bytes(b"binary")
+        dst = tmp_path / "bin" / "eddypro_rp"
+        dst.parent.mkdir()
+
+        with (
+            patch("eddypro_batch_processor.core.os.link", side_effect=OSError),
+            patch("eddypro_batch_processor.core.sys.platform", "win32"),
+        ):
+            _link_copy(str(src), str(dst))
+
+        assert dst.read_bytes() == b"binary"
+        assert dst.stat().st_ino != src.stat().st_ino
+
+    @pytest.mark.parametrize("platform", ["linux", "win32"])
+    def test_restaging_over_leftover_links(self, tmp_path: Path, platform: str):
+        """Staging over links from an earlier run must not touch the originals."""
+        src_dir = tmp_path / "eddypro_bin"
+        src_dir.mkdir()
+        src = src_dir / "eddypro_rp"
+        src.write_bytes(b"binary")
+        bin_dir = tmp_path / "bin"
+        shutil.copytree(src_dir, bin_dir, copy_function=_link_copy)
+
+        with (
+            patch("eddypro_batch_processor.core.os.link", side_effect=OSError),
+            patch("eddypro_batch_processor.core.sys.platform", platform),
+        ):
+            shutil.copytree(
+                src_dir, bin_dir, dirs_exist_ok=True, copy_function=_link_copy
+            )
+        shutil.copytree(src_dir, bin_dir, dirs_exist_ok=True, copy_function=_link_copy)
+
+        assert src.read_bytes() == b"binary"
+        assert (bin_dir / "eddypro_rp").stat().st_ino == src.stat().st_ino
+
+    def test_replaces_stale_copy(self, tmp_path: Path):
+        """A leftover file that is not a link to the source is replaced."""
+        src = tmp_path / "eddypro_rp"
+        src.write_bytes(b"new binary")
+        dst = tmp_path / "bin" / "eddypro_rp"
+        dst.parent.mkdir()
+        dst.write_bytes(b"old")
+
+        _link_copy(str(src), str(dst))
+
+        assert dst.read_bytes() == b"new binary"
+        assert src.read_bytes() == b"new binary"
+
 
 if __name__ == "__main__":
     pytest.main([__file__])
@@ -172,7 +172,8 @@ sa_full_spectra =
 
         # Check manifest has expected keys
         assert "run_id" in manifest
-        assert "config_snapshot" in manifest
+        assert "config_ref" in manifest
+        assert (manifest_file.parent / manifest["config_ref"]).exists()
         assert "scenarios" in manifest
         assert "start_time" in manifest
         assert "end_time" in manifest
@@ -1,5 +1,6 @@
 """Tests for ECMD utilities."""
 
+from datetime import datetime
 from pathlib import Path
 
 import pytest
@@ -228,3 +229,122 @@ def test_select_ecmd_row_no_site_rows_raises(tmp_path: Path) -> None:
 
     with pytest.raises(ecmd.ECMDError):
         ecmd.select_ecmd_row_for_year(ecmd_path, "SITE", 2021)
+
+
+def _dynamic_metadata_row(date: str, site: str = "SITE") -> dict[str, str]:
+    return {
+        "DATE_OF_VARIATION_EF": date,
+        "SITEID": site,
+        "ALTITUDE": "10",
+        "CANOPY_HEIGHT": "0.5",
+        "LATITUDE": "1.0",
+        "LONGITUDE": "2.0",
+        "ACQUISITION_FREQUENCY": "10",
+        "FILE_DURATION": "30",
+        "SA_HEIGHT": "3.1",
+        "SA_WIND_DATA_FORMAT": "uvw",
+        "SA_NORTH_ALIGNEMENT": "spar",
+        "SA_NORTH_OFFSET": "60",
+        "SA_MANUFACTURER": "gill",
+        "SA_MODEL": "hs_50_1",
+        "GA_TUBE_LENGTH": "71.1",
+        "GA_TUBE_DIAMETER": "5.3",
+        "GA_FLOWRATE": "12",
+        "GA_NORTHWARD_SEPARATION": "-11",
+        "GA_EASTWARD_SEPARATION": "-18",
+        "GA_VERTICAL_SEPARATION": "0",
+        "GA_MANUFACTURER": "licor",
+        "GA_MODEL": "li7200_1",
+    }
+
+
+def test_generate_dynamic_metadata_output(
+    tmp_path: Path, caplog: pytest.LogCaptureFixture
+) -> None:
+    ecmd_path = tmp_path / "ecmd.csv"
+    _write_ecmd_file(
+        ecmd_path,
+        [
+            _dynamic_metadata_row("202001010000"),
+            _dynamic_metadata_row("202001010000", site="OTHER"),
+            _dynamic_metadata_row(""),
+            _dynamic_metadata_row("not-a-date"),
+            _dynamic_metadata_row("202106151230"),
+        ],
+    )
+    output_path = tmp_path / "out" / "SITE_dynamic_metadata.txt"
+
+    ecmd.generate_dynamic_metadata(ecmd_path, output_path, "SITE")
+
+    skip_warnings = [r.message for r in caplog.records if "Skipped" in r.message]
+    assert skip_warnings == [
+        "Skipped 1 ECMD row(s) with no DATE_OF_VARIATION_EF and 1 with invalid "
+        "dates: ['not-a-date']"
+    ]
+    lines = output_path.read_bytes().decode("utf-8").split("\r\n")
+    assert lines[0].startswith("date,time,file_length,acquisition_frequency")
+    assert lines[0].endswith("h2o_irga_tube_diameter,h2o_irga_flowrate")
+    assert lines[1:] == [
+        "2020-01-01,00:00,30,10,0.5,gill,hs_50_1,3.1,uvw,spar,60,"
+        "licor,li7200_1,-11,-18,71.1,5.3,12,licor,li7200_1,-11,-18,71.1,5.3,12",
+        "2021-06-15,12:30,30,10,0.5,gill,hs_50_1,3.1,uvw,spar,60,"
+        "licor,li7200_1,-11,-18,71.1,5.3,12,licor,li7200_1,-11,-18,71.1,5.3,12",
+        "",
+    ]
+
+
+def test_generate_dynamic_metadata_open_path_without_tube_columns(
+    tmp_path: Path,
+) -> None:
+    row = _dynamic_metadata_row("202001010000")
+    tube_columns = ("GA_TUBE_LENGTH", "GA_TUBE_DIAMETER", "GA_FLOWRATE")
+    header = [col for col in row if col not in tube_columns]
+    ecmd_path = tmp_path / "ecmd.csv"
+    ecmd_path.write_text(
+        ",".join(header) + "\n" + ",".join(row[col] for col in header) + "\n",
+        encoding="utf-8",
+    )
+    output_path = tmp_path / "dyn.txt"
+
+    ecmd.generate_dynamic_metadata(ecmd_path, output_path, "SITE")
+
+    data_line = output_path.read_text(encoding="utf-8").splitlines()[1]
+    assert data_line.endswith("licor,li7200_1,-11,-18,,,")
+
+
+def test_generate_dynamic_metadata_trailing_extra_field(tmp_path: Path) -> None:
+    ecmd_path = tmp_path / "ecmd.csv"
+    _write_ecmd_file(ecmd_path, [_dynamic_metadata_row("202001010000")])
+    # A trailing delimiter gives the data row one field more than the header
+    header, data = ecmd_path.read_text(encoding="utf-8").splitlines()
+    ecmd_path.write_text(f"{header}\n{data},\n", encoding="utf-8")
+    output_path = tmp_path / "dyn.txt"
+
+    ecmd.generate_dynamic_metadata(ecmd_path, output_path, "SITE")
+
+    lines = output_path.read_text(encoding="utf-8").splitlines()
+    assert len(lines) == 2
+    assert lines[1].startswith("2020-01-01,00:00,30,10,0.5,gill,hs_50_1,")
+
+
+def test_generate_dynamic_metadata_missing_required_columns_raises(
+    tmp_path: Path,
+) -> None:
+    ecmd_path = tmp_path / "ecmd.csv"
+    ecmd_path.write_text("DATE_OF_VARIATION_EF,SITEID\n", encoding="utf-8")
+
+    with pytest.raises(ecmd.ECMDError) as exc:
+        ecmd.generate_dynamic_metadata(ecmd_path, tmp_path / "dyn.txt", "SITE")
+    assert "missing required columns" in str(exc.value).lower()
+
+
+def test_parse_ecmd_date_valid() -> None:
+    assert ecmd.parse_ecmd_date("202106151230") == datetime(2021, 6, 15, 12, 30)
+
+
+@pytest.mark.parametrize(
+    "date_str", ["", "2021061512", "20210615123O", "202113011200", "2021-06-15"]
+)
+def test_parse_ecmd_date_invalid_raises(date_str: str) -> None:
+    with pytest.raises(ecmd.ECMDError):
+        ecmd.parse_ecmd_date(date_str)
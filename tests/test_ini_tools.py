@@ -6,12 +6,38 @@ Tests parameter validation, INI file patching, and scenario suffix generation.
 """
 
 import configparser
+import inspect
 import shutil
+import sys
 import tempfile
 import unittest
 from pathlib import Path
 
-from src.eddypro_batch_processor import ini_tools
+from eddypro_batch_processor import ini_tools
+
+# Complete ECMD row used to populate metadata templates
+_METADATA_ECMD_ROW = {
+    "ALTITUDE": "38",
+    "CANOPY_HEIGHT": "0.1",
+    "LATITUDE": "74.48",
+    "LONGITUDE": "-20.55",
+    "ACQUISITION_FREQUENCY": "10",
+    "FILE_DURATION": "30",
+    "SA_HEIGHT": "3.16",
+    "SA_WIND_DATA_FORMAT": "uvw",
+    "SA_NORTH_ALIGNEMENT": "spar",
+    "SA_NORTH_OFFSET": "60",
+    "GA_TUBE_LENGTH": "71.1",
+    "GA_TUBE_DIAMETER": "5.3",
+    "GA_FLOWRATE": "12",
+    "GA_NORTHWARD_SEPARATION": "-11",
+    "GA_EASTWARD_SEPARATION": "-18",
+    "GA_VERTICAL_SEPARATION": "0",
+    "SA_MANUFACTURER": "Gill",
+    "SA_MODEL": "R3",
+    "GA_MANUFACTURER": "LI-COR",
+    "GA_MODEL": "LI-7500",
+}
 
 
 class TestParameterValidation(unittest.TestCase):
@@ -85,6 +111,16 @@ class TestParameterValidation(unittest.TestCase):
                 with self.assertRaises(ini_tools.INIParameterError):
                     ini_tools.validate_parameter("rot_meth", value)
 
+    def test_validate_parameter_is_memoized(self):
+        """Repeated validation of the same pair should hit the cache."""
+        ini_tools.validate_parameter("tlag_meth", 4)
+        hits = ini_tools._validate_parameter_cached.cache_info().hits
+
+        self.assertEqual(ini_tools.validate_parameter("tlag_meth", 4), 4)
+        self.assertEqual(
+            ini_tools._validate_parameter_cached.cache_info().hits, hits + 1
+        )
+
     def test_validate_parameters_dict(self):
         """Test validation of parameter dictionaries."""
         # Valid parameters
@@ -117,12 +153,35 @@ class TestParameterValidation(unittest.TestCase):
         # Check structure of parameter info
         for _param_name, param_info in info.items():
             self.assertIn("section", param_info)
+            self.assertIn("ini_key", param_info)
             self.assertIn("allowed_values", param_info)
             self.assertIn("description", param_info)
             self.assertIsInstance(param_info["section"], str)
             self.assertIsInstance(param_info["allowed_values"], set)
             self.assertIsInstance(param_info["description"], str)
 
+        self.assertEqual(
+            ini_tools.PARAMETER_INI_KEY_MAP, {"despike_meth": "despike_vm"}
+        )
+
+
+class TestModuleIdentity(unittest.TestCase):
+    """Guard against the module being imported under two names."""
+
+    def test_module_defined_once(self):
+        """Only one ini_tools module object should be loaded."""
+        loaded = [
+            name
+            for name in sys.modules
+            if name.endswith("eddypro_batch_processor.ini_tools")
+        ]
+        self.assertEqual(loaded, ["eddypro_batch_processor.ini_tools"])
+        source = Path(inspect.getsourcefile(ini_tools) or "")
+        self.assertEqual(source.parts[-2:], ("eddypro_batch_processor", "ini_tools.py"))
+        self.assertEqual(
+            ini_tools.PARAMETER_VALIDATION["despike_meth"]["ini_key"], "despike_vm"
+        )
+
 
 class TestINIFileOperations(unittest.TestCase):
     """Test INI file reading, patching, and writing operations."""
@@ -176,6 +235,69 @@ despike_meth=0
         with self.assertRaises(configparser.Error):
             ini_tools.read_ini_template(malformed_path)
 
+    def test_read_ini_template_matches_configparser(self):
+        """The flat template parser should match ConfigParser."""
+        content = ";EDDYPRO_PROCESSING\n" + self.test_ini_content + "empty=\n"
+        self.template_path.write_text(content, encoding="utf-8")
+        expected = configparser.ConfigParser()
+        expected.read_string(content)
+
+        config = ini_tools.read_ini_template(self.template_path)
+
+        self.assertEqual(config.sections(), expected.sections())
+        for section in expected.sections():
+            self.assertEqual(dict(config[section]), dict(expected[section]))
+
+    def test_read_ini_template_rejects_continuation_lines(self):
+        """Lines outside the flat key=value grammar should raise."""
+        malformed_path = self.temp_dir / "continuation.ini"
+        malformed_path.write_text("[Project]\ntitle=a\n  b\n", encoding="utf-8")
+
+        with self.assertRaises(configparser.Error):
+            ini_tools.read_ini_template(malformed_path)
+
+    def test_read_ini_template_rejects_colon_options(self):
+        """'key: value' lines should raise instead of being misread."""
+        colon_path = self.temp_dir / "colon.ini"
+        colon_path.write_text("[Project]\ntitle=a\npath: C:/data=1\n", encoding="utf-8")
+
+        with self.assertRaisesRegex(configparser.Error, "line 3: 'key: value'"):
+            ini_tools.read_ini_template(colon_path)
+
+    def test_read_ini_template_percent_values(self):
+        """Values interpolation cannot parse are read like ConfigParser does."""
+        percent_path = self.temp_dir / "percent.ini"
+        percent_path.write_text("[Project]\ntitle=100%\n", encoding="utf-8")
+
+        config = ini_tools.read_ini_template(percent_path)
+
+        self.assertEqual(config.get("Project", "title", raw=True), "100%")
+        self.assertNotIn(str(percent_path), ini_tools._TEMPLATE_CACHE)
+
+    def test_read_ini_template_cache_returns_copies(self):
+        """Patching a cached template must not leak into later reads."""
+        first = ini_tools.read_ini_template(self.template_path)
+        first.set("RawProcess_Settings", "rot_meth", "3")
+
+        second = ini_tools.read_ini_template(self.template_path)
+
+        self.assertIn(str(self.template_path), ini_tools._TEMPLATE_CACHE)
+        self.assertEqual(second.get("RawProcess_Settings", "rot_meth"), "1")
+
+    def test_read_ini_template_cache_invalidated_on_change(self):
+        """Editing the template should bypass the cached parse."""
+        ini_tools.read_ini_template(self.template_path)
+        self.template_path.write_text(
+            self.test_ini_content.replace("rot_meth=1", "rot_meth=3\nextra=1"),
+            encoding="utf-8",
+        )
+
+        config = ini_tools.read_ini_template(self.template_path)
+
+        self.assertEqual(config.get("RawProcess_Settings", "rot_meth"), "3")
+        ini_tools.clear_template_cache()
+        self.assertEqual(ini_tools._TEMPLATE_CACHE, {})
+
     def test_patch_ini_parameters(self):
         """Test patching INI configuration with parameters."""
         config = ini_tools.read_ini_template(self.template_path)
@@ -247,6 +369,25 @@ despike_meth=0
         self.assertTrue(nested_path.exists())
         self.assertTrue(nested_path.parent.exists())
 
+    def test_write_ini_files_batch(self):
+        """Batch writes should match write_ini_file output for every file."""
+        config = ini_tools.read_ini_template(self.template_path)
+        single_path = self.temp_dir / "single.ini"
+        ini_tools.write_ini_file(config, single_path)
+
+        batch_paths = [
+            self.temp_dir / "a" / "one.ini",
+            self.temp_dir / "a" / "two.ini",
+            self.temp_dir / "b" / "three.ini",
+        ]
+        ini_tools.write_ini_files_batch((config, path) for path in batch_paths)
+
+        expected = single_path.read_bytes()
+        self.assertTrue(expected.startswith(b";EDDYPRO_PROCESSING\n[Project]\n"))
+        for path in batch_paths:
+            with self.subTest(path=path.name):
+                self.assertEqual(path.read_bytes(), expected)
+
     def test_create_patched_ini_with_parameters(self):
         """Test complete INI patching workflow with parameters."""
         output_path = self.temp_dir / "patched.ini"
@@ -292,6 +433,47 @@ despike_meth=0
         # Verify output file was not created
         self.assertFalse(output_path.exists())
 
+    def test_create_patched_ini_fast_matches_full_round_trip(self):
+        """The text-patching fast path should agree with create_patched_ini."""
+        template_path = Path("config") / "EddyProProject_template.ini"
+        parameters = {"rot_meth": 3, "tlag_meth": 4, "despike_meth": 1, "hf_meth": 1}
+        fast_path = self.temp_dir / "fast.eddypro"
+        slow_path = self.temp_dir / "slow.eddypro"
+
+        ini_tools.create_patched_ini_fast(template_path, fast_path, parameters)
+        ini_tools.create_patched_ini(template_path, slow_path, parameters)
+
+        fast = configparser.ConfigParser()
+        fast.read(fast_path, encoding="utf-8")
+        slow = configparser.ConfigParser()
+        slow.read(slow_path, encoding="utf-8")
+        self.assertEqual(
+            {s: dict(fast[s]) for s in fast.sections()},
+            {s: dict(slow[s]) for s in slow.sections()},
+        )
+        self.assertEqual(fast.get("RawProcess_ParameterSettings", "despike_vm"), "1")
+
+        # Lines other than the patched values are kept verbatim
+        template_lines = template_path.read_text(encoding="utf-8").splitlines()
+        fast_lines = fast_path.read_text(encoding="utf-8").splitlines()
+        changed = [a for a, b in zip(template_lines, fast_lines, strict=True) if a != b]
+        self.assertLessEqual(len(changed), len(parameters))
+
+    def test_create_patched_ini_fast_falls_back_when_key_missing(self):
+        """A key absent from the template should use the full round-trip."""
+        output_path = self.temp_dir / "patched.ini"
+
+        ini_tools.create_patched_ini_fast(
+            self.template_path, output_path, {"despike_meth": 1}
+        )
+
+        config = configparser.ConfigParser()
+        config.read(output_path, encoding="utf-8")
+        self.assertEqual(config.get("RawProcess_ParameterSettings", "despike_vm"), "1")
+        self.assertTrue(
+            output_path.read_text(encoding="utf-8").startswith(";EDDYPRO_PROCESSING")
+        )
+
     def test_patch_ini_paths_updates_expected_fields(self):
         """Test that patch_ini_paths updates key Project and data path fields."""
         config = ini_tools.read_ini_template(self.template_path)
@@ -333,6 +515,17 @@ despike_meth=0
             f"{out_path}/eddypro_full_cospectra",
         )
 
+        # An absolute proj_file is used as-is rather than joined to out_path
+        ini_tools.patch_ini_paths(
+            config,
+            site_id="SITE",
+            proj_file="/abs/meta/SITE.metadata",
+            dyn_metadata_file=dyn_md,
+            data_path=data_path,
+            out_path=out_path,
+        )
+        self.assertEqual(config.get("Project", "proj_file"), "/abs/meta/SITE.metadata")
+
     def test_patch_project_metadata_sets_site_id_fields(self):
         """Project title and ID should be set to site_id."""
         config = configparser.ConfigParser()
@@ -351,6 +544,40 @@ despike_meth=0
         self.assertTrue(config.get("Project", "creation_date").strip())
         self.assertTrue(config.get("Project", "last_change_date").strip())
 
+    def test_patch_project_metadata_uses_given_timestamp(self):
+        """A caller-supplied timestamp should be written verbatim."""
+        config = configparser.ConfigParser()
+        config.add_section("Project")
+        config.set("Project", "creation_date", "2020-01-01T00:00:00")
+
+        ini_tools.patch_project_metadata(
+            config, site_id="GL-ZaF", year=2021, now="2024-05-06T07:08:09"
+        )
+
+        self.assertEqual(config.get("Project", "creation_date"), "2020-01-01T00:00:00")
+        self.assertEqual(
+            config.get("Project", "last_change_date"), "2024-05-06T07:08:09"
+        )
+
+    def test_validate_eddypro_inputs(self):
+        """Preflight should require at least one CSV file in data_path."""
+        data_dir = self.temp_dir / "raw"
+        (data_dir / "folder.csv").mkdir(parents=True)
+        (data_dir / "notes.txt").write_text("x", encoding="utf-8")
+        config = configparser.ConfigParser()
+        config.add_section("Project")
+        config.add_section("RawProcess_General")
+        config.set("RawProcess_General", "data_path", str(data_dir))
+
+        with self.assertRaises(ini_tools.INIParameterError):
+            ini_tools.validate_eddypro_inputs(config)
+
+        (data_dir / "2021-01-01T000000_AIU-1234.csv").write_text("x", encoding="utf-8")
+        config.set("Project", "file_prototype", "yyyy-mm-ddTHHMM??_AIU-1234.csv")
+        with self.assertLogs(ini_tools.logger, level="DEBUG") as logs:
+            ini_tools.validate_eddypro_inputs(config)
+        self.assertTrue(any("1 CSV file(s) found" in line for line in logs.output))
+
     def test_validate_eddypro_metadata(self):
         """Ensure metadata validation passes for a valid template file."""
         config = configparser.ConfigParser()
@@ -370,6 +597,40 @@ despike_meth=0
         # Should not raise
         ini_tools.validate_eddypro_metadata(config)
 
+    def test_validate_eddypro_metadata_missing_variables(self):
+        """Only [FileDescription] *_variable keys should count as declared."""
+        tmp_meta = self.temp_dir / "SITE.metadata"
+        tmp_meta.write_text(
+            ";GHG_METADATA\n[FileDescription]\ncol_1_variable=u\n"
+            "col_2_variable=v\ncol_3_variable=w\n[Other]\ncol_4_variable=ts\n",
+            encoding="utf-8",
+        )
+        config = configparser.ConfigParser()
+        config.add_section("Project")
+        config.set("Project", "proj_file", str(tmp_meta))
+
+        with self.assertRaisesRegex(ini_tools.INIParameterError, "variables: ts"):
+            ini_tools.validate_eddypro_metadata(config)
+
+        tmp_meta.write_text("[Other]\ncol_1_variable=u\n", encoding="utf-8")
+        with self.assertRaisesRegex(ini_tools.INIParameterError, "FileDescription"):
+            ini_tools.validate_eddypro_metadata(config)
+
+    def test_validate_eddypro_metadata_crlf(self):
+        """Metadata files with Windows line endings should validate."""
+        tmp_meta = self.temp_dir / "SITE.metadata"
+        tmp_meta.write_bytes(
+            b";GHG_METADATA\r\n[FileDescription]\r\ncol_1_variable=u\r\n"
+            b"col_2_variable=v\r\ncol_3_variable=w\r\ncol_4_variable=ts\r\n"
+            b"[Other]\r\nkey=value\r\n"
+        )
+        config = configparser.ConfigParser()
+        config.add_section("Project")
+        config.set("Project", "proj_file", str(tmp_meta))
+
+        # Should not raise
+        ini_tools.validate_eddypro_metadata(config)
+
     def test_validate_eddypro_metadata_missing_file(self):
         """Validator should raise for missing metadata file."""
         config = configparser.ConfigParser()
@@ -387,28 +648,7 @@ despike_meth=0
         metadata_path = self.temp_dir / "SITE.metadata"
         shutil.copyfile(repo_meta, metadata_path)
 
-        ecmd_row = {
-            "ALTITUDE": "38",
-            "CANOPY_HEIGHT": "0.1",
-            "LATITUDE": "74.48",
-            "LONGITUDE": "-20.55",
-            "ACQUISITION_FREQUENCY": "10",
-            "FILE_DURATION": "30",
-            "SA_HEIGHT": "3.16",
-            "SA_WIND_DATA_FORMAT": "uvw",
-            "SA_NORTH_ALIGNEMENT": "spar",
-            "SA_NORTH_OFFSET": "60",
-            "GA_TUBE_LENGTH": "71.1",
-            "GA_TUBE_DIAMETER": "5.3",
-            "GA_FLOWRATE": "12",
-            "GA_NORTHWARD_SEPARATION": "-11",
-            "GA_EASTWARD_SEPARATION": "-18",
-            "GA_VERTICAL_SEPARATION": "0",
-            "SA_MANUFACTURER": "Gill",
-            "SA_MODEL": "R3",
-            "GA_MANUFACTURER": "LI-COR",
-            "GA_MODEL": "LI-7500",
-        }
+        ecmd_row = dict(_METADATA_ECMD_ROW)
 
         output_dir = self.temp_dir / "out"
         ini_tools.populate_metadata_file(
@@ -450,6 +690,27 @@ despike_meth=0
                 msg=f"col_{col}_instrument should be GA_MODEL",
             )
 
+    def test_populate_metadata_file_accepts_colon_options(self):
+        """User metadata may use any syntax the stock ConfigParser accepts."""
+        metadata_path = self.temp_dir / "SITE.metadata"
+        metadata_path.write_text(
+            (Path("config") / "metadata_template.ini").read_text(encoding="utf-8")
+            + "\n[Notes]\nremark: installed on a mast\n",
+            encoding="utf-8",
+        )
+
+        ini_tools.populate_metadata_file(
+            metadata_path,
+            site_id="SITE",
+            output_dir=self.temp_dir,
+            ecmd_row=dict(_METADATA_ECMD_ROW),
+        )
+
+        config = configparser.ConfigParser()
+        config.read(metadata_path, encoding="utf-8")
+        self.assertEqual(config.get("Notes", "remark"), "installed on a mast")
+        self.assertEqual(config.get("Site", "site_id"), "SITE")
+
     def test_populate_metadata_file_missing_ecmd_values_raises(self):
         """Missing ECMD values should raise validation errors."""
         repo_meta = Path("config") / "metadata_template.ini"
@@ -624,6 +885,20 @@ class TestScenarioSuffixGeneration(unittest.TestCase):
         # Should fallback to original parameter name
         self.assertEqual(result, "_unknown_param1")
 
+    def test_generate_scenario_suffix_mixed_known_and_unknown(self):
+        """Unknown names should still sort alphabetically among known ones."""
+        parameters = {"tlag_meth": 2, "extra": 5, "rot_meth": 1}
+        self.assertEqual(
+            ini_tools.generate_scenario_suffix(parameters), "_extra5_rot1_tlag2"
+        )
+
+    def test_generate_scenario_suffix_distinguishes_value_types(self):
+        """Memoization must not conflate equal values of different types."""
+        self.assertEqual(ini_tools.generate_scenario_suffix({"rot_meth": 1}), "_rot1")
+        self.assertEqual(
+            ini_tools.generate_scenario_suffix({"rot_meth": True}), "_rotTrue"
+        )
+
 
 class TestConditionalDateRanges(unittest.TestCase):
     """Test conditional date/time range population."""
@@ -5,8 +5,11 @@ Tests the PerformanceMonitor class and related functionality with mocked
 dependencies to ensure deterministic behavior.
 """
 
+import csv
 import itertools
 import json
+import random
+import statistics
 import tempfile
 import threading
 import time
@@ -21,7 +24,10 @@ except ImportError:
     psutil_module = None
 
 from eddypro_batch_processor.monitor import (
+    CSV_FLUSH_EVERY,
     MonitoredOperation,
+    OnlineStat,
+    P2Quantile,
     PerformanceMonitor,
     create_monitor,
 )
@@ -173,6 +179,291 @@ class TestPerformanceMonitor:
         assert "process_memory_rss" in sample
         assert sample["process_cpu_percent"] == 25.0
 
+    def test_relative_time_uses_monotonic_clock(self, temp_dir, mock_psutil):
+        """relative_time is derived from monotonic_ns, not the wall clock."""
+        monitor = PerformanceMonitor(output_dir=temp_dir)
+        monitor._start_ns = 5_000_000_000
+
+        with (
+            patch("time.monotonic_ns", return_value=6_500_000_000),
+            patch("time.time", return_value=100.0),
+        ):
+            sample = monitor._collect_sample()
+
+        assert sample["timestamp"] == 100.0
+        assert sample["timestamp_ns"] == 6_500_000_000
+        assert sample["relative_time"] == 1.5
+
+    def test_io_rates_from_counter_deltas(self, temp_dir, mock_psutil):
+        """Byte counters become per-second rates between consecutive samples."""
+        monitor = PerformanceMonitor(output_dir=temp_dir)
+        monitor._start_ns = 0
+        disk = mock_psutil.disk_io_counters.return_value
+
+        with patch("time.monotonic_ns", side_effect=[0, 500_000_000, 1_000_000_000]):
+            first = monitor._collect_sample()
+            disk.read_bytes += 2_000_000
+            second = monitor._collect_sample()
+            disk.read_bytes = 10  # counter reset
+            third = monitor._collect_sample()
+
+        assert first["system_disk_read_rate_bytes_per_s"] is None
+        assert second["system_disk_read_rate_bytes_per_s"] == 4_000_000.0
+        assert second["system_disk_write_rate_bytes_per_s"] == 0.0
+        assert third["system_disk_read_rate_bytes_per_s"] is None
+        # Cumulative counters stay in the time series
+        assert second["system_disk_read_bytes"] == 3_000_000
+
+    @pytest.mark.parametrize("full_io", [False, True])
+    def test_unchanged_counters_skipped(self, temp_dir, mock_psutil, full_io):
+        """Idle counter groups keep their zero rates but drop the counters."""
+        monitor = PerformanceMonitor(output_dir=temp_dir, full_io=full_io)
+        monitor._start_ns = 0
+
+        with patch("time.monotonic_ns", side_effect=[0, 500_000_000]):
+            first = monitor._collect_sample()
+            second = monitor._collect_sample()
+
+        assert first["system_disk_read_bytes"] == 1000000
+        assert second["system_disk_read_rate_bytes_per_s"] == 0.0
+        assert second["system_disk_write_rate_bytes_per_s"] == 0.0
+        assert ("system_disk_read_bytes" in second) is full_io
+        assert ("system_disk_read_count" in second) is full_io
+
+        monitor._append_sample(first)
+        monitor._append_sample(second)
+        totals = monitor._generate_summary()["totals"]
+        assert totals["system_disk_read_bytes"]["delta"] == 0
+        monitor._write_metrics_csv()
+
+    def test_counters_reported_as_totals(self, temp_dir, mock_psutil):
+        """Cumulative counters go to a totals block instead of the stats."""
+        monitor = PerformanceMonitor(output_dir=temp_dir)
+        monitor._append_sample(
+            {"timestamp": 1.0, "system_disk_read_bytes": 100, "cpu": 1.0}
+        )
+        monitor._append_sample(
+            {"timestamp": 2.0, "system_disk_read_bytes": 350, "cpu": 3.0}
+        )
+
+        summary = monitor._generate_summary()
+        assert summary["totals"]["system_disk_read_bytes"] == {
+            "start": 100,
+            "end": 350,
+            "delta": 250,
+        }
+        assert "system_disk_read_bytes" not in summary["metrics"]
+        assert summary["metrics"]["cpu"]["mean"] == 2.0
+        monitor._write_metrics_csv()
+
+    def test_monitor_loop_schedules_against_deadline(self, temp_dir, mock_psutil):
+        """Sleep shrinks by collection time and re-syncs after an overrun."""
+        monitor = PerformanceMonitor(interval_seconds=1.0, output_dir=temp_dir)
+        monitor._monitoring = True
+        # start, after 1st sample (0.25s work), after 2nd (overrun), after 3rd
+        clock = iter([10.0, 10.25, 12.5, 12.5, 12.75])
+        sleeps = []
+
+        def fake_sleep(delay):
+            sleeps.append(delay)
+            if len(sleeps) == 2:
+                monitor._monitoring = False
+
+        with (
+            patch("time.monotonic", side_effect=lambda: next(clock)),
+            patch.object(monitor._stop_event, "wait", side_effect=fake_sleep),
+            patch.object(monitor, "_collect_sample", return_value={"timestamp": 0.0}),
+        ):
+            monitor._monitor_loop()
+
+        # 1st: deadline 11.0 - 10.25; 2nd: overrun, no sleep; 3rd: 13.5 - 12.75
+        assert sleeps == [0.75, 0.75]
+        assert monitor.sample_count == 4  # three scheduled plus the closing one
+
+    def test_burst_sampling(self, temp_dir, mock_psutil):
+        """Each interval takes burst_samples samples tagged with a burst_id."""
+        monitor = PerformanceMonitor(
+            interval_seconds=1.0,
+            output_dir=temp_dir,
+            burst_samples=2,
+            burst_interval=0.25,
+        )
+        monitor._monitoring = True
+        clock = iter([10.0, 10.0, 10.5, 11.0])
+        sleeps = []
+
+        def fake_sleep(delay):
+            sleeps.append(delay)
+            if len(sleeps) == 3:
+                monitor._monitoring = False
+
+        with (
+            patch("time.monotonic", side_effect=lambda: next(clock)),
+            patch.object(monitor._stop_event, "wait", side_effect=fake_sleep),
+            patch.object(
+                monitor, "_collect_sample", side_effect=lambda *_: {"timestamp": 0.0}
+            ),
+        ):
+            monitor._monitor_loop()
+
+        assert sleeps == [0.25, 0.5, 0.25]
+        monitor._write_metrics_csv()
+        with open(monitor.metrics_csv_path, newline="") as f:
+            burst_ids = [row["burst_id"] for row in csv.DictReader(f)]
+        assert burst_ids == ["0", "0", "1", "2"]  # last is the closing sample
+
+    def test_warmup_primes_cpu_and_drops_first_sample(self, temp_dir, mock_psutil):
+        """cpu_percent is primed at start and the first sample is discarded."""
+        monitor = PerformanceMonitor(interval_seconds=1.0, output_dir=temp_dir)
+        monitor._process = mock_psutil.Process.return_value
+        monitor._monitoring = True
+        monitor._warmup = True
+        clock = iter([10.0, 10.0, 11.0])
+        samples = iter([{"timestamp": 1.0}, {"timestamp": 2.0}, {"timestamp": 3.0}])
+
+        def fake_sleep(_delay):
+            if monitor.sample_count == 1:
+                monitor._monitoring = False
+
+        with (
+            patch("time.monotonic", side_effect=lambda: next(clock)),
+            patch.object(monitor._stop_event, "wait", side_effect=fake_sleep),
+            patch.object(
+                monitor, "_collect_sample", side_effect=lambda *_: next(samples)
+            ),
+        ):
+            monitor._monitor_loop()
+
+        # Priming runs on the monitor thread; _collect_sample is patched out
+        mock_psutil.cpu_percent.assert_called_once_with(interval=None)
+        monitor._process.cpu_percent.assert_called_once_with()
+        assert not monitor._warmup
+        assert monitor.sample_count == 2
+        assert monitor._first_timestamp == 2.0
+        assert monitor._last_timestamp == 3.0
+        monitor._write_metrics_csv()
+
+    def test_stop_wakes_sampler_immediately(self, temp_dir, mock_psutil):
+        """stop_monitoring does not wait out the interval and keeps a sample."""
+        monitor = PerformanceMonitor(interval_seconds=30.0, output_dir=temp_dir)
+
+        started = time.monotonic()
+        monitor.start_monitoring()
+        summary = monitor.stop_monitoring()
+
+        assert time.monotonic() - started < 2.0
+        assert not monitor._monitor_thread.is_alive()
+        assert summary["samples"]["count"] >= 1
+
+    def test_shared_sampler_tags_regions(self, temp_dir, mock_psutil):
+        """Shared monitors run on one thread and label samples by region."""
+        from eddypro_batch_processor.monitor import _SHARED_SAMPLER  # noqa: PLC0415
+
+        rp = PerformanceMonitor(
+            interval_seconds=0.1, output_dir=temp_dir, scenario_suffix="rp", shared=True
+        )
+        fcc = PerformanceMonitor(
+            interval_seconds=0.1,
+            output_dir=temp_dir,
+            scenario_suffix="fcc",
+            shared=True,
+        )
+
+        rp.start_monitoring()
+        fcc.start_monitoring()
+        sampler_thread = _SHARED_SAMPLER._thread
+        time.sleep(0.35)
+        assert rp._monitor_thread is None
+        assert fcc._monitor_thread is None
+        rp_summary = rp.stop_monitoring()
+        fcc_summary = fcc.stop_monitoring()
+        sampler_thread.join(timeout=2.0)
+
+        assert not sampler_thread.is_alive()
+        assert rp_summary["samples"]["count"] >= 2
+        assert fcc_summary["samples"]["count"] >= 2
+        with open(rp.metrics_csv_path, newline="") as f:
+            rows = list(csv.DictReader(f))
+        assert rows[0]["active_regions"] == "rp;fcc"
+        assert rows[0]["burst_id"] == "0"
+        assert "active_regions" not in rp_summary["metrics"]
+
+    def test_shared_sampler_stop_during_sample(self, temp_dir, mock_psutil):
+        """Stopping while a sample is in flight leaves the CSV intact."""
+        from eddypro_batch_processor.monitor import _SHARED_SAMPLER  # noqa: PLC0415
+
+        monitor = PerformanceMonitor(
+            interval_seconds=0.05, output_dir=temp_dir, shared=True
+        )
+        collect_sample = monitor._collect_sample
+        slow = threading.Event()
+        in_flight = threading.Event()
+
+        def slow_collect_sample(*args, **kwargs):
+            if slow.is_set():
+                in_flight.set()
+                time.sleep(0.2)
+            return collect_sample(*args, **kwargs)
+
+        with patch.object(monitor, "_collect_sample", slow_collect_sample):
+            monitor.start_monitoring()
+            time.sleep(0.15)
+            slow.set()
+            assert in_flight.wait(timeout=2.0)
+            summary = monitor.stop_monitoring()
+            # A stale region would be sampled again after the CSV was closed
+            time.sleep(0.5)
+
+        assert monitor not in _SHARED_SAMPLER._regions
+        with open(monitor.metrics_csv_path, newline="") as f:
+            rows = list(csv.DictReader(f))
+        assert len(rows) == summary["samples"]["count"] >= 1
+
+    def test_burst_configuration(self, temp_dir):
+        """burst_interval defaults to, and is clamped by, interval/burst_samples."""
+        monitor = PerformanceMonitor(
+            interval_seconds=1.0, output_dir=temp_dir, burst_samples=4
+        )
+        assert monitor.burst_interval == 0.25
+
+        monitor = PerformanceMonitor(
+            interval_seconds=1.0,
+            output_dir=temp_dir,
+            burst_samples=4,
+            burst_interval=0.5,
+        )
+        assert monitor.burst_interval == 0.25
+
+        with pytest.raises(ValueError, match="burst_samples"):
+            PerformanceMonitor(output_dir=temp_dir, burst_samples=0)
+
+    def test_system_metrics_use_functions_bound_at_init(self, temp_dir, mock_psutil):
+        """psutil functions are resolved once, not looked up on every sample."""
+        monitor = PerformanceMonitor(output_dir=temp_dir)
+        bound = mock_psutil.virtual_memory
+        mock_psutil.virtual_memory = MagicMock(side_effect=AssertionError)
+        del mock_psutil.net_io_counters
+
+        metrics = monitor._collect_system_metrics()
+
+        bound.assert_called_once_with()
+        assert metrics["system_memory_percent"] == 50.0
+        assert metrics["system_network_bytes_sent"] == 10000
+
+        monitor = PerformanceMonitor(output_dir=temp_dir)
+        assert "system_network_bytes_sent" not in monitor._collect_system_metrics()
+
+    def test_process_metrics_use_oneshot(self, temp_dir, mock_psutil):
+        """Per-process accessors are batched inside a single oneshot() block."""
+        monitor = PerformanceMonitor(output_dir=temp_dir)
+        monitor._process = mock_psutil.Process.return_value
+
+        metrics = monitor._collect_process_metrics()
+
+        assert metrics["process_memory_rss"] == 100 * 1024**2
+        monitor._process.oneshot.assert_called_once_with()
+        monitor._process.oneshot.return_value.__enter__.assert_called_once()
+
     def test_process_not_found(self, temp_dir, mock_psutil):
         """Test handling of non-existent process."""
         # Mock NoSuchProcess exception
@@ -233,6 +524,11 @@ class TestPerformanceMonitor:
         p90 = monitor._percentile(values, 0.9)
         assert p90 == 4.6  # Interpolated value
 
+        # Edge ranks need no neighbour to interpolate with
+        assert monitor._percentile(values, 1.0) == 5.0
+        assert monitor._percentile(values, 0.0) == 1.0
+        assert monitor._percentile([7], 0.9) == 7.0
+
         # Test stats calculation
         stats = monitor._calculate_stats(values)
         assert stats["min"] == 1.0
@@ -268,7 +564,8 @@ class TestPerformanceMonitor:
         # Collect some samples
         sample1 = monitor._collect_sample()
         sample2 = monitor._collect_sample()
-        monitor._samples = [sample1, sample2]
+        monitor._append_sample(sample1)
+        monitor._append_sample(sample2)
 
         # Write CSV
         monitor._write_metrics_csv()
@@ -280,6 +577,128 @@ class TestPerformanceMonitor:
             assert "timestamp" in content
             assert "system_cpu_percent" in content
 
+    def test_fixed_schema_rows(self, temp_dir, mock_psutil):
+        """Samples become rows in the first sample's order; new keys widen it."""
+        monitor = PerformanceMonitor(output_dir=temp_dir)
+        monitor._append_sample({"timestamp": 1.0, "cpu": 10.0})
+        monitor._append_sample({"cpu": 20.0, "timestamp": 2.0})
+        monitor._append_sample({"timestamp": 3.0, "cpu": 30.0, "rss": 5})
+        monitor._append_sample({"timestamp": 4.0})
+
+        assert monitor._fields == ("timestamp", "cpu", "rss")
+
+        summary = monitor._generate_summary()
+        assert summary["samples"]["count"] == 4
+        assert summary["samples"]["first_timestamp"] == 1.0
+        assert summary["samples"]["last_timestamp"] == 4.0
+        assert summary["metrics"]["cpu"]["count"] == 3
+        assert summary["metrics"]["rss"]["count"] == 1
+
+        monitor._write_metrics_csv()
+        lines = monitor.metrics_csv_path.read_text().splitlines()
+        assert lines == [
+            "timestamp,cpu,rss",
+            "1.0,10.0,",
+            "2.0,20.0,",
+            "3.0,30.0,5",
+            "4.0,,",
+        ]
+
+    def test_numeric_fields_follow_schema(self, temp_dir, mock_psutil):
+        """Metric columns are classified once per schema, in column order."""
+        monitor = PerformanceMonitor(output_dir=temp_dir)
+        monitor._append_sample(
+            {
+                "timestamp": 1.0,
+                "label": "rp",
+                "rss": 5,
+                "system_disk_read_bytes": 100,
+                "cpu": None,
+            }
+        )
+        monitor._append_sample({"timestamp": 2.0, "cpu": 1.0, "rss": 6, "io": 2})
+
+        assert monitor._metric_fields == ("label", "rss", "cpu", "io")
+        assert monitor._counter_fields == ("system_disk_read_bytes",)
+        assert monitor._get_numeric_fields() == ("rss", "cpu", "io")
+        monitor._write_metrics_csv()
+
+    def test_csv_streams_during_monitoring(self, temp_dir, mock_psutil):
+        """Rows reach disk every CSV_FLUSH_EVERY samples, before stop."""
+        monitor = PerformanceMonitor(output_dir=temp_dir)
+        for i in range(CSV_FLUSH_EVERY):
+            monitor._append_sample({"timestamp": float(i), "cpu": 1.0})
+
+        lines = monitor.metrics_csv_path.read_text().splitlines()
+        assert len(lines) == CSV_FLUSH_EVERY + 1
+
+        monitor._append_sample({"timestamp": 99.0, "cpu": 1.0})
+        monitor._write_metrics_csv()
+        assert monitor._csv_file is None
+        lines = monitor.metrics_csv_path.read_text().splitlines()
+        assert lines[-1] == "99.0,1.0"
+
+    def test_online_stat_matches_exact_statistics(self):
+        """Welford running stats agree with the exact two-pass values."""
+        values = [3.5, 1.0, 7.25, 2.0, 9.0, 4.0]
+        stat = OnlineStat()
+        for value in values:
+            stat.update(value)
+
+        assert stat.n == 6
+        assert stat.min == 1.0
+        assert stat.max == 9.0
+        assert stat.mean == pytest.approx(statistics.fmean(values))
+        assert stat.variance == pytest.approx(statistics.variance(values))
+        assert stat.values == values
+        assert stat.estimators is None
+
+    def test_online_stat_switches_to_p2(self):
+        """Past the exact limit the buffer is dropped for P² estimators."""
+        stat = OnlineStat(exact_limit=16)
+        for value in range(1000):
+            stat.update(value)
+
+        assert stat.n == 1000
+        assert stat.values is None
+        assert len(stat.estimators) == 3
+        assert stat.mean == pytest.approx(499.5)
+
+    def test_p2_quantile_accuracy(self):
+        """P² estimates track the exact quantiles of a long shuffled stream."""
+        rng = random.Random(42)
+        values = [rng.gauss(50.0, 10.0) for _ in range(20000)]
+        seed = sorted(values[:100])
+        estimators = {p: P2Quantile(p, seed) for p in (0.5, 0.9, 0.95)}
+        for value in values[100:]:
+            for estimator in estimators.values():
+                estimator.update(value)
+
+        ordered = sorted(values)
+        for p, estimator in estimators.items():
+            exact = ordered[int(p * (len(ordered) - 1))]
+            assert estimator.value() == pytest.approx(exact, abs=0.5)
+            assert estimator.count == len(values)
+
+    def test_summary_uses_running_stats(self, temp_dir, mock_psutil):
+        """Summary percentiles match the exact values for short runs."""
+        monitor = PerformanceMonitor(output_dir=temp_dir)
+        for i, cpu in enumerate([1, 2, 3, 4, 5]):
+            monitor._append_sample({"timestamp": float(i), "cpu": cpu})
+
+        summary = monitor._generate_summary()
+        assert summary["metrics"]["cpu"] == monitor._calculate_stats([1, 2, 3, 4, 5])
+        assert summary["metrics"]["cpu"]["p90"] == 4.6
+
+    def test_exact_percentiles_interpolate(self, temp_dir, mock_psutil):
+        """Exact percentiles interpolate linearly between sorted values."""
+        monitor = PerformanceMonitor(output_dir=temp_dir)
+        values = [7.5, 1.0, 3.25, 9.0, 2.0, 4.5, 6.0]
+
+        assert monitor._exact_percentiles(values) == pytest.approx(
+            {"p50": 4.5, "p90": 8.1, "p95": 8.55}
+        )
+
     def test_json_output_format(self, temp_dir, mock_psutil):
         """Test JSON summary output format."""
         monitor = PerformanceMonitor(output_dir=temp_dir)
@@ -300,6 +719,27 @@ class TestPerformanceMonitor:
             assert loaded["timing"]["duration_seconds"] == 2.0
             assert loaded["samples"]["count"] == 4
 
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_json_output_backends_agree(self, temp_dir, mock_psutil, use_orjson):
+        """orjson and stdlib json write the same indented document."""
+        if use_orjson:
+            pytest.importorskip("orjson")
+        monitor = PerformanceMonitor(output_dir=temp_dir)
+        summary = {
+            "timing": {"start_time": 1.5, "end_time": None},
+            "metrics": {"cpu": {"mean": 12.25, "count": 3}},
+            "monitoring_config": {"output_dir": temp_dir},
+        }
+
+        with patch("eddypro_batch_processor.monitor.ORJSON_AVAILABLE", use_orjson):
+            monitor._write_summary_json(summary)
+
+        text = monitor.summary_json_path.read_text(encoding="utf-8")
+        assert text.startswith('{\n  "timing"')
+        loaded = json.loads(text)
+        assert loaded["metrics"]["cpu"] == {"mean": 12.25, "count": 3}
+        assert loaded["monitoring_config"]["output_dir"] == str(temp_dir)
+
 
 class TestMonitoredOperation:
     """Test cases for the MonitoredOperation context manager."""
@@ -450,7 +890,7 @@ class TestErrorHandling:
 
         # Add a sample
         sample = {"timestamp": 1000.0, "system_cpu_percent": 50.0}
-        monitor._samples = [sample]
+        monitor._append_sample(sample)
 
         # Make directory read-only to cause write errors
         temp_dir.chmod(0o444)
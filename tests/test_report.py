@@ -1,10 +1,14 @@
 """Tests for the report module."""
 
+import gzip
+import hashlib
 import json
 from datetime import datetime
 from pathlib import Path
 
+import pandas as pd
 import pytest
+import yaml
 
 from eddypro_batch_processor import report
 
@@ -18,11 +22,87 @@ def test_compute_file_checksum(tmp_path):
     assert isinstance(checksum, str)
     assert len(checksum) == 64  # SHA256 produces 64-character hex string
 
+    assert checksum == hashlib.sha256(b"Hello, World!").hexdigest()
+
     # Test with non-existent file
     with pytest.raises(FileNotFoundError):
         report.compute_file_checksum(tmp_path / "nonexistent.txt")
 
 
+@pytest.mark.parametrize("mmap_limit", [0, 1 << 30])
+def test_compute_file_checksum_fallback(tmp_path, monkeypatch, mmap_limit):
+    """Without hashlib.file_digest the file is memory-mapped or read in chunks."""
+    test_file = tmp_path / "test.bin"
+    data = bytes(range(256)) * 5000
+    test_file.write_bytes(data)
+    empty_file = tmp_path / "empty.bin"
+    empty_file.write_bytes(b"")
+    monkeypatch.delattr(hashlib, "file_digest", raising=False)
+    monkeypatch.setattr(report, "_CHECKSUM_CHUNK_SIZE", 4096)
+    monkeypatch.setattr(report, "_CHECKSUM_MMAP_LIMIT", mmap_limit)
+
+    checksum = report.compute_file_checksum(test_file, "blake2b")
+
+    assert checksum == hashlib.blake2b(data).hexdigest()
+    assert report.compute_file_checksum(empty_file) == hashlib.sha256().hexdigest()
+
+
+def test_compute_bytes_checksum(tmp_path):
+    """In-memory data hashes the same as the file holding it."""
+    test_file = tmp_path / "config.yaml"
+    test_file.write_bytes(b"site_id: GL-ZaF\n")
+
+    assert report.compute_bytes_checksum(b"site_id: GL-ZaF\n") == (
+        report.compute_file_checksum(test_file)
+    )
+    assert (
+        report.compute_bytes_checksum(memoryview(b"abc"), "blake2b")
+        == hashlib.blake2b(b"abc").hexdigest()
+    )
+
+
+def test_compute_config_checksum():
+    """Config checksums are canonical and name their algorithm."""
+    config = {"site_id": "GL-ZaF", "years_to_process": [2021, 2022]}
+    reordered = {"years_to_process": [2021, 2022], "site_id": "GL-ZaF"}
+
+    checksum = report.compute_config_checksum(config)
+
+    assert checksum == report.compute_config_checksum(reordered)
+    assert checksum != report.compute_config_checksum({"site_id": "GL-ZaF"})
+    assert checksum.split(":")[0] == (
+        "blake3" if report.BLAKE3_AVAILABLE else "blake2b"
+    )
+    canonical = b'{"site_id":"GL-ZaF","years_to_process":[2021,2022]}'
+    assert report.compute_config_checksum(config, "sha256") == (
+        "sha256:" + hashlib.sha256(canonical).hexdigest()
+    )
+
+
+def test_compute_config_checksum_matches_one_shot_encoding():
+    """Streaming the encoder chunks hashes the same canonical document."""
+    config = {
+        "site_id": "GL-ZaF",
+        "reports_dir": Path("/reports"),
+        "nested": {"b": [1, 2.5, None, True], "a": "ø"},
+    }
+    canonical = json.dumps(config, sort_keys=True, separators=(",", ":"), default=str)
+
+    checksum = report.compute_config_checksum(config, "sha256")
+
+    assert checksum == "sha256:" + hashlib.sha256(canonical.encode()).hexdigest()
+
+
+def test_compute_config_checksum_blake2b_fallback(monkeypatch):
+    """Without the blake3 package the checksum uses 256-bit BLAKE2b."""
+    monkeypatch.setattr(report, "BLAKE3_AVAILABLE", False)
+
+    checksum = report.compute_config_checksum({"site_id": "GL-ZaF"})
+
+    expected = hashlib.blake2b(b'{"site_id":"GL-ZaF"}', digest_size=32).hexdigest()
+    assert checksum == f"blake2b:{expected}"
+
+
 def test_collect_eddypro_output_files(tmp_path):
     """Test EddyPro output file collection."""
     site_id = "GL-ZaF"
@@ -95,6 +175,23 @@ def test_get_python_environment_info():
     assert "plotly" in pkg_versions
 
 
+def test_get_python_environment_info_is_cached(monkeypatch):
+    """Environment info is gathered once; callers get independent copies."""
+    calls = []
+    monkeypatch.setattr(report.platform, "processor", lambda: calls.append(1) or "cpu")
+    report._environment_info.cache_clear()
+    try:
+        first = report.get_python_environment_info()
+        first["package_versions"]["PyYAML"] = "changed"
+        second = report.get_python_environment_info()
+    finally:
+        report._environment_info.cache_clear()
+
+    assert calls == [1]
+    assert second["processor"] == "cpu"
+    assert second["package_versions"]["PyYAML"] != "changed"
+
+
 def test_generate_scenario_manifest():
     """Test scenario manifest generation."""
     start_time = datetime(2025, 10, 1, 10, 0, 0)
@@ -118,6 +215,33 @@ def test_generate_scenario_manifest():
     assert "metrics_summary" in manifest
 
 
+def test_manifest_duration_prefers_monotonic_clock():
+    """Monotonic readings override the wall-clock difference when both given."""
+    start_time = datetime(2025, 10, 1, 10, 0, 0)
+    end_time = datetime(2025, 10, 1, 10, 30, 0)
+
+    manifest = report.generate_scenario_manifest(
+        scenario_name="test_scenario",
+        scenario_params={},
+        project_file=Path("/path/to/project.eddypro"),
+        output_dir=Path("/path/to/output"),
+        start_time=start_time,
+        end_time=end_time,
+        success=True,
+        start_monotonic_ns=5_000_000_000,
+        end_monotonic_ns=6_250_000_000,
+    )
+
+    assert manifest["duration_seconds"] == 1.25
+    assert manifest["start_time"] == start_time.isoformat()
+    assert manifest["end_time"] == end_time.isoformat()
+    # A missing reading falls back to the wall-clock difference
+    assert (
+        report.compute_duration_seconds(start_time, end_time, 5_000_000_000, None)
+        == 1800.0
+    )
+
+
 def test_write_scenario_manifest(tmp_path):
     """Test writing scenario manifest to file."""
     manifest = {
@@ -225,6 +349,79 @@ def test_write_run_manifest(tmp_path):
     assert loaded["run_id"] == "test_run"
 
 
+@pytest.mark.parametrize("include_snapshot", [True, False])
+def test_run_manifest_config_sidecar(tmp_path, include_snapshot):
+    """The config is embedded on request, otherwise written as a YAML sidecar."""
+    config = {"site_id": "GL-ZaF", "years_to_process": [2021]}
+    manifest = report.generate_run_manifest(
+        run_id="test_run_003",
+        config=config,
+        config_checksum="abc123",
+        site_id="GL-ZaF",
+        years_processed=[2021],
+        scenarios=[],
+        start_time=datetime(2025, 10, 1, 10, 0, 0),
+        end_time=datetime(2025, 10, 1, 11, 0, 0),
+        overall_success=True,
+        output_dirs=[],
+        include_config_snapshot=include_snapshot,
+    )
+    output_path = tmp_path / "run_manifest.json"
+
+    report.write_run_manifest(manifest, output_path, config)
+
+    loaded = json.loads(output_path.read_text(encoding="utf-8"))
+    assert loaded["config_checksum"] == "abc123"
+    sidecar = tmp_path / "test_run_003_config.yaml"
+    if include_snapshot:
+        assert loaded["config_snapshot"] == config
+        assert "config_ref" not in loaded
+        assert not sidecar.exists()
+    else:
+        assert "config_snapshot" not in loaded
+        assert loaded["config_ref"] == sidecar.name
+        assert yaml.safe_load(sidecar.read_text(encoding="utf-8")) == config
+
+
+def test_write_run_manifest_replaces_file_atomically(tmp_path, monkeypatch):
+    """A failed write keeps the previous manifest and leaves no temp file."""
+    output_path = tmp_path / "run_manifest.json"
+    report.write_run_manifest({"run_id": "first"}, output_path)
+
+    def fail_replace(self, target):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(Path, "replace", fail_replace)
+    report.write_run_manifest({"run_id": "second"}, output_path)
+
+    assert json.loads(output_path.read_text(encoding="utf-8")) == {"run_id": "first"}
+    assert list(tmp_path.iterdir()) == [output_path]
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_manifest_json_backends_agree(tmp_path, monkeypatch, use_orjson):
+    """orjson and the stdlib fallback write the same manifest content."""
+    if use_orjson and not report.ORJSON_AVAILABLE:
+        pytest.skip("orjson not installed")
+    monkeypatch.setattr(report, "ORJSON_AVAILABLE", use_orjson)
+    manifest = {
+        "run_id": "test_run",
+        "output_dir": Path("/data/out"),
+        "years": {2024: True},
+        "duration_seconds": 1.5,
+    }
+    output_path = tmp_path / "run_manifest.json"
+
+    report.write_run_manifest(manifest, output_path)
+
+    assert json.loads(output_path.read_text(encoding="utf-8")) == {
+        "run_id": "test_run",
+        "output_dir": str(Path("/data/out")),
+        "years": {"2024": True},
+        "duration_seconds": 1.5,
+    }
+
+
 def test_load_metrics_from_csv(tmp_path):
     """Test loading metrics from CSV file."""
     metrics_csv = tmp_path / "metrics.csv"
@@ -241,6 +438,39 @@ def test_load_metrics_from_csv(tmp_path):
     assert metrics[1]["memory_mb"] == 518.7
 
 
+def test_load_metrics_frame(tmp_path):
+    """Chart columns are parsed in bulk; missing ones are zero-filled."""
+    metrics_csv = tmp_path / "metrics.csv"
+    metrics_csv.write_text(
+        "timestamp,cpu_percent,memory_mb\n"
+        "2025-10-01T10:00:00,25.5,512.3\n"
+        "2025-10-01T10:00:01,n/a,518.7\n"
+    )
+
+    frame = report.load_metrics_frame(metrics_csv)
+
+    assert frame["cpu_percent"].iloc[0] == 25.5
+    assert frame["cpu_percent"].isna().iloc[1]
+    assert frame["write_mb"].tolist() == [0.0, 0.0]
+    assert report.load_metrics_frame(tmp_path / "missing.csv") is None
+    assert report.load_metrics_from_csv(tmp_path / "missing.csv") == []
+
+
+def test_load_metrics_frame_chart_only(tmp_path):
+    """Only the timestamp and chart columns are parsed for charts."""
+    metrics_csv = tmp_path / "metrics.csv"
+    metrics_csv.write_text(
+        "timestamp,cpu_percent,swap_mb,read_mb,net_sent_mb\n"
+        "2025-10-01T10:00:00,25.5,1.0,10.2,0.5\n"
+    )
+
+    frame = report.load_metrics_frame(metrics_csv, chart_only=True)
+
+    assert sorted(frame.columns) == sorted(["timestamp", *report._CHART_COLUMNS])
+    assert frame["read_mb"].tolist() == [10.2]
+    assert frame["memory_mb"].tolist() == [0.0]
+
+
 def test_generate_html_report():
     """Test HTML report generation."""
     run_manifest = {
@@ -274,6 +504,28 @@ def test_generate_html_report():
     assert "<!DOCTYPE html>" in html
 
 
+def test_generate_html_report_escapes_table_cells():
+    """Scenario and package table cells are HTML-escaped."""
+    run_manifest = {
+        "scenarios": [
+            {
+                "scenario_name": "<b>rot1</b>",
+                "scenario_params": {"note": "a&b"},
+                "duration_seconds": 1.0,
+                "success": False,
+            }
+        ],
+        "environment": {"package_versions": {"pkg": "<1.0>"}},
+    }
+
+    html = report.generate_html_report(run_manifest, chart_engine="none")
+
+    assert "<td>&lt;b&gt;rot1&lt;/b&gt;</td>" in html
+    assert "<td>note=a&amp;b</td>" in html
+    assert '<td class="failure">FAILURE</td>' in html
+    assert "<td>&lt;1.0&gt;</td>" in html
+
+
 def test_generate_html_report_with_file_output(tmp_path):
     """Test HTML report generation with file output."""
     run_manifest = {
@@ -294,6 +546,44 @@ def test_generate_html_report_with_file_output(tmp_path):
 
     assert output_path.exists()
     assert "test_run" in html
+    assert output_path.read_text(encoding="utf-8") == html
+
+    # Streaming only to the file skips building the string
+    assert (
+        report.generate_html_report(
+            run_manifest,
+            chart_engine="none",
+            output_path=output_path,
+            return_html=False,
+        )
+        is None
+    )
+    assert output_path.read_text(encoding="utf-8") == html
+
+
+def test_generate_html_report_gzip_copy(tmp_path):
+    """HTML reports get a deterministic gzip copy unless disabled."""
+    run_manifest = {"run_id": "test_run", "scenarios": []}
+    output_path = tmp_path / "report.html"
+    gz_path = tmp_path / "report.html.gz"
+
+    report.generate_html_report(
+        run_manifest, chart_engine="none", output_path=output_path
+    )
+    first = gz_path.read_bytes()
+    assert gzip.decompress(first) == output_path.read_bytes()
+
+    report.generate_html_report(
+        run_manifest, chart_engine="none", output_path=output_path
+    )
+    assert gz_path.read_bytes() == first
+
+    gz_path.unlink()
+    report.generate_html_report(
+        run_manifest, chart_engine="none", output_path=output_path, gzip_copy=False
+    )
+    assert output_path.exists()
+    assert not gz_path.exists()
 
 
 def test_create_reports_directory(tmp_path):
@@ -335,6 +625,76 @@ def test_generate_plotly_charts():
     else:
         assert result is None
 
+    # A DataFrame renders the same chart from its columns
+    frame_result = report.generate_plotly_charts(
+        pd.DataFrame(metrics), scenario_name="test"
+    )
+    assert (frame_result is None) is (result is None)
+
     # Test with empty metrics
     result = report.generate_plotly_charts([], scenario_name="test")
     assert result is None
+    assert report.generate_plotly_charts(pd.DataFrame(), "test") is None
+
+
+@pytest.mark.skipif(not report.PLOTLY_AVAILABLE, reason="plotly not installed")
+def test_generate_plotly_charts_reuses_rendered_html(monkeypatch):
+    """Identical series and scenario names are rendered only once."""
+    monkeypatch.setattr(report, "_PLOTLY_HTML_CACHE", {})
+    metrics = [
+        {"timestamp": 0, "cpu_percent": 25.0, "memory_mb": 512.0},
+        {"timestamp": 1, "cpu_percent": 30.0, "memory_mb": 520.0},
+    ]
+
+    first = report.generate_plotly_charts(metrics, "baseline")
+    # Plotly assigns a fresh div id per render, so equal strings mean a hit
+    assert report.generate_plotly_charts(list(metrics), "baseline") == first
+    assert report.generate_plotly_charts(metrics, "rot1") != first
+    changed = [dict(metrics[0], cpu_percent=99.0), metrics[1]]
+    assert report.generate_plotly_charts(changed, "baseline") != first
+    assert len(report._PLOTLY_HTML_CACHE) == 3
+
+
+@pytest.mark.skipif(not report.PLOTLY_AVAILABLE, reason="plotly not installed")
+def test_render_scenario_charts_uses_cache(monkeypatch):
+    """Scenario charts come back in order and repeat renders hit the cache."""
+    report._PLOTLY_HTML_CACHE.clear()
+    names = ["baseline", "rot1", "rot3", "tlag2"]
+    scenario_metrics = {
+        name: [{"timestamp": 0, "cpu_percent": float(i)}, {"timestamp": 1}]
+        for i, name in enumerate(names)
+    }
+
+    charts = report._render_scenario_charts(scenario_metrics)
+
+    assert list(charts) == names
+    for name, chart_html in charts.items():
+        assert chart_html is not None
+        assert f"Performance Metrics: {name}" in chart_html
+        assert "cdn.plot.ly" not in chart_html
+
+    def fail_render(*args, **kwargs):
+        raise AssertionError("chart was rendered again")
+
+    monkeypatch.setattr(report, "_render_plotly_html", fail_render)
+    assert report._render_scenario_charts(scenario_metrics) == charts
+
+
+@pytest.mark.skipif(not report.PLOTLY_AVAILABLE, reason="plotly not installed")
+def test_html_report_loads_plotlyjs_once():
+    """Scenario charts use WebGL traces and share a single plotly.js tag."""
+    metrics = [
+        {"timestamp": 0, "cpu_percent": 25.0, "memory_mb": 512.0},
+        {"timestamp": 1, "cpu_percent": 30.0, "memory_mb": 520.0},
+    ]
+    run_manifest = {"run_id": "test_run", "scenarios": []}
+
+    html = report.generate_html_report(
+        run_manifest,
+        scenario_metrics={"baseline": metrics, "rot1": metrics},
+        chart_engine="plotly",
+    )
+
+    assert html is not None
+    assert html.count("cdn.plot.ly") == 1
+    assert html.index(report.plotly_script_tag()) < html.index('"scattergl"')
@@ -6,8 +6,9 @@ Tests scenario generation, Cartesian product, naming, and cap enforcement.
 """
 
 import unittest
+from unittest import mock
 
-from src.eddypro_batch_processor import scenarios
+from eddypro_batch_processor import scenarios
 
 
 class TestScenarioSuffixGeneration(unittest.TestCase):
@@ -97,6 +98,19 @@ class TestScenarioGeneration(unittest.TestCase):
         self.assertEqual(scenario_list[1].suffix, "_rot3")
         self.assertEqual(scenario_list[1].index, 2)
 
+    def test_single_parameter_skips_product(self):
+        """Test that a single-parameter sweep does not build a Cartesian product."""
+        with mock.patch.object(
+            scenarios.itertools, "product", side_effect=AssertionError
+        ):
+            scenario_list = scenarios.generate_scenarios({"tlag_meth": [0, 2, 4]})
+
+        self.assertEqual(
+            [s.parameters for s in scenario_list],
+            [{"tlag_meth": 0}, {"tlag_meth": 2}, {"tlag_meth": 4}],
+        )
+        self.assertEqual([s.index for s in scenario_list], [1, 2, 3])
+
     def test_multiple_parameters_cartesian_product(self):
         """Test Cartesian product with multiple parameters."""
         opts = {"rot_meth": [1, 3], "tlag_meth": [2, 4]}
@@ -275,6 +289,16 @@ class TestScenarioDataclass(unittest.TestCase):
         with self.assertRaises(AttributeError):
             scenario.index = 2  # type: ignore[misc]
 
+    def test_scenario_uses_slots(self):
+        """Test that Scenario instances carry no per-instance __dict__."""
+        scenario = scenarios.Scenario(
+            parameters={"rot_meth": 1},
+            suffix="_rot1",
+            index=1,
+        )
+
+        self.assertFalse(hasattr(scenario, "__dict__"))
+
     def test_scenario_invalid_empty_parameters(self):
         """Test that empty parameters raises error."""
         with self.assertRaises(ValueError):
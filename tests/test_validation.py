@@ -6,11 +6,12 @@ Covers configuration validation, path checks, ECMD schema and sanity checks.
 
 import csv
 import tempfile
+import threading
 from pathlib import Path
 
 import pytest
 
-from src.eddypro_batch_processor import validation
+from eddypro_batch_processor import validation
 
 
 class TestValidationError:
@@ -135,6 +136,18 @@ class TestValidateConfigStructure:
         errors = validation.validate_config_structure(config)
         assert any("'log_level' must be one of" in err for err in errors)
 
+    def test_missing_keys_reported_in_declaration_order(self):
+        """Test that missing keys are listed in a stable, documented order."""
+        config = {"site_id": "GL-ZaF", "report_charts": ["plotly"]}
+        errors = validation.validate_config_structure(config)
+        assert errors[0].startswith(
+            "Missing required configuration keys: eddypro_executable, "
+            "years_to_process, input_dir_pattern"
+        )
+        assert errors[0].endswith("metrics_interval_seconds, reports_dir")
+        # Unhashable values must be rejected rather than raise TypeError
+        assert "'report_charts' must be one of [plotly, svg, none]" in errors[1]
+
 
 class TestValidatePaths:
     """Test path validation."""
@@ -166,6 +179,18 @@ class TestValidatePaths:
         assert any("'{site_id}' placeholder" in err for err in errors)
         assert any("'{year}' placeholder" in err for err in errors)
 
+    def test_output_pattern_missing_year_placeholder(self):
+        """Test that each missing placeholder is reported once per pattern."""
+        config = {
+            "eddypro_executable": __file__,
+            "input_dir_pattern": "/input/{site_id}/{year}",
+            "output_dir_pattern": "/output/{site_id}/{years}",
+        }
+        errors = validation.validate_paths(config, skip_ecmd=True)
+        assert errors == [
+            "Invalid 'output_dir_pattern': must contain '{year}' placeholder"
+        ]
+
     def test_skip_ecmd_validation(self):
         """Test that ECMD validation can be skipped."""
         config = {
@@ -180,6 +205,29 @@ class TestValidatePaths:
         # Should not complain about ECMD file when skip_ecmd=True
         assert not any("ECMD file not found" in err for err in errors)
 
+    def test_custom_exists_check(self):
+        """Test that validate_paths routes every check through ``exists``."""
+        config = {
+            "eddypro_executable": "/opt/eddypro/eddypro_rp",
+            "site_id": "GL-ZaF",
+            "years_to_process": [2021],
+            "input_dir_pattern": "/input/{site_id}/{year}",
+            "output_dir_pattern": "/output/{site_id}/{year}",
+            "ecmd_file": "/path/to/{site_id}_ecmd.csv",
+        }
+        checked = []
+
+        def exists(path):
+            checked.append(path)
+            return True
+
+        assert validation.validate_paths(config, exists=exists) == []
+        assert checked == [
+            Path("/opt/eddypro/eddypro_rp"),
+            Path("/input/GL-ZaF/2021"),
+            Path("/path/to/GL-ZaF_ecmd.csv"),
+        ]
+
 
 class TestValidateECMDSchema:
     """Test ECMD file schema validation."""
@@ -459,6 +507,110 @@ class TestValidateECMDSanity:
             temp_path.unlink()
 
 
+class TestValidateECMD:
+    """Test the single-pass ECMD validation."""
+
+    def test_fused_results_match_separate_checks(self, tmp_path):
+        """Test that validate_ecmd returns the schema and sanity errors."""
+        ecmd_path = tmp_path / "ecmd.csv"
+        ecmd_path.write_text(
+            "FILE_DURATION,ACQUISITION_FREQUENCY,CANOPY_HEIGHT,SA_HEIGHT\n"
+            "30,10,0.1,3.0\n"
+            "\n"
+            "30,abc,-1,0\n",
+            encoding="utf-8",
+        )
+
+        schema_errors, sanity_errors = validation.validate_ecmd(ecmd_path)
+
+        assert schema_errors == validation.validate_ecmd_schema(ecmd_path)
+        assert sanity_errors == validation.validate_ecmd_sanity(ecmd_path)
+        assert any("missing required columns" in err for err in schema_errors)
+        # The blank line is skipped without advancing the row number
+        assert sanity_errors == [
+            "Row 3: ACQUISITION_FREQUENCY is not a valid number: 'abc'",
+            "Row 3: CANOPY_HEIGHT must be non-negative, got -1.0",
+            "Row 3: SA_HEIGHT must be positive, got 0.0",
+        ]
+
+    def test_opens_file_once(self, tmp_path, monkeypatch):
+        """Test that schema and sanity checks share one read of the file."""
+        ecmd_path = tmp_path / "ecmd.csv"
+        ecmd_path.write_text("FILE_DURATION,GA_PATH\n30,open\n", encoding="utf-8")
+        opened = []
+        original_open = Path.open
+
+        def counting_open(self, *args, **kwargs):
+            opened.append(self)
+            return original_open(self, *args, **kwargs)
+
+        monkeypatch.setattr(Path, "open", counting_open)
+
+        validation.validate_ecmd(ecmd_path)
+
+        assert opened == [ecmd_path]
+
+    def test_short_first_row_with_ga_path(self, tmp_path):
+        """Test that a first row missing its GA_PATH cell is not an error."""
+        ecmd_path = tmp_path / "ecmd.csv"
+        ecmd_path.write_text("FILE_DURATION,GA_PATH\n30\n", encoding="utf-8")
+
+        schema_errors, _ = validation.validate_ecmd(ecmd_path)
+
+        assert not any("Error reading" in err for err in schema_errors)
+
+    def test_max_rows_limits_value_checks(self, tmp_path):
+        """Test that only the first max_rows data rows are value checked."""
+        ecmd_path = tmp_path / "ecmd.csv"
+        ecmd_path.write_text(
+            "FILE_DURATION,ACQUISITION_FREQUENCY,SA_HEIGHT\n"
+            "30,10,3\n"
+            "\n"
+            "0,10,3\n"
+            "30,-1,3\n",
+            encoding="utf-8",
+        )
+
+        _, all_rows = validation.validate_ecmd(ecmd_path)
+        _, sampled = validation.validate_ecmd(ecmd_path, max_rows=2)
+
+        assert len(all_rows) == 2
+        assert sampled == ["Row 3: FILE_DURATION must be positive, got 0.0"]
+        assert validation.validate_ecmd_sanity(ecmd_path, max_rows=0) == []
+
+    def test_missing_columns_reported_in_declaration_order(self, tmp_path):
+        """Test that missing columns keep the documented order, not set order."""
+        ecmd_path = tmp_path / "ecmd.csv"
+        ecmd_path.write_text(
+            "GA_VERTICAL_SEPARATION,FILE_DURATION,GA_PATH\n30,30,closed\n",
+            encoding="utf-8",
+        )
+
+        schema_errors, _ = validation.validate_ecmd(ecmd_path, check_values=False)
+
+        assert schema_errors[0].startswith(
+            "ECMD file missing required columns: DATE_OF_VARIATION_EF, "
+            "ACQUISITION_FREQUENCY, CANOPY_HEIGHT,"
+        )
+        assert "GA_EASTWARD_SEPARATION\n" in schema_errors[0]
+        assert schema_errors[1].startswith(
+            "ECMD file has GA_PATH='closed' but missing columns: "
+            "GA_TUBE_LENGTH, GA_TUBE_DIAMETER, GA_FLOWRATE\n"
+        )
+
+    def test_assume_exists_reports_missing_file_as_read_error(self, tmp_path):
+        """Test that a file removed after the caller's check is still reported."""
+        ecmd_path = tmp_path / "missing.csv"
+
+        schema_errors, sanity_errors = validation.validate_ecmd(
+            ecmd_path, assume_exists=True
+        )
+
+        assert len(schema_errors) == 1
+        assert schema_errors[0].startswith(f"Error reading ECMD file {ecmd_path}")
+        assert sanity_errors == schema_errors
+
+
 class TestValidateConfigSanity:
     """Test configuration sanity checks."""
 
@@ -543,6 +695,186 @@ class TestValidateAll:
         assert "ecmd_schema" in results
         assert "ecmd_sanity" in results
 
+    def test_validate_all_stats_each_path_once(self, tmp_path, monkeypatch):
+        """Test that validate_all shares existence checks with validate_paths."""
+        config = {
+            "eddypro_executable": __file__,
+            "site_id": "GL-ZaF",
+            "years_to_process": [2021],
+            "input_dir_pattern": str(tmp_path / "{site_id}" / "{year}"),
+            "output_dir_pattern": str(tmp_path / "out" / "{site_id}" / "{year}"),
+            "ecmd_file": str(tmp_path / "{site_id}_ecmd.csv"),
+        }
+        checked = []
+        original_exists = Path.exists
+
+        def counting_exists(self, *args, **kwargs):
+            checked.append(self)
+            return original_exists(self, *args, **kwargs)
+
+        monkeypatch.setattr(Path, "exists", counting_exists)
+        results = validation.validate_all(config)
+
+        ecmd_path = tmp_path / "GL-ZaF_ecmd.csv"
+        assert checked.count(ecmd_path) == 1
+        assert any("ECMD file not found" in err for err in results["paths"])
+        assert results["ecmd_schema"] == [f"ECMD file not found: {ecmd_path}"]
+
+    def test_validate_all_stats_existing_ecmd_once(self, tmp_path, monkeypatch):
+        """Test that an existing ECMD file is not re-checked before reading."""
+        ecmd_path = tmp_path / "ecmd.csv"
+        ecmd_path.write_text("FILE_DURATION\n30\n", encoding="utf-8")
+        config = {"eddypro_executable": __file__, "ecmd_file": str(ecmd_path)}
+        checked = []
+        original_exists = Path.exists
+
+        def counting_exists(self, *args, **kwargs):
+            checked.append(self)
+            return original_exists(self, *args, **kwargs)
+
+        monkeypatch.setattr(Path, "exists", counting_exists)
+        results = validation.validate_all(config)
+
+        assert checked.count(ecmd_path) == 1
+        assert any("missing required columns" in err for err in results["ecmd_schema"])
+
+    def test_validate_all_reads_ecmd_alongside_path_checks(self, tmp_path, monkeypatch):
+        """Test that the ECMD file is validated on a worker thread."""
+        ecmd_path = tmp_path / "ecmd.csv"
+        ecmd_path.write_text("FILE_DURATION\n30\n", encoding="utf-8")
+        config = {"eddypro_executable": __file__, "ecmd_file": str(ecmd_path)}
+        threads = {}
+        original_validate_ecmd = validation.validate_ecmd
+        original_validate_paths = validation.validate_paths
+
+        def recording_validate_ecmd(*args, **kwargs):
+            threads["ecmd"] = threading.get_ident()
+            return original_validate_ecmd(*args, **kwargs)
+
+        def recording_validate_paths(*args, **kwargs):
+            threads["paths"] = threading.get_ident()
+            return original_validate_paths(*args, **kwargs)
+
+        monkeypatch.setattr(validation, "validate_ecmd", recording_validate_ecmd)
+        monkeypatch.setattr(validation, "validate_paths", recording_validate_paths)
+        results = validation.validate_all(config)
+
+        assert threads["paths"] == threading.get_ident()
+        assert threads["ecmd"] != threads["paths"]
+        assert list(results) == [
+            "config_structure",
+            "config_sanity",
+            "paths",
+            "ecmd_schema",
+            "ecmd_sanity",
+        ]
+        assert any("missing required columns" in err for err in results["ecmd_schema"])
+
+    @pytest.mark.parametrize(
+        ("skip_paths", "skip_ecmd", "ecmd_name"),
+        [
+            (False, True, "ecmd.csv"),
+            (False, False, "missing.csv"),
+            (True, False, "ecmd.csv"),
+        ],
+    )
+    def test_validate_all_no_thread_without_overlap(
+        self, tmp_path, monkeypatch, skip_paths, skip_ecmd, ecmd_name
+    ):
+        """Test that no worker thread is started when there is nothing to overlap."""
+        validation.clear_validation_cache()
+        (tmp_path / "ecmd.csv").write_text("FILE_DURATION\n30\n", encoding="utf-8")
+        config = {
+            "eddypro_executable": __file__,
+            "ecmd_file": str(tmp_path / ecmd_name),
+        }
+
+        def failing_executor(*args, **kwargs):
+            raise AssertionError("ThreadPoolExecutor should not be created")
+
+        monkeypatch.setattr(validation, "ThreadPoolExecutor", failing_executor)
+        results = validation.validate_all(
+            config, skip_paths=skip_paths, skip_ecmd=skip_ecmd
+        )
+
+        assert list(results) == [
+            "config_structure",
+            "config_sanity",
+            "paths",
+            "ecmd_schema",
+            "ecmd_sanity",
+        ]
+
+    def test_validate_all_reuses_cached_results(self, tmp_path, monkeypatch):
+        """Test that unchanged configs and files are not validated again."""
+        validation.clear_validation_cache()
+        ecmd_path = tmp_path / "ecmd.csv"
+        ecmd_path.write_text("FILE_DURATION\n30\n", encoding="utf-8")
+        config = {"eddypro_executable": __file__, "ecmd_file": str(ecmd_path)}
+        calls = []
+        original_validate_ecmd = validation.validate_ecmd
+
+        def counting_validate_ecmd(*args, **kwargs):
+            calls.append(args)
+            return original_validate_ecmd(*args, **kwargs)
+
+        monkeypatch.setattr(validation, "validate_ecmd", counting_validate_ecmd)
+
+        first = validation.validate_all(config)
+        first["ecmd_schema"].append("caller mutation")
+        second = validation.validate_all(dict(config))
+
+        assert len(calls) == 1
+        assert "caller mutation" not in second["ecmd_schema"]
+        assert second["ecmd_schema"] == first["ecmd_schema"][:-1]
+
+        # Changing the ECMD file invalidates the cached results
+        ecmd_path.write_text("FILE_DURATION\n30\n0\n", encoding="utf-8")
+        third = validation.validate_all(config)
+        assert len(calls) == 2
+        assert third["ecmd_sanity"] != second["ecmd_sanity"]
+
+        # So do different options and an explicit clear
+        validation.validate_all(config, skip_paths=True)
+        validation.clear_validation_cache()
+        validation.validate_all(config)
+        assert len(calls) == 4
+
+    def test_validate_all_cache_skips_unchecked_paths(self, tmp_path, monkeypatch):
+        """Test that the cache only stats paths the requested checks touch."""
+        validation.clear_validation_cache()
+        ecmd_path = tmp_path / "ecmd.csv"
+        ecmd_path.write_text("FILE_DURATION\n30\n", encoding="utf-8")
+        config = {"eddypro_executable": __file__, "ecmd_file": str(ecmd_path)}
+        stated = []
+        original_stat = Path.stat
+
+        def recording_stat(self, *args, **kwargs):
+            stated.append(self)
+            return original_stat(self, *args, **kwargs)
+
+        monkeypatch.setattr(Path, "stat", recording_stat)
+
+        validation.validate_all(config, skip_paths=True, skip_ecmd=True)
+        validation.validate_all(config, skip_paths=True, skip_ecmd=True)
+        assert stated == []
+
+        validation.validate_all(config, skip_ecmd=True)
+        assert ecmd_path not in stated
+
+    def test_validate_all_ecmd_sample(self, tmp_path):
+        """Test that validate_all passes the ECMD sample size through."""
+        ecmd_path = tmp_path / "ecmd.csv"
+        ecmd_path.write_text(
+            "FILE_DURATION,ACQUISITION_FREQUENCY,SA_HEIGHT\n30,10,3\n0,10,3\n",
+            encoding="utf-8",
+        )
+        config = {"eddypro_executable": __file__, "ecmd_file": str(ecmd_path)}
+
+        assert len(validation.validate_all(config)["ecmd_sanity"]) == 1
+        results = validation.validate_all(config, ecmd_sample=1)
+        assert results["ecmd_sanity"] == []
+
 
 class TestFormatValidationReport:
     """Test validation report formatting."""